@@ -0,0 +1,507 @@
+"""
+UniTrack Analytics Rollups
+Hourly and daily event counts per department and role for the admin reports
+
+Usage:
+    python analytics_rollup.py init --start 2026-08-01          one academic year from this date
+    python analytics_rollup.py ingest analytics-2026-10-19.jsonl
+    python analytics_rollup.py today                            the dashboard's "Today's Activity" chart
+    python analytics_rollup.py report --from 2026-08-01 --to 2027-06-01 --by month --role staff
+    python analytics_rollup.py bench --events 2000000
+    python analytics_rollup.py verify                           compare with a plain count
+
+Events are exported from the analytics collection as JSON lines, such as
+{"timestamp": 1760840000000, "department": "IT Department", "role": "student"}.
+The timestamp is epoch milliseconds or ISO 8601.
+
+The store is a directory of fixed-size NumPy memory-mapped arrays, indexed
+by [bucket, department, role], covering one academic year in campus time:
+- hourly.u32 and daily.u32: event counts
+- prefix.u64: running totals over the hours, up to the last hour with events
+
+Ingesting a batch adds its counts to the touched buckets, then recomputes
+the prefix rows from the batch's earliest hour up to the last hour with
+events. Rows past that hour are never written and read as the final
+total. Events arrive in time order, so a batch usually recomputes only
+the last few rows. Any range total is one subtraction of two prefix rows.
+A series is a difference along the prefix sampled at the bucket edges,
+so a report over the whole year reads a few hundred rows whatever the
+number of events.
+
+Batches are recorded by content hash in batches.log, and ingesting one
+twice is a no-op. A batch commits when meta.json, which holds the
+committed batch count, is replaced. Before touching the arrays, a batch
+writes the old values of its buckets to journal.npz. If the ingest
+process dies before the commit, the next ingest restores those values,
+so a failed export can be re-run without double counting. Until then,
+reports can include the stopped batch's counts. Department
+names are added to the store as they appear, up to the capacity given at
+init. A batch that would exceed the capacity is rejected whole.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import time
+from datetime import date, datetime, timedelta, timezone
+
+import numpy as np
+
+STORE_DIR = os.path.join('.analytics', 'rollup')
+META_FILE = 'meta.json'
+HOURLY_FILE = 'hourly.u32'
+DAILY_FILE = 'daily.u32'
+PREFIX_FILE = 'prefix.u64'
+BATCH_LOG = 'batches.log'
+JOURNAL_FILE = 'journal.npz'
+
+MANILA = timezone(timedelta(hours=8))  # campus time for the hour and day buckets
+ROLES = ('student', 'staff', 'admin', 'unknown')
+DEPARTMENT_CAPACITY = 64
+YEAR_DAYS = 366
+BATCH_SIZE = 100000
+
+class RollupStore:
+    """An open rollup directory; mode 'r' for reports, 'r+' to ingest"""
+
+    def __init__(self, path=STORE_DIR, mode='r'):
+        self.path = path
+        self.mode = mode
+        with open(os.path.join(path, META_FILE), encoding='utf-8') as f:
+            self.meta = json.load(f)
+        self.start = datetime.fromisoformat(self.meta['start']).replace(tzinfo=MANILA)
+        self.start_ms = int(self.start.timestamp() * 1000)
+        self.days = self.meta['days']
+        self.hours = self.days * 24
+        shape = (self.meta['department_capacity'], len(ROLES))
+        self.hourly = np.memmap(os.path.join(path, HOURLY_FILE), np.uint32, mode, shape=(self.hours,) + shape)
+        self.daily = np.memmap(os.path.join(path, DAILY_FILE), np.uint32, mode, shape=(self.days,) + shape)
+        self.prefix = np.memmap(os.path.join(path, PREFIX_FILE), np.uint64, mode, shape=(self.hours + 1,) + shape)
+        self.departments = {name: i for i, name in enumerate(self.meta['departments'])}
+        self.batches = read_batch_log(path, self.meta['batches'], trim=mode != 'r')
+        if mode != 'r':
+            self.recover()
+
+    @classmethod
+    def create(cls, path=STORE_DIR, start=None, days=YEAR_DAYS, department_capacity=DEPARTMENT_CAPACITY):
+        """Lay out an empty store for days days from start (a date, campus time)"""
+        if os.path.exists(os.path.join(path, META_FILE)):
+            raise FileExistsError(f"{path} already holds a rollup store")
+        os.makedirs(path, exist_ok=True)
+        shape = (department_capacity, len(ROLES))
+        for name, dtype, rows in ((HOURLY_FILE, np.uint32, days * 24), (DAILY_FILE, np.uint32, days),
+                                  (PREFIX_FILE, np.uint64, days * 24 + 1)):
+            # Sized up front and left sparse; untouched pages read as zero
+            with open(os.path.join(path, name), 'wb') as f:
+                f.truncate(rows * shape[0] * shape[1] * np.dtype(dtype).itemsize)
+        open(os.path.join(path, BATCH_LOG), 'w').close()
+        meta = {'start': (start or date.today()).isoformat(), 'days': days,
+                'department_capacity': department_capacity, 'roles': list(ROLES),
+                'departments': [], 'batches': 0, 'filled': 0, 'events': 0, 'dropped': 0}
+        write_meta(path, meta)
+        return cls(path, 'r+')
+
+    def department_indexes(self, names):
+        """Bucket indexes of department names, adding new ones; raises ValueError over capacity"""
+        new = list(dict.fromkeys(name for name in names if name not in self.departments))
+        capacity = self.meta['department_capacity']
+        if len(self.departments) + len(new) > capacity:
+            raise ValueError(f"department capacity {capacity} reached at {new[capacity - len(self.departments)]!r}")
+        for name in new:
+            self.departments[name] = len(self.departments)
+            self.meta['departments'].append(name)
+        return np.fromiter((self.departments[name] for name in names), np.int64, len(names))
+
+    def ingest(self, events, batch_id=None, commit_meta=None):
+        """Add one batch of event dicts; returns (counted, dropped), (0, 0) when already ingested
+
+        commit_meta, when given, stands in for write_meta in the final meta.json commit.
+        """
+        events = list(events)
+        batch_id = batch_id or hashlib.sha256(
+            json.dumps(events, sort_keys=True, separators=(',', ':')).encode()).hexdigest()
+        if batch_id in self.batches:
+            return 0, 0
+        role_index = {role: i for i, role in enumerate(ROLES)}
+        hours = np.fromiter((event_ms(e) for e in events), np.int64, len(events))
+        hours = (hours - self.start_ms) // 3600000
+        keep = np.flatnonzero((hours >= 0) & (hours < self.hours))
+        # Only counted events name departments, so events outside the year use no capacity
+        kept = [events[i] for i in keep]
+        departments = self.department_indexes([e.get('department') or 'Unassigned' for e in kept])
+        roles = np.fromiter((role_index.get(e.get('role'), role_index['unknown']) for e in kept),
+                            np.int64, len(kept))
+        counted = self.add(hours[keep], departments, roles)
+        self.meta['events'] += counted
+        self.meta['dropped'] += len(events) - counted
+        self.commit(batch_id, commit_meta)
+        return counted, len(events) - counted
+
+    def add(self, hours, departments, roles):
+        """Count events given as bucket index arrays into the buckets and running totals"""
+        if not len(hours):
+            return 0
+        cells = self.hourly[0].size
+        flat, counts = np.unique((hours * cells + departments * len(ROLES) + roles), return_counts=True)
+        hour, cell = np.divmod(flat, cells)
+        day_flat = np.unique(hour // 24 * cells + cell)
+        hourly, daily = self.hourly.reshape(-1), self.daily.reshape(-1)
+        first = int(hour.min())
+        filled = max(self.meta['filled'], int(hour.max()) + 1)
+        write_journal(self.path, len(self.batches), first, filled,
+                      flat, hourly[flat], day_flat, daily[day_flat])
+
+        hourly[flat] += counts.astype(np.uint32)
+        np.add.at(daily, hour // 24 * cells + cell, counts.astype(np.uint32))
+        self.meta['filled'] = filled
+        self.rebuild_prefix(first, filled)
+        return int(counts.sum())
+
+    def rebuild_prefix(self, first, filled):
+        """Recompute the running totals for hours first up to filled from the hourly counts"""
+        cells = self.hourly[0].size
+        prefix = self.prefix.reshape(self.hours + 1, cells)
+        totals = np.cumsum(self.hourly.reshape(self.hours, cells)[first:filled], axis=0, dtype=np.uint64)
+        prefix[first + 1:filled + 1] = totals + prefix[first]
+
+    def commit(self, batch_id, commit_meta=None):
+        """Make the applied batch durable: arrays, then the batch log, then meta.json"""
+        for array in (self.hourly, self.daily, self.prefix):
+            array.flush()
+        with open(os.path.join(self.path, BATCH_LOG), 'a', encoding='utf-8') as f:
+            f.write(batch_id + '\n')
+        self.batches.add(batch_id)
+        self.meta['batches'] = len(self.batches)
+        (commit_meta or write_meta)(self.path, self.meta)
+        if os.path.exists(os.path.join(self.path, JOURNAL_FILE)):
+            os.remove(os.path.join(self.path, JOURNAL_FILE))
+
+    def recover(self):
+        """Undo a batch whose ingest stopped before its commit"""
+        path = os.path.join(self.path, JOURNAL_FILE)
+        if not os.path.exists(path):
+            return
+        with np.load(path) as journal:
+            if int(journal['batch']) >= self.meta['batches']:
+                self.hourly.reshape(-1)[journal['hourly_index']] = journal['hourly_old']
+                self.daily.reshape(-1)[journal['daily_index']] = journal['daily_old']
+                self.rebuild_prefix(int(journal['first']), int(journal['filled']))
+                for array in (self.hourly, self.daily, self.prefix):
+                    array.flush()
+        os.remove(path)
+
+    def hour(self, when):
+        """Bucket index of a datetime (naive means campus time), clamped to the store"""
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=MANILA)
+        return min(max(int((when - self.start).total_seconds() // 3600), 0), self.hours)
+
+    def select(self, rows, department=None, role=None):
+        """Sum of prefix rows over the chosen department and role"""
+        if department is None:
+            rows = rows.sum(axis=-2)
+        elif department in self.departments:
+            rows = rows[..., self.departments[department], :]
+        else:
+            rows = np.zeros_like(rows[..., 0, :])
+        if role is not None:
+            return rows[..., ROLES.index(role)]
+        return rows.sum(axis=-1)
+
+    def row(self, when):
+        """Prefix row of a datetime; rows past the last hour with events equal its row"""
+        return min(self.hour(when), self.meta['filled'])
+
+    def total(self, start, end, department=None, role=None):
+        """Events from start up to end, for one department and role or all of them"""
+        return int(self.select(self.prefix[self.row(end)].astype(np.int64)
+                               - self.prefix[self.row(start)].astype(np.int64), department, role))
+
+    def series(self, start, end, by='day', department=None, role=None):
+        """[(bucket start, count)] from start up to end, by hour, day, week or month"""
+        edges = bucket_edges(start, end, by)
+        hours = np.array([self.row(edge) for edge in edges])
+        counts = np.diff(self.select(self.prefix[hours].astype(np.int64), department, role), axis=0)
+        return list(zip(edges[:-1], counts.tolist()))
+
+def write_meta(path, meta):
+    tmp = os.path.join(path, f"{META_FILE}.{os.getpid()}.tmp")
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(meta, f)
+    os.replace(tmp, os.path.join(path, META_FILE))
+
+def read_batch_log(path, count, trim=False):
+    """The ids of the first count batches in the log; later lines never committed"""
+    with open(os.path.join(path, BATCH_LOG), encoding='utf-8') as f:
+        ids = f.read().split()
+    if trim and len(ids) > count:
+        # Drop ids a stopped ingest appended before its meta.json commit
+        with open(os.path.join(path, BATCH_LOG), 'w', encoding='utf-8') as f:
+            f.writelines(batch_id + '\n' for batch_id in ids[:count])
+    return set(ids[:count])
+
+def write_journal(path, batch, first, filled, hourly_index, hourly_old, daily_index, daily_old):
+    """Save the old values of the buckets a batch is about to change"""
+    tmp = os.path.join(path, f"{JOURNAL_FILE}.{os.getpid()}.tmp")
+    with open(tmp, 'wb') as f:
+        np.savez(f, batch=batch, first=first, filled=filled, hourly_index=hourly_index,
+                 hourly_old=hourly_old, daily_index=daily_index, daily_old=daily_old)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, os.path.join(path, JOURNAL_FILE))
+
+def event_ms(event):
+    stamp = event['timestamp']
+    if isinstance(stamp, str):
+        when = datetime.fromisoformat(stamp.replace('Z', '+00:00'))
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=MANILA)
+        return int(when.timestamp() * 1000)
+    return int(stamp)
+
+def bucket_edges(start, end, by):
+    """Bucket boundaries covering [start, end), cut to start and end"""
+    if by == 'hour':
+        step = lambda t: t + timedelta(hours=1)
+        first = start.replace(minute=0, second=0, microsecond=0)
+    elif by == 'day':
+        step = lambda t: t + timedelta(days=1)
+        first = start.replace(hour=0, minute=0, second=0, microsecond=0)
+    elif by == 'week':
+        step = lambda t: t + timedelta(days=7)
+        first = (start - timedelta(days=start.weekday())).replace(hour=0, minute=0, second=0, microsecond=0)
+    else:
+        step = lambda t: (t.replace(day=28) + timedelta(days=4)).replace(day=1)
+        first = start.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    edges = [start]
+    edge = step(first)
+    while edge < end:
+        edges.append(edge)
+        edge = step(edge)
+    edges.append(end)
+    return edges
+
+def read_batches(path, size=BATCH_SIZE):
+    """Lists of events from a JSON lines file, size at a time"""
+    batch = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                batch.append(json.loads(line))
+                if len(batch) == size:
+                    yield batch
+                    batch = []
+    if batch:
+        yield batch
+
+def synthetic_events(count, start, days, seed=0):
+    """Events spread over days from start, busier in class hours, for benchmarks"""
+    rng = np.random.default_rng(seed)
+    departments = ['IT Department', 'CS Department', 'Math Department', 'Engineering',
+                   'Business Admin', 'Education', 'Nursing', 'Agriculture']
+    start_ms = int(datetime.combine(start, datetime.min.time(), MANILA).timestamp() * 1000)
+    day = rng.integers(0, days, count)
+    hour = np.clip(rng.normal(13, 3, count), 6, 21).astype(np.int64)
+    ms = start_ms + (day * 24 + hour) * 3600000 + rng.integers(0, 3600000, count)
+    role = rng.choice(['student', 'staff', 'admin'], count, p=[0.85, 0.14, 0.01])
+    dept = rng.choice(departments, count)
+    for i in np.argsort(ms, kind='stable'):
+        yield {'timestamp': int(ms[i]), 'department': str(dept[i]), 'role': str(role[i])}
+
+def parse_day(text):
+    return datetime.strptime(text, '%Y-%m-%d').replace(tzinfo=MANILA)
+
+def print_series(series, by):
+    peak = max((count for _, count in series), default=0) or 1
+    fmt = {'hour': '%Y-%m-%d %H:00', 'day': '%Y-%m-%d', 'week': '%Y-%m-%d', 'month': '%Y-%m'}[by]
+    for edge, count in series:
+        print(f"  {edge.strftime(fmt):<17} {count:>10}  {'#' * round(40 * count / peak)}")
+
+def bench(events, path):
+    """Ingest synthetic events for a year into a scratch store and time reports"""
+    import shutil
+    shutil.rmtree(path, ignore_errors=True)
+    start = date(2026, 8, 1)
+    store = RollupStore.create(path, start)
+    batch, begin = [], time.perf_counter()
+    for event in synthetic_events(events, start, 300):
+        batch.append(event)
+        if len(batch) == BATCH_SIZE:
+            store.ingest(batch)
+            batch = []
+    if batch:
+        store.ingest(batch)
+    ingest = time.perf_counter() - begin
+    print(f"ingested {store.meta['events']} events in {ingest:.2f}s ({store.meta['events'] / ingest:,.0f}/s)")
+
+    reader = RollupStore(path)
+    year_start, year_end = parse_day('2026-08-01'), parse_day('2027-07-31')
+    for label, call in (
+            ("year total", lambda: reader.total(year_start, year_end)),
+            ("year total, one department and role",
+             lambda: reader.total(year_start, year_end, 'IT Department', 'staff')),
+            ("year by day", lambda: reader.series(year_start, year_end, 'day')),
+            ("year by month, one role", lambda: reader.series(year_start, year_end, 'month', role='student')),
+            ("one day by hour", lambda: reader.series(parse_day('2026-10-19'), parse_day('2026-10-20'), 'hour'))):
+        call()
+        begin = time.perf_counter()
+        for _ in range(20):
+            call()
+        print(f"  {label:<40} {(time.perf_counter() - begin) / 20 * 1000:8.3f} ms")
+    assert reader.total(year_start, year_end) == store.meta['events']
+
+    # Small batches in time order early in the year, as a live export sends them
+    small = RollupStore.create(path + '.small', start)
+    events = list(synthetic_events(20000, start, 30))
+    begin = time.perf_counter()
+    for i in range(0, len(events), 100):
+        small.ingest(events[i:i + 100])
+    elapsed = time.perf_counter() - begin
+    written = os.stat(os.path.join(small.path, PREFIX_FILE))
+    print(f"  100-event batches: {elapsed / (len(events) / 100) * 1000:.2f} ms each, "
+          f"prefix file {written.st_blocks * 512 // 1024} KB allocated of {written.st_size // 1024} KB")
+    shutil.rmtree(path + '.small', ignore_errors=True)
+
+def verify(events, path, seed=0):
+    """Ingest synthetic events out of order and compare every bucket with a plain count"""
+    import random
+    import shutil
+    from collections import Counter
+    shutil.rmtree(path, ignore_errors=True)
+    start = date(2026, 8, 1)
+    store = RollupStore.create(path, start, days=60)
+    # A few days past the store's end check that those events are dropped
+    events = list(synthetic_events(events, start, 62, seed))
+    rng = random.Random(seed)
+    batches = [events[i:i + 5000] for i in range(0, len(events), 5000)]
+    rng.shuffle(batches)
+    for batch in batches[:-1] + batches[:3]:
+        store.ingest(batch)
+
+    # The last batch stops after its arrays and batch log entry are written but before
+    # meta.json; reopening for ingest undoes it, so the re-run counts it once
+    try:
+        RollupStore(path, 'r+').ingest(batches[-1], commit_meta=stopped_before_commit)
+    except InterruptedError:
+        pass
+    store = RollupStore(path, 'r+')
+    store.ingest(batches[-1])
+
+    expected = Counter()
+    for e in events:
+        hour = (e['timestamp'] - store.start_ms) // 3600000
+        if hour < store.hours:
+            expected[hour, e['department'], e['role']] += 1
+    reader = RollupStore(path)
+    mismatches = 0
+    for (hour, dept, role), count in expected.items():
+        cell = reader.departments[dept], ROLES.index(role)
+        mismatches += reader.hourly[(hour,) + cell] != count
+    mismatches += int(reader.hourly.sum()) != sum(expected.values())
+    for day in range(reader.days):
+        day_total = sum(c for (h, _, _), c in expected.items() if h // 24 == day)
+        mismatches += int(reader.daily[day].sum()) != day_total
+    for _ in range(200):
+        a, b = sorted(rng.randrange(reader.hours + 1) for _ in range(2))
+        dept, role = rng.choice(list(reader.departments)), rng.choice(ROLES[:3])
+        naive = sum(c for (h, d, r), c in expected.items() if a <= h < b and d == dept and r == role)
+        when = lambda h: reader.start + timedelta(hours=h)
+        mismatches += reader.total(when(a), when(b), dept, role) != naive
+    dropped = len(events) - sum(expected.values())
+    print(f"{len(events)} events, {dropped} past the end, {len(batches)} batches shuffled, "
+          f"3 repeated and 1 interrupted")
+    print(f"stored {reader.meta['events']} counted, {reader.meta['dropped']} dropped; {mismatches} mismatches")
+    ok = mismatches == 0 and reader.meta['events'] == sum(expected.values()) and reader.meta['dropped'] == dropped
+    return verify_capacity(path + '.capacity') and ok
+
+def stopped_before_commit(path, meta):
+    raise InterruptedError("stopped before the meta.json commit")
+
+def verify_capacity(path):
+    """Dropped events use no department capacity, and a batch over it changes nothing"""
+    import shutil
+    shutil.rmtree(path, ignore_errors=True)
+    store = RollupStore.create(path, date(2026, 8, 1), days=10, department_capacity=2)
+    late = int(datetime(2026, 9, 1, tzinfo=MANILA).timestamp() * 1000)
+    store.ingest([{'timestamp': late, 'department': f"Late {i}", 'role': 'student'} for i in range(5)])
+    inside = int(datetime(2026, 8, 2, 9, tzinfo=MANILA).timestamp() * 1000)
+    store.ingest([{'timestamp': inside, 'department': 'IT Department', 'role': 'staff'}])
+    try:
+        store.ingest([{'timestamp': inside, 'department': name, 'role': 'student'}
+                      for name in ('CS Department', 'Math Department')])
+        rejected = False
+    except ValueError:
+        rejected = True
+    reader = RollupStore(path)
+    ok = rejected and reader.meta['departments'] == ['IT Department'] and reader.meta['events'] == 1
+    print(f"department capacity: over-capacity batch {'rejected' if rejected else 'ACCEPTED'}, "
+          f"departments {reader.meta['departments']}")
+    shutil.rmtree(path, ignore_errors=True)
+    return ok
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Hourly and daily analytics rollups")
+    parser.add_argument("--store", default=STORE_DIR, help="rollup directory")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    init = commands.add_parser("init", help="create an empty store")
+    init.add_argument("--start", type=lambda s: date.fromisoformat(s), help="first day (default: today)")
+    init.add_argument("--days", type=int, default=YEAR_DAYS)
+    init.add_argument("--departments", type=int, default=DEPARTMENT_CAPACITY, help="department capacity")
+
+    ingest = commands.add_parser("ingest", help="add JSON lines event files")
+    ingest.add_argument("files", nargs="+")
+
+    today = commands.add_parser("today", help="hourly counts for one day")
+    today.add_argument("--date", type=parse_day, help="YYYY-MM-DD (default: today)")
+    today.add_argument("--department")
+    today.add_argument("--role", choices=ROLES)
+
+    report = commands.add_parser("report", help="counts over a date range")
+    report.add_argument("--from", dest="start", type=parse_day, required=True, help="YYYY-MM-DD")
+    report.add_argument("--to", dest="end", type=parse_day, required=True, help="YYYY-MM-DD, exclusive")
+    report.add_argument("--by", choices=("hour", "day", "week", "month"), default="day")
+    report.add_argument("--department")
+    report.add_argument("--role", choices=ROLES)
+    report.add_argument("--json", action="store_true")
+
+    bench_cmd = commands.add_parser("bench", help="time ingest and reports on synthetic events")
+    bench_cmd.add_argument("--events", type=int, default=1000000)
+    bench_cmd.add_argument("--scratch", default=os.path.join('.analytics', 'bench'))
+
+    verify_cmd = commands.add_parser("verify", help="check the rollups against a plain count")
+    verify_cmd.add_argument("--events", type=int, default=200000)
+    verify_cmd.add_argument("--scratch", default=os.path.join('.analytics', 'verify'))
+    args = parser.parse_args()
+
+    if args.command == "init":
+        store = RollupStore.create(args.store, args.start, args.days, args.departments)
+        print(f"Created {args.store}: {store.days} days from {store.meta['start']}")
+    elif args.command == "ingest":
+        store = RollupStore(args.store, 'r+')
+        for path in args.files:
+            counted = dropped = batches = 0
+            for batch in read_batches(path):
+                added, outside = store.ingest(batch)
+                counted, dropped, batches = counted + added, dropped + outside, batches + 1
+            print(f"{path}: {counted} events in {batches} batches"
+                  + (f", {dropped} outside the store's year" if dropped else ""))
+    elif args.command == "today":
+        store = RollupStore(args.store)
+        day = args.date or datetime.now(MANILA).replace(hour=0, minute=0, second=0, microsecond=0)
+        series = store.series(day, day + timedelta(days=1), 'hour', args.department, args.role)
+        print(f"Today's Activity, {day:%Y-%m-%d}: {sum(count for _, count in series)} events")
+        print_series(series, 'hour')
+    elif args.command == "report":
+        store = RollupStore(args.store)
+        series = store.series(args.start, args.end, args.by, args.department, args.role)
+        if args.json:
+            print(json.dumps([[edge.isoformat(), count] for edge, count in series]))
+        else:
+            print(f"{sum(count for _, count in series)} events from {args.start:%Y-%m-%d} to {args.end:%Y-%m-%d}")
+            print_series(series, args.by)
+    elif args.command == "bench":
+        bench(args.events, args.scratch)
+    elif args.command == "verify":
+        raise SystemExit(0 if verify(args.events, args.scratch) else 1)
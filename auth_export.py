@@ -0,0 +1,332 @@
+"""
+UniTrack Auth Export Analyzer
+Account statistics from a Firebase Auth export (users.json) for the admin dashboard
+
+Usage:
+    python auth_export.py                             summary of users.json
+    python auth_export.py exports/sksu.json --by month
+    python auth_export.py --role staff --since 2026-01-01 --by day
+    python auth_export.py --json > dashboard.json     AppStatistics numbers as JSON
+
+The export (firebase auth:export --format=json) is one {"users": [...]}
+object. It is read in 64 KB chunks and each account object is decoded on its
+own, so memory does not grow with the number of accounts. The columns the
+statistics need (role, email domain, creation and last sign-in time, disabled
+and verified flags) are written to a compact cache next to the export, a few
+bytes per account, and later queries read the cache instead of the JSON.
+The cache is rebuilt when the export or the role patterns change. Emails,
+uids, password hashes and salts are never stored in it.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import struct
+import sys
+from array import array
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+
+EXPORT_FILE = 'users.json'
+CHUNK_SIZE = 64 * 1024
+CACHE_MAGIC = b'UTAUTH1\n'
+CACHE_VERSION = 1
+MANILA = timezone(timedelta(hours=8))  # campus time for the date buckets
+
+# (role, email pattern) in match order; accounts matching none are students,
+# following the admin@/staff@ naming of the accounts in tools/setup_users.js
+ROLE_PATTERNS = (('admin', r'admin@'), ('staff', r'staff@'))
+DEFAULT_ROLE = 'student'
+
+DISABLED = 1
+EMAIL_VERIFIED = 2
+
+# name, array typecode; created and last_sign_in are epoch ms, -1 when absent
+COLUMNS = (('created', 'q'), ('last_sign_in', 'q'), ('domain', 'H'), ('role', 'B'), ('flags', 'B'))
+
+def iter_users(path, chunk_size=CHUNK_SIZE):
+    """Each account object of an export, decoded one at a time"""
+    decoder = json.JSONDecoder()
+    with open(path, encoding='utf-8') as f:
+        buffer = ''
+        # Skip to the opening bracket of the users array
+        while True:
+            match = re.search(r'"users"\s*:\s*\[', buffer)
+            if match:
+                buffer = buffer[match.end():]
+                break
+            chunk = f.read(chunk_size)
+            if not chunk:
+                raise ValueError(f"{path}: no \"users\" array")
+            buffer = buffer[-32:] + chunk
+
+        pos = 0
+        while True:
+            while pos < len(buffer) and buffer[pos] in ' \t\r\n,':
+                pos += 1
+            if pos < len(buffer) and buffer[pos] == ']':
+                return
+            try:
+                user, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # The next object runs past the buffer: read on
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    raise ValueError(f"{path}: truncated users array")
+                buffer = buffer[pos:] + chunk
+                pos = 0
+                continue
+            yield user
+            pos = end
+
+def role_matchers(patterns=ROLE_PATTERNS):
+    return [(role, re.compile(pattern, re.IGNORECASE)) for role, pattern in patterns]
+
+def classify(email, matchers):
+    for role, matcher in matchers:
+        if matcher.search(email):
+            return role
+    return DEFAULT_ROLE
+
+def epoch_ms(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return -1
+
+class AccountColumns:
+    """The export reduced to fixed-width columns, one entry per account"""
+
+    def __init__(self, roles, domains=None, columns=None, source=None, patterns=ROLE_PATTERNS):
+        self.roles = list(roles)
+        self.domains = list(domains or [])
+        self.domain_index = {domain: i for i, domain in enumerate(self.domains)}
+        self.columns = columns or {name: array(code) for name, code in COLUMNS}
+        self.source = source
+        self.patterns = [list(p) for p in patterns]
+
+    def __len__(self):
+        return len(self.columns['flags'])
+
+    def __getattr__(self, name):
+        try:
+            return self.__dict__['columns'][name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    @classmethod
+    def from_export(cls, path, patterns=ROLE_PATTERNS):
+        matchers = role_matchers(patterns)
+        table = cls([role for role, _ in patterns] + [DEFAULT_ROLE], patterns=patterns)
+        role_index = {role: i for i, role in enumerate(table.roles)}
+        for user in iter_users(path):
+            email = user.get('email') or ''
+            domain = email.rpartition('@')[2].lower() if '@' in email else ''
+            flags = (DISABLED if user.get('disabled') else 0) | (EMAIL_VERIFIED if user.get('emailVerified') else 0)
+            table.append(epoch_ms(user.get('createdAt')), epoch_ms(user.get('lastSignedInAt')),
+                         table.intern(domain), role_index[classify(email, matchers)], flags)
+        return table
+
+    def intern(self, domain):
+        index = self.domain_index.get(domain)
+        if index is None:
+            index = self.domain_index[domain] = len(self.domains)
+            self.domains.append(domain)
+        return index
+
+    def append(self, created, last_sign_in, domain, role, flags):
+        c = self.columns
+        c['created'].append(created)
+        c['last_sign_in'].append(last_sign_in)
+        c['domain'].append(domain)
+        c['role'].append(role)
+        c['flags'].append(flags)
+
+    def save(self, path):
+        header = json.dumps({'version': CACHE_VERSION, 'rows': len(self), 'source': self.source,
+                             'patterns': self.patterns, 'roles': self.roles, 'domains': self.domains,
+                             'columns': [[name, code] for name, code in COLUMNS],
+                             'byteorder': sys.byteorder}).encode()
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, 'wb') as f:
+            f.write(CACHE_MAGIC + struct.pack('<I', len(header)) + header)
+            for name, _ in COLUMNS:
+                self.columns[name].tofile(f)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path):
+        """The cached columns, or None when the file is missing or not a cache"""
+        try:
+            with open(path, 'rb') as f:
+                if f.read(len(CACHE_MAGIC)) != CACHE_MAGIC:
+                    return None
+                header = json.loads(f.read(struct.unpack('<I', f.read(4))[0]))
+                if header['version'] != CACHE_VERSION or header['byteorder'] != sys.byteorder:
+                    return None
+                columns = {}
+                for name, code in header['columns']:
+                    columns[name] = array(code)
+                    columns[name].fromfile(f, header['rows'])
+        except (FileNotFoundError, EOFError, ValueError, KeyError, struct.error):
+            return None
+        return cls(header['roles'], header['domains'], columns, header['source'],
+                   [tuple(p) for p in header['patterns']])
+
+def cache_path(export_path):
+    return export_path + '.columns'
+
+def file_digest(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            h.update(block)
+    return h.hexdigest()
+
+def load_columns(export_path=EXPORT_FILE, patterns=ROLE_PATTERNS, use_cache=True, rebuild=False):
+    """Columns for an export, from the cache when it matches the export and patterns"""
+    stat = os.stat(export_path)
+    path = cache_path(export_path)
+    cached = AccountColumns.load(path) if use_cache and not rebuild else None
+    if cached is not None and cached.patterns == [list(p) for p in patterns]:
+        source = cached.source
+        if source['size'] == stat.st_size and source['mtime_ns'] == stat.st_mtime_ns:
+            return cached
+        if source['size'] == stat.st_size and source['sha256'] == file_digest(export_path):
+            # Touched but unchanged: keep the columns, record the new mtime
+            cached.source['mtime_ns'] = stat.st_mtime_ns
+            cached.save(path)
+            return cached
+
+    table = AccountColumns.from_export(export_path, patterns)
+    table.source = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': file_digest(export_path)}
+    if use_cache:
+        table.save(path)
+    return table
+
+def to_ms(date):
+    return int(date.timestamp() * 1000)
+
+def parse_date(text):
+    """A YYYY-MM-DD date at midnight campus time"""
+    return datetime.strptime(text, '%Y-%m-%d').replace(tzinfo=MANILA)
+
+def select(table, role=None, domain=None, since=None, until=None):
+    """Row indexes matching the filters; since/until are epoch ms, until exclusive"""
+    role = table.roles.index(role) if role is not None else None
+    if domain is not None:
+        domain = table.domain_index.get(domain.lower(), -1)
+    created, roles, domains = table.created, table.role, table.domain
+    rows = []
+    for i in range(len(table)):
+        if role is not None and roles[i] != role:
+            continue
+        if domain is not None and domains[i] != domain:
+            continue
+        if since is not None and created[i] < since:
+            continue
+        if until is not None and created[i] >= until:
+            continue
+        rows.append(i)
+    return rows
+
+def bucket(day, by):
+    """Date bucket label of a campus-time day number (days since the epoch)"""
+    if day is None:
+        return 'unknown'
+    date = datetime(1970, 1, 1) + timedelta(days=day)
+    if by == 'day':
+        return date.strftime('%Y-%m-%d')
+    if by == 'week':
+        year, week, _ = date.isocalendar()
+        return f"{year}-W{week:02d}"
+    return date.strftime('%Y-%m')
+
+def statistics(table, rows=None, now=None, by='month'):
+    """Counts over the selected rows, named like the admin dashboard's AppStatistics"""
+    now = now or datetime.now(MANILA)
+    today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    today_ms = to_ms(today)
+    week_ms = to_ms(today - timedelta(days=7))
+    month_ms = to_ms(today.replace(day=1))
+
+    if rows is None:
+        created, last, flags = table.created, table.last_sign_in, table.flags
+        roles, domains = Counter(table.role), Counter(table.domain)
+    else:
+        created = [table.created[i] for i in rows]
+        last = [table.last_sign_in[i] for i in rows]
+        flags = [table.flags[i] for i in rows]
+        roles = Counter(table.role[i] for i in rows)
+        domains = Counter(table.domain[i] for i in rows)
+    flag_counts = Counter(flags)
+
+    # Count whole campus-time days first, so each distinct day is formatted once
+    offset = int(MANILA.utcoffset(None).total_seconds() * 1000)
+    histogram = Counter()
+    for day, count in Counter((ms + offset) // 86400000 if ms >= 0 else None for ms in created).items():
+        histogram[bucket(day, by)] += count
+
+    by_role = {table.roles[i]: n for i, n in roles.items()}
+    return {'totalUsers': len(flags),
+            'totalStudents': by_role.get('student', 0),
+            'totalStaff': by_role.get('staff', 0),
+            'totalAdmins': by_role.get('admin', 0),
+            'activeToday': sum(1 for ms in last if ms > today_ms),
+            'newUsersThisWeek': sum(1 for ms in created if ms > week_ms),
+            'newUsersThisMonth': sum(1 for ms in created if ms > month_ms),
+            'bannedUsers': sum(n for f, n in flag_counts.items() if f & DISABLED),
+            'emailVerified': sum(n for f, n in flag_counts.items() if f & EMAIL_VERIFIED),
+            'usersByRole': by_role,
+            'usersByDomain': {table.domains[i] or '(none)': n for i, n in domains.most_common()},
+            'createdBy' + by.capitalize(): dict(sorted(histogram.items()))}
+
+def print_summary(stats, by):
+    roles = ', '.join(f"{count} {role}" for role, count in stats['usersByRole'].items())
+    print(f"{stats['totalUsers']} accounts ({roles}); {stats['bannedUsers']} disabled, "
+          f"{stats['emailVerified']} email verified")
+    print(f"New this week {stats['newUsersThisWeek']}, this month {stats['newUsersThisMonth']}; "
+          f"signed in today {stats['activeToday']}")
+    print("\nBy domain:")
+    for domain, count in stats['usersByDomain'].items():
+        print(f"  {domain:<32} {count:>8}")
+    histogram = stats['createdBy' + by.capitalize()]
+    print(f"\nCreated by {by}:")
+    peak = max(histogram.values(), default=0)
+    for label, count in histogram.items():
+        print(f"  {label:<10} {count:>8}  {'#' * max(1, round(40 * count / peak))}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Account statistics from a Firebase Auth export")
+    parser.add_argument("export", nargs="?", default=EXPORT_FILE, help="auth:export JSON file")
+    parser.add_argument("--by", choices=("day", "week", "month"), default="month", help="creation histogram")
+    parser.add_argument("--role", help="only accounts of this role")
+    parser.add_argument("--domain", help="only accounts with this email domain")
+    parser.add_argument("--since", type=parse_date, help="created on or after YYYY-MM-DD")
+    parser.add_argument("--until", type=parse_date, help="created before YYYY-MM-DD")
+    parser.add_argument("--now", type=parse_date, help="reference date for today/week/month counts")
+    parser.add_argument("--role-pattern", action="append", metavar="ROLE=REGEX",
+                        help="email pattern for a role, checked in order (default: admin@, staff@)")
+    parser.add_argument("--json", action="store_true", help="print the statistics as JSON")
+    parser.add_argument("--rebuild", action="store_true", help="re-read the export even if cached")
+    parser.add_argument("--no-cache", action="store_true", help="neither read nor write the column cache")
+    args = parser.parse_args()
+
+    patterns = ROLE_PATTERNS
+    if args.role_pattern:
+        if not all('=' in p for p in args.role_pattern):
+            parser.error("--role-pattern takes ROLE=REGEX")
+        patterns = tuple(tuple(p.split('=', 1)) for p in args.role_pattern)
+    table = load_columns(args.export, patterns, use_cache=not args.no_cache, rebuild=args.rebuild)
+    if args.role is not None and args.role not in table.roles:
+        parser.error(f"unknown role {args.role!r} (roles: {', '.join(table.roles)})")
+    filtered = any(v is not None for v in (args.role, args.domain, args.since, args.until))
+    rows = select(table, args.role, args.domain, args.since and to_ms(args.since),
+                  args.until and to_ms(args.until)) if filtered else None
+    stats = statistics(table, rows, args.now, args.by)
+    if args.json:
+        print(json.dumps(stats, indent=2))
+    else:
+        print_summary(stats, args.by)
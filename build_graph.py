@@ -0,0 +1,235 @@
+"""
+UniTrack Build Graph
+Builds the mockups, proposal and web assets as a dependency graph of content-hashed nodes
+
+Usage:
+    python build_graph.py                        build everything that is out of date
+    python build_graph.py docx launch            only these nodes (or node kinds) and their dependencies
+    python build_graph.py --workers 4 --force
+    python build_graph.py --list                 print the graph
+
+Nodes:
+    mockup:<screen>     one mockup image, for each screen the proposal shows
+    section:<id>        one proposal section built to a cached body fragment
+    docx                the proposal, merged from the section fragments
+    html                the proposal web page (proposal_html)
+    launch:<WxH>        one web/icons launch image (launch_images)
+
+A node's key hashes its action, its input files (content, generator sources)
+and the outputs of the nodes it depends on. A node runs only when its key or
+its outputs changed since the last build, and a node whose rebuilt output is
+byte-identical does not invalidate its dependents. Ready nodes run
+concurrently in a process pool sized to the CPU count.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import pickle
+import time
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, wait
+
+from proposal_build import (CONTENT_DIR, DEFAULT_OUTPUT, INDEX_FILE, asset_digests, asset_paths,
+                            load_sections, section_path)
+
+STATE_FILE = os.path.join('.proposal_cache', 'graph.json')
+FRAGMENT_DIR = os.path.join('.proposal_cache', 'sections')
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+Node = namedtuple('Node', 'name action args inputs deps outputs')
+
+def source(name):
+    return os.path.join(HERE, name)
+
+def write_atomic(path, data):
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+# Node actions; they run in worker processes and import what they need
+
+def render_mockup(screen, path, quality):
+    from create_mockups import render_png
+    write_atomic(path, render_png(screen, quality=quality))
+
+def build_fragment(content_dir, section_id, path):
+    import generate_proposal as gp
+    with open(section_path(content_dir, section_id), encoding='utf-8') as f:
+        section = json.load(f)
+    write_atomic(path, pickle.dumps(gp.build_section_fragment(section, None, section_id)))
+
+def assemble_docx(content_dir, fragment_paths, output, reproducible):
+    import generate_proposal as gp
+    doc = gp.new_document()
+    for path in fragment_paths:
+        with open(path, 'rb') as f:
+            gp.merge_section_fragment(doc, *pickle.load(f))
+    gp.renumber_drawing_ids(doc)
+    gp.add_table_styles(doc, load_sections(content_dir))
+    gp.save_document(doc, output, reproducible)
+
+def render_html(content_dir):
+    from proposal_html import build_html
+    build_html(content_dir=content_dir)
+
+def render_launch(size, path):
+    from launch_images import write_launch_image
+    write_launch_image(size, path)
+
+def proposal_graph(content_dir=CONTENT_DIR, output=DEFAULT_OUTPUT, reproducible=False, quality='draft'):
+    """Every node of the build, in an order where dependencies come first"""
+    from launch_images import ICON_SOURCE, launch_path, launch_sizes
+    from proposal_html import HTML_DIR
+
+    sections = load_sections(content_dir)
+    index = os.path.join(content_dir, INDEX_FILE)
+    mockups = {}
+    for _, section in sections:
+        for block in section['blocks']:
+            if block['type'] == 'figure' and 'screen' in block:
+                mockups.setdefault(block['image'], f"mockup:{block['screen']}")
+
+    nodes = [Node(name, render_mockup, (name.split(':', 1)[1], image, quality),
+                  [source('create_mockups.py')], [], [image])
+             for image, name in mockups.items()]
+
+    fragments = []
+    for sid, section in sections:
+        assets = asset_paths([(sid, section)])
+        fragment = os.path.join(FRAGMENT_DIR, sid + '.pickle')
+        fragments.append(fragment)
+        nodes.append(Node(f"section:{sid}", build_fragment, (content_dir, sid, fragment),
+                          [section_path(content_dir, sid), source('generate_proposal.py'), source('proposal_ir.py')]
+                          + [path for path in assets if path not in mockups],
+                          sorted({mockups[path] for path in assets if path in mockups}), [fragment]))
+    nodes.append(Node('docx', assemble_docx, (content_dir, fragments, output, reproducible),
+                      [index, source('generate_proposal.py')], [f"section:{sid}" for sid, _ in sections], [output]))
+
+    html_inputs = [index, source('proposal_html.py'), source('proposal_ir.py')]
+    html_inputs += [section_path(content_dir, sid) for sid, _ in sections]
+    html_inputs += [path for path in asset_paths(sections) if path not in mockups]
+    nodes.append(Node('html', render_html, (content_dir,), html_inputs, sorted(set(mockups.values())),
+                      [os.path.join(HTML_DIR, 'index.html')]))
+
+    for size in launch_sizes():
+        path = launch_path(size)
+        nodes.append(Node(f"launch:{size[0]}x{size[1]}", render_launch, (size, path),
+                          [ICON_SOURCE, source('launch_images.py')], [], [path]))
+    return nodes
+
+def select(nodes, targets):
+    """The named nodes, or nodes of the named kinds, and everything they depend on"""
+    by_name = {node.name: node for node in nodes}
+    wanted = [node.name for node in nodes
+              if any(node.name == t or node.name.startswith(t + ':') for t in targets)]
+    unknown = [t for t in targets if not any(n == t or n.startswith(t + ':') for n in by_name)]
+    if unknown:
+        raise ValueError(f"unknown build targets: {', '.join(unknown)}")
+    keep = set()
+    while wanted:
+        name = wanted.pop()
+        if name not in keep:
+            keep.add(name)
+            wanted.extend(by_name[name].deps)
+    return [node for node in nodes if node.name in keep]
+
+def read_state(path=STATE_FILE):
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+def write_state(state, path=STATE_FILE):
+    write_atomic(path, json.dumps(state, indent=1, sort_keys=True).encode())
+
+def hashes(digests):
+    return {path: entry and entry['sha256'] for path, entry in digests.items()}
+
+def node_key(node, inputs, done):
+    """Hash of everything a node's output depends on"""
+    h = hashlib.sha256(json.dumps([node.name, node.action.__name__, repr(node.args)]).encode())
+    h.update(json.dumps(hashes(inputs), sort_keys=True).encode())
+    for dep in node.deps:
+        h.update(json.dumps(hashes(done[dep]), sort_keys=True).encode())
+    return h.hexdigest()
+
+def build(nodes, workers=None, force=False, state_path=STATE_FILE):
+    """Run the out-of-date nodes, dependencies first; returns (built, up-to-date) node names"""
+    names = {node.name for node in nodes}
+    missing = {dep for node in nodes for dep in node.deps} - names
+    if missing:
+        raise ValueError(f"nodes depend on unknown nodes: {sorted(missing)}")
+    state = read_state(state_path)
+    done = {}
+    pending = {node.name: node for node in nodes}
+    running = {}
+    built, fresh = [], []
+    pool = None  # started on the first out-of-date node, so a no-op build stays light
+    try:
+        while pending or running:
+            for name, node in list(pending.items()):
+                if any(dep not in done for dep in node.deps):
+                    continue
+                del pending[name]
+                previous = state.get(name, {})
+                key = node_key(node, asset_digests(node.inputs, previous.get('inputs')), done)
+                outputs = asset_digests(node.outputs, previous.get('outputs'))
+                if (not force and previous.get('key') == key
+                        and hashes(outputs) == hashes(previous.get('outputs', {}))):
+                    done[name] = outputs
+                    state[name] = dict(previous, outputs=outputs)
+                    fresh.append(name)
+                    continue
+                if pool is None:
+                    from concurrent.futures import ProcessPoolExecutor
+                    pool = ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1)
+                future = pool.submit(node.action, *node.args)
+                running[future] = (node, key, time.perf_counter())
+            if not running:
+                if pending:
+                    raise ValueError(f"dependency cycle among: {sorted(pending)}")
+                continue
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                node, key, start = running.pop(future)
+                future.result()
+                outputs = asset_digests(node.outputs)
+                done[node.name] = outputs
+                state[node.name] = {'key': key, 'inputs': asset_digests(node.inputs), 'outputs': outputs}
+                built.append(node.name)
+                print(f"built {node.name} ({(time.perf_counter() - start) * 1000:.0f} ms)")
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+        write_state(state, state_path)
+    return built, fresh
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the UniTrack mockups, proposal and web assets")
+    parser.add_argument("targets", nargs="*", help="node names or kinds (mockup, section, docx, html, launch)")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    parser.add_argument("--content", default=CONTENT_DIR, help="proposal content directory")
+    parser.add_argument("--workers", type=int, default=0, help="worker processes (0 = one per CPU)")
+    parser.add_argument("--force", action="store_true", help="run every node")
+    parser.add_argument("--reproducible", action="store_true", help="reproducible .docx output")
+    parser.add_argument("--quality", choices=("draft", "standard", "print"), default="draft",
+                        help="mockup quality")
+    parser.add_argument("--list", action="store_true", help="print the nodes and their dependencies")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    nodes = proposal_graph(args.content, args.output, args.reproducible, args.quality)
+    if args.targets:
+        nodes = select(nodes, args.targets)
+    if args.list:
+        for node in nodes:
+            print(f"{node.name:<28} <- {', '.join(node.deps) or '-'}")
+    else:
+        built, fresh = build(nodes, workers=args.workers or None, force=args.force)
+        print(f"{len(built)} built, {len(fresh)} up to date in {(time.perf_counter() - start) * 1000:.0f} ms")
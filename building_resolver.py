@@ -0,0 +1,270 @@
+"""
+UniTrack Building Resolver
+Maps location pings to the building names shown as "📍 Admin Building" in the app
+
+Usage:
+    python building_resolver.py 6.6340 124.6086            building at a point
+    python building_resolver.py --verify                   compare against a linear scan
+    python building_resolver.py --bench 50000
+    python building_resolver.py --sync                     regenerate campus_data/buildings.json
+
+Footprints are rectangles in campus_data/buildings.json. BuildingResolver
+projects them to local meters around the middle of the footprints and
+indexes their centroids in a KD-tree. A ping resolves to the building whose
+footprint contains it, or else to the building with the nearest footprint
+edge within max_distance meters. The search visits centroids nearest first
+and stops once no remaining centroid can be closer than the best footprint
+found, even allowing for the largest footprint's half-diagonal.
+
+Results are cached in an LRU keyed by the ping rounded to about a meter.
+Stationary staff report the same spot every heartbeat, so most pings are
+cache hits.
+
+The footprints were drawn from the live map mockup
+(create_mockups.LIVE_MAP_BUILDINGS). --sync maps the mockup's map area onto
+the Isulan campus bounding box. Replace them with surveyed footprints as
+they become available.
+"""
+
+import argparse
+import heapq
+import json
+import math
+import os
+import random
+import sys
+import time
+from collections import OrderedDict
+
+CAMPUS_FILE = os.path.join('campus_data', 'campuses.json')
+BUILDING_FILE = os.path.join('campus_data', 'buildings.json')
+
+METERS_PER_DEGREE = 111320.0
+CACHE_PRECISION = 5       # decimal places of the cache key; 1e-5 degrees is about 1.1 m
+CACHE_SIZE = 65536
+MAX_DISTANCE = 100.0      # meters; farther pings resolve to no building
+
+def load_buildings(path=BUILDING_FILE):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)['buildings']
+
+def mockup_projection(campus_id='isulan', campus_path=CAMPUS_FILE):
+    """(x, y) on the live map mockup to (lat, lng) on the campus bounding box"""
+    from create_mockups import LIVE_MAP_AREA
+    with open(campus_path, encoding='utf-8') as f:
+        campus = next(c for c in json.load(f)['campuses'] if c['id'] == campus_id)
+    lats = [p[0] for p in campus['boundary']]
+    lngs = [p[1] for p in campus['boundary']]
+    left, top, right, bottom = LIVE_MAP_AREA
+    # Screen x runs west to east and y north to south across the bounding box
+    return lambda x, y: (round(max(lats) - (y - top) / (bottom - top) * (max(lats) - min(lats)), 7),
+                         round(min(lngs) + (x - left) / (right - left) * (max(lngs) - min(lngs)), 7))
+
+def sync_buildings(campus_id='isulan', campus_path=CAMPUS_FILE, path=BUILDING_FILE):
+    """Rewrite the building file from the live map mockup, placed on one campus"""
+    from create_mockups import LIVE_MAP_BUILDINGS
+    place = mockup_projection(campus_id, campus_path)
+    buildings = [{'name': label.replace('\n', ' '), 'campus': campus_id,
+                  'bounds': list(place(x1, y2) + place(x2, y1))}
+                 for x1, y1, x2, y2, label in LIVE_MAP_BUILDINGS]
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('{"buildings": [\n')
+        f.write(',\n'.join(json.dumps(b, ensure_ascii=False) for b in buildings))
+        f.write('\n]}\n')
+    return buildings
+
+class KDTree:
+    """Static 2-d tree over points; nearest() yields point indexes by increasing distance"""
+
+    def __init__(self, points):
+        self.points = points
+        # Nodes are (point index, axis, left child, right child), -1 for no child
+        self.nodes = []
+        self.root = self.build(list(range(len(points))), 0)
+
+    def build(self, indexes, depth):
+        if not indexes:
+            return -1
+        axis = depth % 2
+        indexes.sort(key=lambda i: self.points[i][axis])
+        middle = len(indexes) // 2
+        node = len(self.nodes)
+        self.nodes.append(None)
+        left = self.build(indexes[:middle], depth + 1)
+        right = self.build(indexes[middle + 1:], depth + 1)
+        self.nodes[node] = (indexes[middle], axis, left, right)
+        return node
+
+    def nearest(self, x, y):
+        """(distance, point index) pairs, nearest first, visiting only the subtrees needed"""
+        # Heap of (lower bound on distance, 0 for subtree / 1 for point, node or index)
+        heap = [(0.0, 0, self.root)] if self.root >= 0 else []
+        while heap:
+            bound, kind, item = heapq.heappop(heap)
+            if kind:
+                yield bound, item
+                continue
+            index, axis, left, right = self.nodes[item]
+            px, py = self.points[index]
+            heapq.heappush(heap, (math.hypot(x - px, y - py), 1, index))
+            offset = (x - px) if axis == 0 else (y - py)
+            near, far = (left, right) if offset < 0 else (right, left)
+            if near >= 0:
+                heapq.heappush(heap, (bound, 0, near))
+            if far >= 0:
+                heapq.heappush(heap, (max(bound, abs(offset)), 0, far))
+
+class BuildingResolver:
+    """Ping-to-building lookups over rectangular footprints"""
+
+    def __init__(self, buildings, max_distance=MAX_DISTANCE, cache_size=CACHE_SIZE, precision=CACHE_PRECISION):
+        self.buildings = buildings
+        self.max_distance = max_distance
+        self.cache_size = cache_size
+        self.precision = precision
+        self.cache = OrderedDict()
+        self.hits = self.misses = 0
+        lats = [sum(b['bounds'][0::2]) / 2 for b in buildings]
+        lngs = [sum(b['bounds'][1::2]) / 2 for b in buildings]
+        # Local equirectangular projection in meters around the middle of all footprints
+        self.origin = (sum(lats) / len(lats), sum(lngs) / len(lngs))
+        self.lng_scale = METERS_PER_DEGREE * math.cos(math.radians(self.origin[0]))
+        self.rects = []
+        for b in buildings:
+            x0, y0 = self.project(b['bounds'][0], b['bounds'][1])
+            x1, y1 = self.project(b['bounds'][2], b['bounds'][3])
+            self.rects.append((x0, y0, x1, y1))
+        centroids = [((x0 + x1) / 2, (y0 + y1) / 2) for x0, y0, x1, y1 in self.rects]
+        self.reach = max(math.hypot(x1 - x0, y1 - y0) / 2 for x0, y0, x1, y1 in self.rects)
+        self.tree = KDTree(centroids)
+
+    def project(self, lat, lng):
+        return (lng - self.origin[1]) * self.lng_scale, (lat - self.origin[0]) * METERS_PER_DEGREE
+
+    def footprint_distance(self, index, x, y):
+        x0, y0, x1, y1 = self.rects[index]
+        return math.hypot(max(x0 - x, 0.0, x - x1), max(y0 - y, 0.0, y - y1))
+
+    def locate(self, lat, lng):
+        """(building index or None, meters to its footprint, 0 when inside), uncached"""
+        x, y = self.project(lat, lng)
+        best, best_distance = None, math.inf
+        for centroid_distance, index in self.tree.nearest(x, y):
+            # No footprint beyond this centroid distance can beat the best one
+            if centroid_distance - self.reach >= best_distance or centroid_distance - self.reach > self.max_distance:
+                break
+            distance = self.footprint_distance(index, x, y)
+            if distance < best_distance:
+                best, best_distance = index, distance
+                if distance == 0.0:
+                    break
+        if best_distance > self.max_distance:
+            return None, best_distance
+        return best, best_distance
+
+    def resolve(self, lat, lng):
+        """(building name or None, inside) for one ping, through the LRU"""
+        key = (round(lat, self.precision), round(lng, self.precision))
+        entry = self.cache.get(key)
+        if entry is not None:
+            self.cache.move_to_end(key)
+            self.hits += 1
+            return entry
+        self.misses += 1
+        index, distance = self.locate(*key)
+        entry = (self.buildings[index]['name'] if index is not None else None, distance == 0.0)
+        self.cache[key] = entry
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return entry
+
+    def resolve_many(self, pings):
+        """resolve() for an iterable of (lat, lng)"""
+        return [self.resolve(lat, lng) for lat, lng in pings]
+
+    def label(self, lat, lng):
+        """The app's location line: the building, "Near <building>" or "Off campus\""""
+        name, inside = self.resolve(lat, lng)
+        if name is None:
+            return "Off campus"
+        return name if inside else f"Near {name}"
+
+def linear_locate(resolver, lat, lng):
+    """locate() by checking every footprint, for reference"""
+    x, y = resolver.project(lat, lng)
+    distances = [resolver.footprint_distance(i, x, y) for i in range(len(resolver.rects))]
+    best = min(range(len(distances)), key=distances.__getitem__)
+    return (best if distances[best] <= resolver.max_distance else None), distances[best]
+
+def sample_pings(buildings, count, rng, spread=0.002):
+    lat0 = min(b['bounds'][0] for b in buildings) - spread
+    lat1 = max(b['bounds'][2] for b in buildings) + spread
+    lng0 = min(b['bounds'][1] for b in buildings) - spread
+    lng1 = max(b['bounds'][3] for b in buildings) + spread
+    return [(rng.uniform(lat0, lat1), rng.uniform(lng0, lng1)) for _ in range(count)]
+
+def verify(resolver, count=100000, seed=0):
+    """Pings where the KD-tree search and the linear scan disagree"""
+    rng = random.Random(seed)
+    pings = sample_pings(resolver.buildings, count, rng)
+    # Footprint corners and edge midpoints, where containment and ties are decided
+    for b in resolver.buildings:
+        lat0, lng0, lat1, lng1 = b['bounds']
+        pings += [(lat, lng) for lat in (lat0, (lat0 + lat1) / 2, lat1) for lng in (lng0, (lng0 + lng1) / 2, lng1)]
+    failures = 0
+    for lat, lng in pings:
+        got, got_distance = resolver.locate(lat, lng)
+        expected, expected_distance = linear_locate(resolver, lat, lng)
+        # Equidistant footprints may resolve either way; the distance must agree
+        if (got is None) != (expected is None) or (got is not None and abs(got_distance - expected_distance) > 1e-9):
+            failures += 1
+            if failures <= 5:
+                print(f"  ({lat!r}, {lng!r}): tree {got} at {got_distance:.3f} m, "
+                      f"scan {expected} at {expected_distance:.3f} m")
+    print(f"{len(pings)} pings, {failures} mismatches")
+    return failures
+
+def bench(resolver, count):
+    rng = random.Random(1)
+    pings = sample_pings(resolver.buildings, count, rng)
+    start = time.perf_counter()
+    for lat, lng in pings:
+        resolver.locate(lat, lng)
+    uncached = time.perf_counter() - start
+    # Heartbeats: each device reports nearly the same spot again
+    repeats = [(lat + rng.uniform(-2e-6, 2e-6), lng + rng.uniform(-2e-6, 2e-6)) for lat, lng in pings]
+    resolver.resolve_many(pings)
+    resolver.hits = resolver.misses = 0
+    start = time.perf_counter()
+    resolver.resolve_many(repeats)
+    cached = time.perf_counter() - start
+    start = time.perf_counter()
+    for lat, lng in pings[:10000]:
+        linear_locate(resolver, lat, lng)
+    scan = (time.perf_counter() - start) / min(count, 10000)
+    print(f"{len(resolver.buildings)} buildings; KD-tree {count / uncached:,.0f} pings/s, "
+          f"repeat pings through the cache {count / cached:,.0f}/s "
+          f"({resolver.hits / max(1, resolver.hits + resolver.misses):.0%} hits), linear scan {1 / scan:,.0f}/s")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Resolve location pings to campus buildings")
+    parser.add_argument("point", nargs="*", type=float, help="LAT LNG")
+    parser.add_argument("--buildings", default=BUILDING_FILE)
+    parser.add_argument("--max-distance", type=float, default=MAX_DISTANCE,
+                        help="meters beyond which a ping is off campus")
+    parser.add_argument("--verify", action="store_true", help="check the KD-tree search against a linear scan")
+    parser.add_argument("--bench", type=int, metavar="N", help="time N pings")
+    parser.add_argument("--sync", action="store_true", help="regenerate the building file from the mockup")
+    args = parser.parse_args()
+
+    if args.sync:
+        print(f"Wrote {len(sync_buildings(path=args.buildings))} buildings to {args.buildings}")
+    resolver = BuildingResolver(load_buildings(args.buildings), args.max_distance)
+    if len(args.point) == 2:
+        print(f"📍 {resolver.label(*args.point)}")
+    elif args.point:
+        parser.error("give a point as LAT LNG")
+    if args.verify and verify(resolver):
+        sys.exit(1)
+    if args.bench:
+        bench(resolver, args.bench)
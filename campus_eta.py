@@ -0,0 +1,362 @@
+"""
+UniTrack Campus ETA Table
+Precomputed walking distance and ETA between every pair of campus buildings and gates
+
+Usage:
+    python campus_eta.py                                  update the table after a walkway change
+    python campus_eta.py --from "Main Gate" --to Library  one lookup: "4 min • 278m"
+    python campus_eta.py --force --verify
+    python campus_eta.py --sync                           regenerate campus_data/walkways.json
+
+The walkway graph (campus_data/walkways.json) has named nodes with
+coordinates, undirected edges measured from them (or given in meters), and
+places: the building doors and gates people navigate between. One Dijkstra
+search from every place gives the matrix, which is stored as a float32
+(2, places, places) .npy of meters and seconds. EtaTable memory-maps it, so a
+lookup is one array read and many processes share the pages.
+
+Each build also keeps every search's node distances and shortest-path tree,
+so the next build repairs the searches instead of repeating them:
+- A removed or lengthened edge invalidates only the subtree hanging below
+  it in the trees that use it.
+- An added or shortened edge only matters where it offers a shorter route
+  to one of its ends.
+Each affected search relabels just those nodes, starting from the edges that
+can now improve them. Only a new or moved place gets a full search. The
+table is replaced atomically, so readers holding the old map keep a
+consistent snapshot.
+"""
+
+import argparse
+import heapq
+import json
+import math
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+WALKWAY_FILE = os.path.join('campus_data', 'walkways.json')
+ETA_DIR = os.path.join('.campus_cache', 'eta')
+TABLE_FILE = 'eta.npy'
+INDEX_FILE = 'eta.json'
+STATE_FILE = 'eta_state.npz'
+
+METERS_PER_DEGREE = 111320.0
+WALKING_SPEED = 1.25  # meters per second: the mockups' "2 min • 150m"
+NO_PARENT = -1
+
+def load_graph(path=WALKWAY_FILE):
+    """(node names, coordinates, {(a, b): meters}, {place: node}) of a walkway file"""
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    names = list(data['nodes'])
+    coords = data['nodes']
+    lat0 = sum(lat for lat, _ in coords.values()) / len(coords)
+    lng_scale = METERS_PER_DEGREE * math.cos(math.radians(lat0))
+    edges = {}
+    for edge in data['edges']:
+        a, b = sorted(edge[:2])
+        if len(edge) > 2:
+            meters = float(edge[2])
+        else:
+            (lat_a, lng_a), (lat_b, lng_b) = coords[a], coords[b]
+            meters = math.hypot((lat_a - lat_b) * METERS_PER_DEGREE, (lng_a - lng_b) * lng_scale)
+        edges[(a, b)] = round(meters, 3)
+    return names, coords, edges, data['places']
+
+def sync_walkways(campus_id='isulan', path=WALKWAY_FILE):
+    """Rewrite the walkway file from the live map mockup's roads and buildings"""
+    from building_resolver import mockup_projection
+    from create_mockups import LIVE_MAP_BUILDINGS, LIVE_MAP_ROADS_X, LIVE_MAP_ROADS_Y
+    place = mockup_projection(campus_id)
+    x_span, y_span = (30, 370), (70, 680)
+    # Points on each road: ends, crossings and the doors that join it
+    horizontal = {y: {x_span[0], x_span[1], *LIVE_MAP_ROADS_X} for y in LIVE_MAP_ROADS_Y}
+    vertical = {x: {y_span[0], y_span[1], *LIVE_MAP_ROADS_Y} for x in LIVE_MAP_ROADS_X}
+    points = {}
+    edges = []
+    places = {}
+    doors = [(label.replace('\n', ' '), ((x1 + x2) // 2, y2)) for x1, y1, x2, y2, label in LIVE_MAP_BUILDINGS]
+    for name, (x, y) in doors:
+        # A path from the door straight to the nearest road
+        road_y = min(LIVE_MAP_ROADS_Y, key=lambda r: abs(r - y))
+        road_x = min(LIVE_MAP_ROADS_X, key=lambda r: abs(r - x))
+        join = (x, road_y) if abs(road_y - y) <= abs(road_x - x) else (road_x, y)
+        (horizontal[road_y] if join[1] == road_y else vertical[road_x]).add(join[0] if join[1] == road_y else join[1])
+        door = 'door:' + name.lower().replace(' ', '-')
+        points[door] = place(x, y)
+        edges.append([door, f"road:{join[0]},{join[1]}"])
+        places[name] = door
+    for y, xs in horizontal.items():
+        xs = sorted(xs)
+        edges += [[f"road:{a},{y}", f"road:{b},{y}"] for a, b in zip(xs, xs[1:])]
+        points.update({f"road:{x},{y}": place(x, y) for x in xs})
+    for x, ys in vertical.items():
+        ys = sorted(ys)
+        edges += [[f"road:{x},{a}", f"road:{x},{b}"] for a, b in zip(ys, ys[1:])]
+        points.update({f"road:{x},{y}": place(x, y) for y in ys})
+    # The main gate at the south end of the second north-south road
+    points['gate:main'] = place(LIVE_MAP_ROADS_X[1], y_span[1] + 10)
+    edges.append(['gate:main', f"road:{LIVE_MAP_ROADS_X[1]},{y_span[1]}"])
+    places['Main Gate'] = 'gate:main'
+
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('{"nodes": {\n')
+        f.write(',\n'.join(f"  {json.dumps(name)}: {json.dumps(list(points[name]))}" for name in sorted(points)))
+        f.write('\n},\n"edges": [\n')
+        f.write(',\n'.join(f"  {json.dumps(edge)}" for edge in edges))
+        f.write('\n],\n"places": ')
+        f.write(json.dumps(places, indent=2))
+        f.write('}\n')
+    return len(points), len(edges), len(places)
+
+def adjacency(names, edges):
+    index = {name: i for i, name in enumerate(names)}
+    neighbors = [[] for _ in names]
+    for (a, b), meters in edges.items():
+        neighbors[index[a]].append((index[b], meters))
+        neighbors[index[b]].append((index[a], meters))
+    return neighbors
+
+def dijkstra(neighbors, source):
+    """(meters to every node, parent of every node in the shortest-path tree)"""
+    dist = np.full(len(neighbors), np.inf)
+    parent = np.full(len(neighbors), NO_PARENT, dtype=np.int32)
+    dist[source] = 0.0
+    heap = [(0.0, source)]
+    done = bytearray(len(neighbors))
+    while heap:
+        d, node = heapq.heappop(heap)
+        if done[node]:
+            continue
+        done[node] = 1
+        for other, meters in neighbors[node]:
+            nd = d + meters
+            if nd < dist[other]:
+                dist[other] = nd
+                parent[other] = node
+                heapq.heappush(heap, (nd, other))
+    return dist, parent
+
+def read_previous(out_dir):
+    """(index, node distances, parents) of the last build, or None"""
+    try:
+        with open(os.path.join(out_dir, INDEX_FILE), encoding='utf-8') as f:
+            index = json.load(f)
+        with np.load(os.path.join(out_dir, STATE_FILE)) as state:
+            return index, state['dist'], state['parent']
+    except (FileNotFoundError, KeyError, ValueError):
+        return None
+
+def subtree(parent, roots):
+    """Mask of the roots and every node below them in a shortest-path tree"""
+    up = np.where(parent >= 0, parent, np.arange(len(parent)))
+    mark = np.zeros(len(parent), dtype=bool)
+    mark[roots] = True
+    # Pointer jumping: after k rounds each node has checked its ancestors up to 2**k levels
+    while True:
+        mark |= mark[up]
+        jumped = up[up]
+        if np.array_equal(jumped, up):
+            return mark
+        up = jumped
+
+def repair(neighbors, dist, parent, invalid, shorter):
+    """Fix one search's distances in place after edge changes; returns the nodes relabelled
+
+    invalid marks the nodes whose tree path used a removed or lengthened edge;
+    shorter lists the (a, b, meters) edges that were added or shortened. Every
+    other label is still the length of a path that exists, so relaxing from
+    the edges that can now improve a label gives exact distances again.
+    """
+    dist[invalid] = np.inf
+    parent[invalid] = NO_PARENT
+    heap = []
+
+    def relax(node, other, meters):
+        if dist[node] + meters < dist[other]:
+            dist[other] = dist[node] + meters
+            parent[other] = node
+            heapq.heappush(heap, (dist[other], other))
+
+    for node in np.flatnonzero(invalid).tolist():
+        for other, meters in neighbors[node]:
+            if not invalid[other]:
+                relax(other, node, meters)
+    for a, b, meters in shorter:
+        relax(a, b, meters)
+        relax(b, a, meters)
+    relabelled = 0
+    while heap:
+        d, node = heapq.heappop(heap)
+        if d > dist[node]:
+            continue
+        relabelled += 1
+        for other, meters in neighbors[node]:
+            relax(node, other, meters)
+    return relabelled
+
+def build(path=WALKWAY_FILE, out_dir=ETA_DIR, force=False):
+    """Update the table for the walkway file; returns (rows searched, rows repaired, nodes relabelled)"""
+    names, _, edges, places = load_graph(path)
+    order = list(places)
+    previous = None if force else read_previous(out_dir)
+
+    if previous is None:
+        neighbors = adjacency(names, edges)
+        node_index = {name: i for i, name in enumerate(names)}
+        rows = [dijkstra(neighbors, node_index[places[place]]) for place in order]
+        dist = np.array([d for d, _ in rows]).reshape(len(order), len(names))
+        parent = np.array([p for _, p in rows], dtype=np.int32).reshape(len(order), len(names))
+        searched, repaired, relabelled = order, [], 0
+    else:
+        dist, parent, searched, repaired, relabelled = update(previous, names, edges, places)
+
+    node_index = {name: i for i, name in enumerate(names)}
+    targets = np.array([node_index[places[place]] for place in order], dtype=np.intp)
+    meters = dist[:, targets].astype(np.float32)
+    table = np.stack([meters, meters / np.float32(WALKING_SPEED)])
+
+    os.makedirs(out_dir, exist_ok=True)
+    write_npy(os.path.join(out_dir, STATE_FILE), lambda f: np.savez(f, dist=dist, parent=parent))
+    write_npy(os.path.join(out_dir, TABLE_FILE), lambda f: np.save(f, table))
+    index = {'places': order, 'place_nodes': places, 'nodes': names,
+             'edges': {f"{a}|{b}": m for (a, b), m in edges.items()}}
+    tmp = os.path.join(out_dir, f"{INDEX_FILE}.{os.getpid()}.tmp")
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(index, f)
+    os.replace(tmp, os.path.join(out_dir, INDEX_FILE))
+    return searched, repaired, relabelled
+
+def update(previous, names, edges, places):
+    """The last build's searches brought up to date with the changed graph"""
+    index, old_dist, old_parent = previous
+    # Work over the old nodes followed by the new ones; removed nodes keep no edges
+    old_names = index['nodes']
+    known = set(old_names)
+    space = old_names + [name for name in names if name not in known]
+    position = {name: i for i, name in enumerate(space)}
+    neighbors = adjacency(space, edges)
+
+    old_edges = {tuple(key.split('|')): meters for key, meters in index['edges'].items()}
+    longer = [(position[a], position[b]) for (a, b), meters in old_edges.items()
+              if edges.get((a, b), math.inf) > meters]
+    shorter = [(position[a], position[b], meters) for (a, b), meters in edges.items()
+               if meters < old_edges.get((a, b), math.inf)]
+
+    old_rows = {place: r for r, place in enumerate(index['places'])}
+    order = list(places)
+    dist = np.empty((len(order), len(space)))
+    parent = np.empty((len(order), len(space)), dtype=np.int32)
+    searched, repaired, relabelled = [], [], 0
+    for r, place in enumerate(order):
+        source = position[places[place]]
+        if place not in old_rows or index['place_nodes'][place] != places[place]:
+            dist[r], parent[r] = dijkstra(neighbors, source)
+            searched.append(place)
+            continue
+        dist[r, :len(old_names)] = old_dist[old_rows[place]]
+        dist[r, len(old_names):] = np.inf
+        parent[r, :len(old_names)] = old_parent[old_rows[place]]
+        parent[r, len(old_names):] = NO_PARENT
+        d, p = dist[r], parent[r]
+        # Tree edges that got longer or went away cut off the subtree below them
+        cut = [b for a, b in longer if p[b] == a] + [a for a, b in longer if p[a] == b]
+        tense = [(a, b, m) for a, b, m in shorter if d[a] + m < d[b] or d[b] + m < d[a]]
+        if cut or tense:
+            relabelled += repair(neighbors, d, p, subtree(p, cut) if cut else np.zeros(len(space), dtype=bool),
+                                 tense)
+            repaired.append(place)
+
+    # Back to the new node order
+    columns = np.array([position[name] for name in names], dtype=np.intp)
+    remap = np.full(len(space) + 1, NO_PARENT, dtype=np.int32)  # the spare last slot keeps NO_PARENT
+    remap[columns] = np.arange(len(names), dtype=np.int32)
+    return dist[:, columns], remap[parent[:, columns]], searched, repaired, relabelled
+
+def write_npy(path, save):
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, 'wb') as f:
+        save(f)
+    os.replace(tmp, path)
+
+class EtaTable:
+    """Memory-mapped lookups in a built table"""
+
+    def __init__(self, out_dir=ETA_DIR):
+        with open(os.path.join(out_dir, INDEX_FILE), encoding='utf-8') as f:
+            self.places = json.load(f)['places']
+        self.index = {place: i for i, place in enumerate(self.places)}
+        self.table = np.load(os.path.join(out_dir, TABLE_FILE), mmap_mode='r')
+
+    def lookup(self, origin, destination):
+        """(meters, seconds) of the walk, inf when unreachable"""
+        i, j = self.index[origin], self.index[destination]
+        return float(self.table[0, i, j]), float(self.table[1, i, j])
+
+    def label(self, origin, destination):
+        """The app's ETA line, like "2 min • 150m\""""
+        meters, seconds = self.lookup(origin, destination)
+        if math.isinf(meters):
+            return "No walkway"
+        return f"{max(1, round(seconds / 60))} min • {meters:.0f}m"
+
+def verify(path=WALKWAY_FILE, out_dir=ETA_DIR):
+    """Largest difference between the stored table and a full recomputation"""
+    names, _, edges, places = load_graph(path)
+    neighbors = adjacency(names, edges)
+    node_index = {name: i for i, name in enumerate(names)}
+    table = EtaTable(out_dir)
+    worst = 0.0
+    for origin in table.places:
+        dist, _ = dijkstra(neighbors, node_index[places[origin]])
+        for destination in table.places:
+            expected = dist[node_index[places[destination]]]
+            got = table.lookup(origin, destination)[0]
+            if math.isinf(expected) or math.isinf(got):
+                worst = max(worst, 0.0 if math.isinf(expected) == math.isinf(got) else math.inf)
+            else:
+                worst = max(worst, abs(got - expected))
+    return worst
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build and query the campus walking ETA table")
+    parser.add_argument("--walkways", default=WALKWAY_FILE)
+    parser.add_argument("--out", default=ETA_DIR, help="table directory")
+    parser.add_argument("--force", action="store_true", help="search every row again")
+    parser.add_argument("--from", dest="origin", help="place to look up from")
+    parser.add_argument("--to", dest="destination", help="place to look up to")
+    parser.add_argument("--verify", action="store_true", help="compare the table with a full recomputation")
+    parser.add_argument("--bench", type=int, metavar="N", help="time N random lookups")
+    parser.add_argument("--sync", action="store_true", help="regenerate the walkway file from the mockup")
+    args = parser.parse_args()
+
+    if args.sync:
+        print("Wrote {} nodes, {} edges, {} places to {}".format(*sync_walkways(path=args.walkways), args.walkways))
+    if args.origin or args.destination:
+        if not (args.origin and args.destination):
+            parser.error("give both --from and --to")
+        table = EtaTable(args.out)
+        print(table.label(args.origin, args.destination))
+    elif not args.bench:
+        start = time.perf_counter()
+        searched, repaired, relabelled = build(args.walkways, args.out, args.force)
+        print(f"Searched {len(searched)} rows, repaired {len(repaired)} ({relabelled} nodes relabelled) "
+              f"in {(time.perf_counter() - start) * 1000:.1f} ms")
+    if args.verify:
+        worst = verify(args.walkways, args.out)
+        print(f"Largest difference from a full recomputation: {worst:.6f} m")
+        if worst > 0.01:
+            sys.exit(1)
+    if args.bench:
+        table = EtaTable(args.out)
+        rng = random.Random(0)
+        pairs = [(rng.choice(table.places), rng.choice(table.places)) for _ in range(args.bench)]
+        start = time.perf_counter()
+        for origin, destination in pairs:
+            table.lookup(origin, destination)
+        elapsed = time.perf_counter() - start
+        print(f"{args.bench} lookups: {elapsed / args.bench * 1e6:.2f} us each")
@@ -4,7 +4,10 @@ Creates wireframe mockups for the UniTrack app
 """
 
 from PIL import Image, ImageDraw, ImageFont
+import argparse
+import io
 import os
+import time
 
 # Colors
 WHITE = (255, 255, 255)
@@ -17,6 +20,156 @@ GRAY = (128, 128, 128)
 LIGHT_GRAY = (240, 240, 240)
 RED = (220, 53, 69)
 ORANGE = (255, 165, 0)
+MAP_GREEN = (220, 235, 220)
+
+# Palettes applied by use_theme(); "light" is the palette above
+THEMES = {
+    "light": {
+        "WHITE": WHITE, "BLACK": BLACK, "DARK_BLUE": DARK_BLUE,
+        "LIGHT_BLUE": LIGHT_BLUE, "GREEN": GREEN, "LIGHT_GREEN": LIGHT_GREEN,
+        "GRAY": GRAY, "LIGHT_GRAY": LIGHT_GRAY, "RED": RED, "ORANGE": ORANGE,
+        "MAP_GREEN": MAP_GREEN,
+    },
+    "dark": {
+        "WHITE": (44, 44, 48), "BLACK": (235, 235, 235), "DARK_BLUE": (110, 165, 230),
+        "LIGHT_BLUE": (38, 58, 88), "GREEN": (64, 196, 120), "LIGHT_GREEN": (28, 62, 42),
+        "GRAY": (160, 160, 160), "LIGHT_GRAY": (22, 22, 24), "RED": (240, 98, 110),
+        "ORANGE": (255, 183, 77), "MAP_GREEN": (30, 48, 36),
+    },
+}
+
+# Settings read by new_canvas() and draw_bottom_nav(); set through render_screen()
+RENDER_SETTINGS = {"scale": 1, "theme": "light", "active_tab": None, "quality": "draft"}
+
+# Quality presets: supersampling factor applied to curves and diagonal lines only
+QUALITY_PRESETS = {"draft": 1, "standard": 2, "print": 4}
+
+DEFAULT_FONT_SIZE = 10
+_font_cache = {}
+
+def use_theme(name):
+    """Rebind the module color constants to the named palette"""
+    globals().update(THEMES[name])
+    RENDER_SETTINGS["theme"] = name
+
+def get_font(size):
+    """Return the default font at the given pixel size (cached)"""
+    if size not in _font_cache:
+        _font_cache[size] = ImageFont.load_default(size=size)
+    return _font_cache[size]
+
+class ScaledDraw:
+    """ImageDraw wrapper that maps mockup coordinates onto a scaled canvas.
+
+    With supersample > 1 (and the target image given), curved shapes and
+    diagonal lines are redrawn at k x resolution inside their own bounding
+    box and downsampled with Image.reduce(); everything else is drawn
+    directly, so the extra cost is proportional to the curved area only.
+    """
+
+    def __init__(self, draw, scale, image=None, supersample=1):
+        self.draw = draw
+        self.scale = scale
+        self.image = image
+        self.supersample = supersample if image is not None else 1
+        self.font = get_font(DEFAULT_FONT_SIZE * scale)
+
+    def _xy(self, xy):
+        s = self.scale
+        if xy and isinstance(xy[0], (tuple, list)):
+            return [(x * s, y * s) for x, y in xy]
+        return [v * s for v in xy]
+
+    def _patch(self, box, paint):
+        """Repaint a pixel box at supersampled resolution and downsample it in place"""
+        k = self.supersample
+        x0, y0 = max(int(box[0]), 0), max(int(box[1]), 0)
+        x1, y1 = min(int(box[2]) + 1, self.image.width), min(int(box[3]) + 1, self.image.height)
+        if x1 <= x0 or y1 <= y0:
+            return
+        big = self.image.crop((x0, y0, x1, y1)).resize(((x1 - x0) * k, (y1 - y0) * k), Image.NEAREST)
+        paint(ImageDraw.Draw(big), x0, y0, k)
+        self.image.paste(big.reduce(k), (x0, y0))
+
+    @staticmethod
+    def _box_hi(box, x0, y0, k):
+        """Map an inclusive pixel box into patch coordinates at k x"""
+        return [(box[0] - x0) * k, (box[1] - y0) * k,
+                (box[2] - x0 + 1) * k - 1, (box[3] - y0 + 1) * k - 1]
+
+    @staticmethod
+    def _points_hi(points, x0, y0, k):
+        """Map pixel-center points into patch coordinates at k x"""
+        c = (k - 1) / 2
+        return [((x - x0) * k + c, (y - y0) * k + c) for x, y in points]
+
+    def rectangle(self, xy, fill=None, outline=None, width=1):
+        self.draw.rectangle(self._xy(xy), fill=fill, outline=outline, width=width * self.scale)
+
+    def rounded_rectangle(self, xy, radius=0, fill=None, outline=None, width=1):
+        box, radius, width = self._xy(xy), radius * self.scale, width * self.scale
+        if self.supersample == 1 or radius <= 0:
+            self.draw.rounded_rectangle(box, radius=radius, fill=fill, outline=outline, width=width)
+            return
+        # Only the four corners are curved: keep their backgrounds, draw the
+        # shape aliased, then repaint each corner from its saved background
+        edge = min(radius + width + 1, (box[2] - box[0]) // 2 + 1, (box[3] - box[1]) // 2 + 1)
+        corners = [(box[0], box[1]), (box[2] - edge + 1, box[1]),
+                   (box[0], box[3] - edge + 1), (box[2] - edge + 1, box[3] - edge + 1)]
+        corners = [(int(cx), int(cy), int(cx) + edge - 1, int(cy) + edge - 1) for cx, cy in corners]
+        saved = [(c, self.image.crop((c[0], c[1], c[2] + 1, c[3] + 1))) for c in corners]
+        self.draw.rounded_rectangle(box, radius=radius, fill=fill, outline=outline, width=width)
+
+        def paint(d, x0, y0, k):
+            d.rounded_rectangle(self._box_hi(box, x0, y0, k), radius=radius * k, fill=fill,
+                                outline=outline, width=width * k)
+
+        for corner, background in saved:
+            self.image.paste(background, corner[:2])
+            self._patch(corner, paint)
+
+    def ellipse(self, xy, fill=None, outline=None, width=1):
+        box, width = self._xy(xy), width * self.scale
+        if self.supersample == 1:
+            self.draw.ellipse(box, fill=fill, outline=outline, width=width)
+            return
+        self._patch(box, lambda d, x0, y0, k: d.ellipse(self._box_hi(box, x0, y0, k), fill=fill,
+                                                        outline=outline, width=width * k))
+
+    def line(self, xy, fill=None, width=0):
+        points, width = self._xy(xy), width * self.scale
+        diagonal = any(a[0] != b[0] and a[1] != b[1] for a, b in zip(points, points[1:]))
+        if self.supersample == 1 or not diagonal:
+            self.draw.line(points, fill=fill, width=width)
+            return
+        pad = width // 2 + 2
+        box = (min(p[0] for p in points) - pad, min(p[1] for p in points) - pad,
+               max(p[0] for p in points) + pad, max(p[1] for p in points) + pad)
+        self._patch(box, lambda d, x0, y0, k: d.line(self._points_hi(points, x0, y0, k), fill=fill,
+                                                     width=width * k))
+
+    def polygon(self, xy, fill=None, outline=None, width=1):
+        points, width = self._xy(xy), width * self.scale
+        if self.supersample == 1:
+            self.draw.polygon(points, fill=fill, outline=outline, width=width)
+            return
+        box = (min(p[0] for p in points) - 1, min(p[1] for p in points) - 1,
+               max(p[0] for p in points) + 1, max(p[1] for p in points) + 1)
+        self._patch(box, lambda d, x0, y0, k: d.polygon(self._points_hi(points, x0, y0, k), fill=fill,
+                                                        outline=outline, width=width * k))
+
+    def text(self, xy, text, fill=None):
+        self.draw.text(self._xy(xy), text, fill=fill, font=self.font, spacing=4 * self.scale)
+
+def new_canvas(width, height, background):
+    """Create a mockup image and drawing context honouring RENDER_SETTINGS"""
+    scale = RENDER_SETTINGS["scale"]
+    supersample = QUALITY_PRESETS[RENDER_SETTINGS["quality"]]
+    img = Image.new('RGB', (width * scale, height * scale), background)
+    draw = ImageDraw.Draw(img)
+    if scale != 1 or supersample != 1:
+        draw = ScaledDraw(draw, scale, img, supersample)
+    return img, draw
 
 def draw_phone_frame(draw, width, height):
     """Draw phone frame"""
@@ -32,6 +185,8 @@ def draw_phone_frame(draw, width, height):
 
 def draw_bottom_nav(draw, width, height, active=0):
     """Draw bottom navigation bar"""
+    if RENDER_SETTINGS["active_tab"] is not None:
+        active = RENDER_SETTINGS["active_tab"]
     nav_y = height - 100
     draw.rectangle([20, nav_y, width-20, height-50], fill=WHITE, outline=LIGHT_GRAY)
     
@@ -46,11 +201,36 @@ def draw_bottom_nav(draw, width, height, active=0):
         draw.text((x-10, nav_y + 15), icon, fill=color)
         draw.text((x-20, nav_y + 45), label, fill=color)
 
+def status_color(status):
+    """Badge color for a faculty availability status"""
+    return {
+        "Available": GREEN, "In Class": ORANGE, "Teaching": ORANGE, "Busy": ORANGE,
+        "On Break": ORANGE, "Meeting": RED, "In Meeting": RED, "Do Not Disturb": RED,
+    }.get(status, GRAY)
+
+def draw_status_badge(draw, box, status, color, max_chars=6):
+    """Draw a filled status pill with its (truncated) label"""
+    draw.rounded_rectangle(box, radius=10, fill=color)
+    draw.text((box[0]+5, box[1]+5), status[:max_chars], fill=WHITE)
+
+def draw_faculty_row(draw, left, y, right, name, dept, status, color, max_chars=6):
+    """Draw a directory card (avatar, name, department, status badge, navigate arrow)"""
+    draw.rounded_rectangle([left, y, right, y+80], radius=12, fill=WHITE)
+    # Avatar
+    draw.ellipse([left+15, y+15, left+60, y+60], fill=LIGHT_BLUE, outline=DARK_BLUE, width=2)
+    # Info
+    draw.text((left+75, y+15), name, fill=BLACK)
+    draw.text((left+75, y+40), dept, fill=GRAY)
+    # Status badge
+    badge_width = max(75, 8 * max_chars)
+    draw_status_badge(draw, [right-15-badge_width, y+25, right-15, y+50], status, color, max_chars)
+    # Navigate button
+    draw.text((right-10, y+30), "→", fill=DARK_BLUE)
+
 def create_staff_dashboard():
     """Create Staff Module Dashboard mockup"""
     width, height = 400, 800
-    img = Image.new('RGB', (width, height), LIGHT_GRAY)
-    draw = ImageDraw.Draw(img)
+    img, draw = new_canvas(width, height, LIGHT_GRAY)
     
     draw_phone_frame(draw, width, height)
     
@@ -103,8 +283,7 @@ def create_staff_dashboard():
 def create_student_directory():
     """Create Student Directory mockup"""
     width, height = 400, 800
-    img = Image.new('RGB', (width, height), LIGHT_GRAY)
-    draw = ImageDraw.Draw(img)
+    img, draw = new_canvas(width, height, LIGHT_GRAY)
     
     draw_phone_frame(draw, width, height)
     
@@ -139,52 +318,45 @@ def create_student_directory():
     y_start = 245
     for i, (name, dept, status, color) in enumerate(faculty):
         y = y_start + i * 90
-        draw.rounded_rectangle([40, y, width-40, y+80], radius=12, fill=WHITE)
-        # Avatar
-        draw.ellipse([55, y+15, 100, y+60], fill=LIGHT_BLUE, outline=DARK_BLUE, width=2)
-        # Info
-        draw.text((115, y+15), name, fill=BLACK)
-        draw.text((115, y+40), dept, fill=GRAY)
-        # Status badge
-        draw.rounded_rectangle([width-130, y+25, width-55, y+50], radius=10, fill=color)
-        draw.text((width-125, y+30), status[:6], fill=WHITE)
-        # Navigate button
-        draw.text((width-50, y+30), "→", fill=DARK_BLUE)
+        draw_faculty_row(draw, 40, y, width-40, name, dept, status, color)
     
     draw_bottom_nav(draw, width, height, active=0)
     
     return img
 
+# Live map area, road grid and building footprints (x1, y1, x2, y2, label) on the
+# 400x800 screen; building_resolver and campus_eta map them onto the campus for
+# campus_data/buildings.json and campus_data/walkways.json
+LIVE_MAP_AREA = (20, 60, 380, 690)
+LIVE_MAP_ROADS_Y = [100 + i * 120 for i in range(5)]  # horizontal roads, x from 30 to 370
+LIVE_MAP_ROADS_X = [60 + i * 90 for i in range(4)]    # vertical roads, y from 70 to 680
+LIVE_MAP_BUILDINGS = [
+    (50, 120, 140, 200, "Admin\nBuilding"),
+    (160, 120, 250, 200, "IT\nBuilding"),
+    (260, 120, 350, 200, "Library"),
+    (50, 320, 140, 400, "Canteen"),
+    (160, 320, 250, 400, "Gym"),
+    (260, 320, 350, 400, "Science\nBuilding"),
+]
+
 def create_live_map():
     """Create Live Map View mockup"""
     width, height = 400, 800
-    img = Image.new('RGB', (width, height), LIGHT_GRAY)
-    draw = ImageDraw.Draw(img)
+    img, draw = new_canvas(width, height, LIGHT_GRAY)
     
     draw_phone_frame(draw, width, height)
     
     # Map area (simulate map with grid)
-    draw.rectangle([20, 60, width-20, height-110], fill=(220, 235, 220))
+    draw.rectangle(LIVE_MAP_AREA, fill=MAP_GREEN)
     
     # Draw road grid
-    for i in range(5):
-        y = 100 + i * 120
+    for y in LIVE_MAP_ROADS_Y:
         draw.line([(30, y), (width-30, y)], fill=WHITE, width=8)
-    for i in range(4):
-        x = 60 + i * 90
+    for x in LIVE_MAP_ROADS_X:
         draw.line([(x, 70), (x, height-120)], fill=WHITE, width=8)
     
     # Buildings
-    buildings = [
-        (50, 120, 140, 200, "Admin\nBuilding"),
-        (160, 120, 250, 200, "IT\nBuilding"),
-        (260, 120, 350, 200, "Library"),
-        (50, 320, 140, 400, "Canteen"),
-        (160, 320, 250, 400, "Gym"),
-        (260, 320, 350, 400, "Science\nBuilding"),
-    ]
-    
-    for x1, y1, x2, y2, name in buildings:
+    for x1, y1, x2, y2, name in LIVE_MAP_BUILDINGS:
         draw.rectangle([x1, y1, x2, y2], fill=LIGHT_BLUE, outline=DARK_BLUE, width=2)
         draw.text((x1+10, y1+30), name, fill=DARK_BLUE)
     
@@ -226,13 +398,12 @@ def create_live_map():
 def create_navigation_screen():
     """Create Navigation Screen mockup"""
     width, height = 400, 800
-    img = Image.new('RGB', (width, height), LIGHT_GRAY)
-    draw = ImageDraw.Draw(img)
+    img, draw = new_canvas(width, height, LIGHT_GRAY)
     
     draw_phone_frame(draw, width, height)
     
     # Map with route
-    draw.rectangle([20, 60, width-20, height-110], fill=(220, 235, 220))
+    draw.rectangle([20, 60, width-20, height-110], fill=MAP_GREEN)
     
     # Draw simplified map
     for i in range(5):
@@ -285,8 +456,7 @@ def create_navigation_screen():
 def create_privacy_settings():
     """Create Privacy Settings mockup"""
     width, height = 400, 800
-    img = Image.new('RGB', (width, height), LIGHT_GRAY)
-    draw = ImageDraw.Draw(img)
+    img, draw = new_canvas(width, height, LIGHT_GRAY)
     
     draw_phone_frame(draw, width, height)
     
@@ -331,8 +501,7 @@ def create_privacy_settings():
 def create_admin_dashboard():
     """Create Admin Dashboard mockup"""
     width, height = 400, 800
-    img = Image.new('RGB', (width, height), LIGHT_GRAY)
-    draw = ImageDraw.Draw(img)
+    img, draw = new_canvas(width, height, LIGHT_GRAY)
     
     draw_phone_frame(draw, width, height)
     
@@ -394,8 +563,7 @@ def create_admin_dashboard():
 def create_login_screen():
     """Create Login Screen mockup"""
     width, height = 400, 800
-    img = Image.new('RGB', (width, height), WHITE)
-    draw = ImageDraw.Draw(img)
+    img, draw = new_canvas(width, height, WHITE)
     
     draw_phone_frame(draw, width, height)
     
@@ -437,23 +605,64 @@ def create_login_screen():
     
     return img
 
-def create_all_mockups():
+# Registered screens: name -> (output filename, builder)
+SCREENS = {
+    "login": ("01_login_screen.png", create_login_screen),
+    "staff_dashboard": ("02_staff_dashboard.png", create_staff_dashboard),
+    "student_directory": ("03_student_directory.png", create_student_directory),
+    "live_map": ("04_live_map.png", create_live_map),
+    "navigation": ("05_navigation.png", create_navigation_screen),
+    "privacy_settings": ("06_privacy_settings.png", create_privacy_settings),
+    "admin_dashboard": ("07_admin_dashboard.png", create_admin_dashboard),
+}
+
+def render_screen(name, scale=1, theme="light", active_tab=None, quality="draft"):
+    """Render a registered screen with the given scale, theme, active tab and quality"""
+    if quality not in QUALITY_PRESETS:
+        raise ValueError(f"unknown quality: {quality!r}")
+    previous = dict(RENDER_SETTINGS)
+    use_theme(theme)
+    RENDER_SETTINGS.update(scale=scale, active_tab=active_tab, quality=quality)
+    try:
+        return SCREENS[name][1]()
+    finally:
+        use_theme(previous["theme"])
+        RENDER_SETTINGS.update(previous)
+
+def render_png(name, scale=1, theme="light", active_tab=None, quality="draft"):
+    """Render a registered screen and return the encoded PNG bytes"""
+    buffer = io.BytesIO()
+    render_screen(name, scale, theme, active_tab, quality).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+def benchmark_quality(qualities=("draft", "standard", "print"), repeat=5, scale=1):
+    """Time every screen at each quality preset and report the overhead versus draft"""
+    results = {}
+    print(f"{'screen':<20}" + "".join(f"{q:>18}" for q in qualities))
+    for name in SCREENS:
+        row = {}
+        for quality in qualities:
+            best = float("inf")
+            for _ in range(repeat):
+                start = time.perf_counter()
+                render_screen(name, scale=scale, quality=quality)
+                best = min(best, time.perf_counter() - start)
+            row[quality] = best
+        results[name] = row
+        base = row[qualities[0]]
+        cells = [f"{row[q] * 1000:8.2f} ms" + (f" +{(row[q] / base - 1) * 100:4.0f}%" if q != qualities[0] else "      ")
+                 for q in qualities]
+        print(f"{name:<20}" + "".join(f"{c:>18}" for c in cells))
+    return results
+
+def create_all_mockups(quality="draft", scale=1, theme="light"):
     """Generate all mockups and save them"""
     mockups_dir = "mockups"
     os.makedirs(mockups_dir, exist_ok=True)
     
-    mockups = [
-        ("01_login_screen.png", create_login_screen()),
-        ("02_staff_dashboard.png", create_staff_dashboard()),
-        ("03_student_directory.png", create_student_directory()),
-        ("04_live_map.png", create_live_map()),
-        ("05_navigation.png", create_navigation_screen()),
-        ("06_privacy_settings.png", create_privacy_settings()),
-        ("07_admin_dashboard.png", create_admin_dashboard()),
-    ]
-    
     paths = []
-    for filename, img in mockups:
+    for name, (filename, _) in SCREENS.items():
+        img = render_screen(name, scale=scale, theme=theme, quality=quality)
         path = os.path.join(mockups_dir, filename)
         img.save(path)
         paths.append(path)
@@ -462,5 +671,16 @@ def create_all_mockups():
     return paths
 
 if __name__ == "__main__":
-    create_all_mockups()
-    print("\n✅ All mockups created successfully!")
+    parser = argparse.ArgumentParser(description="Generate UniTrack UI mockups")
+    parser.add_argument("--quality", choices=list(QUALITY_PRESETS), default="draft",
+                        help="anti-aliasing quality (supersampling of curves and diagonals)")
+    parser.add_argument("--scale", type=int, default=1, help="output scale factor")
+    parser.add_argument("--theme", choices=list(THEMES), default="light")
+    parser.add_argument("--bench", action="store_true", help="report render time per screen and quality")
+    args = parser.parse_args()
+
+    if args.bench:
+        benchmark_quality(scale=args.scale)
+    else:
+        create_all_mockups(quality=args.quality, scale=args.scale, theme=args.theme)
+        print("\n✅ All mockups created successfully!")
@@ -0,0 +1,174 @@
+"""
+UniTrack .docx Structural Diff
+Compares two .docx packages part by part and reports what changed
+
+Usage:
+    python docx_diff.py old.docx new.docx
+    python docx_diff.py old.docx new.docx --ignore-core     skip docProps/ metadata
+
+Parts whose zip CRC and size match are skipped without being decompressed.
+XML parts that differ are canonicalized (C14N) so attribute order and
+namespace declarations do not count, and the first differing element is
+reported by path. For word/document.xml the body is also compared block by
+block (paragraphs, tables) to show which content was added, removed or
+changed. Exits 1 when the documents differ, like diff.
+"""
+
+import argparse
+import difflib
+import sys
+import zipfile
+
+from lxml import etree
+
+DOCUMENT_PART = 'word/document.xml'
+CORE_PREFIX = 'docProps/'
+W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+
+def read_entries(path):
+    """{part name: ZipInfo} of a package"""
+    with zipfile.ZipFile(path) as package:
+        return {info.filename: info for info in package.infolist()}
+
+def read_part(path, name):
+    with zipfile.ZipFile(path) as package:
+        return package.read(name)
+
+def is_xml(name):
+    return name.endswith('.xml') or name.endswith('.rels')
+
+def canonical(data):
+    """C14N form of an XML part, or None if it does not parse"""
+    try:
+        return etree.tostring(etree.fromstring(data), method='c14n')
+    except etree.XMLSyntaxError:
+        return None
+
+def short_tag(element):
+    """w:p style name for an element"""
+    name = etree.QName(element).localname
+    return f"{element.prefix}:{name}" if element.prefix else name
+
+def element_path(element):
+    """/w:document/w:body/w:p[3] style path of an element"""
+    parts = []
+    while element is not None:
+        parent = element.getparent()
+        tag = short_tag(element)
+        if parent is not None:
+            same = [child for child in parent if child.tag == element.tag]
+            if len(same) > 1:
+                tag += f"[{same.index(element) + 1}]"
+        parts.append(tag)
+        element = parent
+    return '/' + '/'.join(reversed(parts))
+
+def first_difference(old, new):
+    """(path, description) of the first element that differs between two trees"""
+    if old.tag != new.tag:
+        return element_path(new), f"element {short_tag(old)} became {short_tag(new)}"
+    if dict(old.attrib) != dict(new.attrib):
+        changed = sorted(set(old.attrib.items()) ^ set(new.attrib.items()))
+        names = sorted({etree.QName(key).localname for key, _ in changed})
+        return element_path(new), f"attributes differ: {', '.join(names)}"
+    if (old.text or '').strip() != (new.text or '').strip():
+        return element_path(new), f"text {old.text!r} became {new.text!r}"
+    old_children, new_children = list(old), list(new)
+    for old_child, new_child in zip(old_children, new_children):
+        found = first_difference(old_child, new_child)
+        if found:
+            return found
+    if len(old_children) != len(new_children):
+        return element_path(new), f"{len(old_children)} children became {len(new_children)}"
+    return None
+
+def block_text(element):
+    return ''.join(element.itertext()).strip()
+
+def block_signature(element):
+    """One line describing a body child: its kind, style and text"""
+    tag = short_tag(element)
+    if tag == 'w:p':
+        style = element.find(f'{{{W_NS}}}pPr/{{{W_NS}}}pStyle')
+        label = style.get(f'{{{W_NS}}}val') if style is not None else 'Normal'
+        if element.find(f'.//{{{W_NS}}}drawing') is not None:
+            label += ', drawing'
+        return f"p[{label}] {block_text(element)[:80]}"
+    if tag == 'w:tbl':
+        rows = element.findall(f'{{{W_NS}}}tr')
+        cols = len(rows[0].findall(f'{{{W_NS}}}tc')) if rows else 0
+        return f"tbl[{len(rows)}x{cols}] {block_text(rows[0])[:60] if rows else ''}"
+    if tag == 'w:bookmarkStart':
+        return f"{tag} {element.get(f'{{{W_NS}}}name')}"
+    return tag
+
+def diff_body(old_root, new_root):
+    """Report lines for body blocks that were added, removed or changed"""
+    old_body = old_root.find(f'{{{W_NS}}}body')
+    new_body = new_root.find(f'{{{W_NS}}}body')
+    old_blocks = [etree.tostring(child, method='c14n') for child in old_body]
+    new_blocks = [etree.tostring(child, method='c14n') for child in new_body]
+    old_children, new_children = list(old_body), list(new_body)
+    lines = []
+    matcher = difflib.SequenceMatcher(None, old_blocks, new_blocks, autojunk=False)
+    for op, i1, i2, j1, j2 in matcher.get_opcodes():
+        if op == 'equal':
+            continue
+        lines.append(f"  @@ body blocks {i1 + 1}-{i2} -> {j1 + 1}-{j2} ({op})")
+        for child in old_children[i1:i2]:
+            lines.append(f"  - {block_signature(child)}")
+        for child in new_children[j1:j2]:
+            lines.append(f"  + {block_signature(child)}")
+    return lines
+
+def diff_docx(old_path, new_path, ignore_core=False):
+    """Report lines describing every difference between two packages; empty if equal"""
+    old_entries, new_entries = read_entries(old_path), read_entries(new_path)
+    names = set(old_entries) | set(new_entries)
+    if ignore_core:
+        names = {name for name in names if not name.startswith(CORE_PREFIX)}
+
+    lines = []
+    for name in sorted(names - set(new_entries)):
+        lines.append(f"removed part: {name}")
+    for name in sorted(names - set(old_entries)):
+        lines.append(f"added part: {name}")
+
+    for name in sorted(names & set(old_entries) & set(new_entries)):
+        old_info, new_info = old_entries[name], new_entries[name]
+        if old_info.CRC == new_info.CRC and old_info.file_size == new_info.file_size:
+            continue
+        old_data, new_data = read_part(old_path, name), read_part(new_path, name)
+        if old_data == new_data:
+            continue
+        if not is_xml(name):
+            lines.append(f"changed part: {name} ({len(old_data)} -> {len(new_data)} bytes)")
+            continue
+        old_c14n, new_c14n = canonical(old_data), canonical(new_data)
+        if old_c14n is not None and old_c14n == new_c14n:
+            continue
+        if old_c14n is None or new_c14n is None:
+            lines.append(f"changed part: {name} (not well-formed XML)")
+            continue
+        old_root, new_root = etree.fromstring(old_c14n), etree.fromstring(new_c14n)
+        found = first_difference(old_root, new_root)
+        path, detail = found or ('/', 'whitespace only')
+        lines.append(f"changed part: {name}")
+        lines.append(f"  first difference at {path}: {detail}")
+        if name == DOCUMENT_PART:
+            lines.extend(diff_body(old_root, new_root))
+    return lines
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Structurally compare two .docx files")
+    parser.add_argument("old")
+    parser.add_argument("new")
+    parser.add_argument("--ignore-core", action="store_true",
+                        help="ignore docProps/ (dates, revision, author)")
+    args = parser.parse_args()
+
+    report = diff_docx(args.old, args.new, ignore_core=args.ignore_core)
+    if report:
+        print("\n".join(report))
+        sys.exit(1)
+    print("No differences")
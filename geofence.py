@@ -0,0 +1,304 @@
+"""
+UniTrack Geofence Engine
+Batch campus point-in-polygon checks for the privacy check and "Campus Only" toggle
+
+Usage:
+    python geofence.py 6.6333 124.6091                 which campus a point is in
+    python geofence.py --verify                        compare against the app's scalar check
+    python geofence.py --bench 5000000
+    python geofence.py --sync                          refresh campus_data/campuses.json from the app
+
+The campus polygons (campus_data/campuses.json) mirror boundaryPoints in
+lib/core/constants/app_constants.dart. GeofenceIndex answers whole arrays of
+points with NumPy in three steps:
+
+1. A coarse grid over all campuses maps each point to the one campus whose
+   bounding box its cell touches, or to none. Points far from every campus
+   are rejected here.
+2. A fine grid over that campus's bounding box says whether the point's
+   cell is wholly inside, wholly outside, or crossed by the boundary.
+3. Only points in boundary cells run the exact crossing test, which uses
+   the same expression as LocationService.isWithinCampus, so results match
+   the app for every point.
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+
+import numpy as np
+
+CAMPUS_FILE = os.path.join('campus_data', 'campuses.json')
+APP_CONSTANTS = os.path.join('lib', 'core', 'constants', 'app_constants.dart')
+
+COARSE_CELLS = 512   # cells along the longer side of the region grid
+FINE_CELLS = 128     # cells along each side of a campus grid
+CELL_MARGIN = 0.01   # fraction of a cell added around it when testing edge crossings
+
+OUTSIDE, INSIDE, BOUNDARY = 0, 1, 2
+NO_CAMPUS, SEVERAL = -1, -2
+
+def load_campuses(path=CAMPUS_FILE):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)['campuses']
+
+def sync_campuses(dart_path=APP_CONSTANTS, path=CAMPUS_FILE):
+    """Rewrite the campus file from campusesData in app_constants.dart"""
+    with open(dart_path, encoding='utf-8') as f:
+        source = f.read()
+    block = source[source.index('campusesData'):]
+    block = block[:block.index('];')]
+    campuses = []
+    for entry in re.split(r"\n\s*\{", block)[1:]:
+        field = lambda name: re.search(rf"'{name}':\s*'?([^',\n]+)'?,", entry).group(1)
+        boundary = entry[entry.index("'boundaryPoints'"):]
+        points = re.findall(r"\[\s*(-?[\d.]+),\s*(-?[\d.]+)\s*\]", boundary)
+        campuses.append({'id': field('id'), 'name': field('name'),
+                         'center': [float(field('centerLat')), float(field('centerLng'))],
+                         'radiusMeters': float(field('radiusMeters')),
+                         'boundary': [[float(lat), float(lng)] for lat, lng in points]})
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('{"campuses": [\n')
+        f.write(',\n'.join(json.dumps(c) for c in campuses))
+        f.write('\n]}\n')
+    return campuses
+
+def crossings(lat, lng, polygon):
+    """Exact crossing-number test of point arrays against one [[lat, lng], ...] polygon"""
+    inside = np.zeros(lat.shape, dtype=bool)
+    for i in range(len(polygon)):
+        yi, xi = polygon[i]
+        yj, xj = polygon[(i + 1) % len(polygon)]
+        straddles = (lat < yi) != (lat < yj)
+        if not straddles.any():
+            continue
+        # Evaluated as in LocationService.isWithinCampus so edge points agree with the app
+        with np.errstate(divide='ignore', invalid='ignore'):
+            hit = straddles & (lng < (xj - xi) * (lat - yi) / (yj - yi) + xi)
+        inside ^= hit
+    return inside
+
+def within(lat, lng, polygon):
+    """The app's scalar isWithinCampus check, for reference"""
+    intersections = 0
+    for i in range(len(polygon)):
+        yi, xi = polygon[i]
+        yj, xj = polygon[(i + 1) % len(polygon)]
+        if (yi > lat) != (yj > lat) and lng < (xj - xi) * (lat - yi) / (yj - yi) + xi:
+            intersections += 1
+    return intersections % 2 == 1
+
+def segments_cross_cells(x0, y0, x1, y1, left, bottom, right, top):
+    """Which cells (arrays of box edges) a segment touches or passes through"""
+    overlap = ((np.minimum(x0, x1) <= right) & (np.maximum(x0, x1) >= left)
+               & (np.minimum(y0, y1) <= top) & (np.maximum(y0, y1) >= bottom))
+    # The segment's line separates the box unless all four corners are strictly on one side
+    side = [(x1 - x0) * (cy - y0) - (y1 - y0) * (cx - x0)
+            for cx, cy in ((left, bottom), (left, top), (right, bottom), (right, top))]
+    positive = (side[0] > 0) & (side[1] > 0) & (side[2] > 0) & (side[3] > 0)
+    negative = (side[0] < 0) & (side[1] < 0) & (side[2] < 0) & (side[3] < 0)
+    return overlap & ~positive & ~negative
+
+class GeofenceIndex:
+    """Grid index over several campus polygons; points are (lat, lng) arrays"""
+
+    def __init__(self, campuses, coarse_cells=COARSE_CELLS, fine_cells=FINE_CELLS):
+        self.campuses = campuses
+        self.ids = [campus['id'] for campus in campuses]
+        self.polygons = [np.asarray(campus['boundary'], dtype=np.float64) for campus in campuses]
+        self.bounds = np.array([[p[:, 0].min(), p[:, 1].min(), p[:, 0].max(), p[:, 1].max()]
+                                for p in self.polygons])
+        self.build_coarse(coarse_cells)
+        self.build_fine(fine_cells)
+
+    def build_coarse(self, cells):
+        lat0, lng0 = self.bounds[:, 0].min(), self.bounds[:, 1].min()
+        lat1, lng1 = self.bounds[:, 2].max(), self.bounds[:, 3].max()
+        self.cell = max(lat1 - lat0, lng1 - lng0) / cells
+        self.origin = (lat0, lng0)
+        self.shape = (int((lat1 - lat0) / self.cell) + 1, int((lng1 - lng0) / self.cell) + 1)
+        coarse = np.full(self.shape, NO_CAMPUS, dtype=np.int16)
+        for k, (b_lat0, b_lng0, b_lat1, b_lng1) in enumerate(self.bounds):
+            rows = slice(int((b_lat0 - lat0) / self.cell), int((b_lat1 - lat0) / self.cell) + 1)
+            cols = slice(int((b_lng0 - lng0) / self.cell), int((b_lng1 - lng0) / self.cell) + 1)
+            region = coarse[rows, cols]
+            region[:] = np.where(region == NO_CAMPUS, k, SEVERAL)
+        self.coarse = coarse
+
+    def build_fine(self, cells):
+        """One cells x cells grid of OUTSIDE/INSIDE/BOUNDARY per campus, stored end to end"""
+        self.fine_cells = cells
+        self.fine = np.empty((len(self.polygons), cells, cells), dtype=np.uint8)
+        self.fine_step = np.empty((len(self.polygons), 2))
+        for k, polygon in enumerate(self.polygons):
+            lat0, lng0, lat1, lng1 = self.bounds[k]
+            step = np.array([(lat1 - lat0) / cells, (lng1 - lng0) / cells])
+            self.fine_step[k] = step
+            rows, cols = np.mgrid[0:cells, 0:cells]
+            margin = step * CELL_MARGIN
+            bottom = lat0 + rows * step[0] - margin[0]
+            top = lat0 + (rows + 1) * step[0] + margin[0]
+            left = lng0 + cols * step[1] - margin[1]
+            right = lng0 + (cols + 1) * step[1] + margin[1]
+            boundary = np.zeros((cells, cells), dtype=bool)
+            for i in range(len(polygon)):
+                (y0, x0), (y1, x1) = polygon[i], polygon[(i + 1) % len(polygon)]
+                boundary |= segments_cross_cells(x0, y0, x1, y1, left, bottom, right, top)
+            # A cell no edge reaches is entirely on the side of its center
+            center = crossings(lat0 + (rows + 0.5) * step[0], lng0 + (cols + 0.5) * step[1], polygon)
+            self.fine[k] = np.where(boundary, BOUNDARY, np.where(center, INSIDE, OUTSIDE))
+
+    def locate(self, lat, lng, stats=None):
+        """Index of the campus containing each point (first in file order), or -1"""
+        lat = np.asarray(lat, dtype=np.float64)
+        lng = np.asarray(lng, dtype=np.float64)
+        result = np.full(lat.shape, NO_CAMPUS, dtype=np.int16)
+
+        # 1. Coarse grid: candidate campus per point
+        row = np.floor((lat - self.origin[0]) / self.cell)
+        col = np.floor((lng - self.origin[1]) / self.cell)
+        valid = (row >= 0) & (row < self.shape[0]) & (col >= 0) & (col < self.shape[1])
+        near = np.flatnonzero(valid)
+        candidate = self.coarse[row[near].astype(np.intp), col[near].astype(np.intp)]
+        several = near[candidate == SEVERAL]
+        keep = candidate >= 0
+        near, candidate = near[keep], candidate[keep]
+
+        # 2. Fine grid of the candidate: inside, outside or boundary
+        p_lat, p_lng = lat[near], lng[near]
+        bounds = self.bounds[candidate]
+        in_box = ((p_lat >= bounds[:, 0]) & (p_lat <= bounds[:, 2])
+                  & (p_lng >= bounds[:, 1]) & (p_lng <= bounds[:, 3]))
+        near, candidate = near[in_box], candidate[in_box]
+        step = self.fine_step[candidate]
+        last = self.fine_cells - 1
+        f_row = np.minimum(((lat[near] - bounds[in_box, 0]) / step[:, 0]).astype(np.intp), last)
+        f_col = np.minimum(((lng[near] - bounds[in_box, 1]) / step[:, 1]).astype(np.intp), last)
+        state = self.fine[candidate, f_row, f_col]
+        result[near[state == INSIDE]] = candidate[state == INSIDE]
+
+        # 3. Exact test for boundary cells, one campus at a time
+        edge = state == BOUNDARY
+        edge_points, edge_candidate = near[edge], candidate[edge]
+        for k in np.unique(edge_candidate):
+            points = edge_points[edge_candidate == k]
+            result[points[crossings(lat[points], lng[points], self.polygons[k])]] = k
+
+        # Cells where campus boxes overlap: every campus, in file order
+        for k in range(len(self.polygons) - 1, -1, -1):
+            if len(several):
+                result[several[crossings(lat[several], lng[several], self.polygons[k])]] = k
+
+        if stats is not None:
+            stats['points'] = stats.get('points', 0) + lat.size
+            stats['exact'] = stats.get('exact', 0) + len(edge_points) + len(several) * len(self.polygons)
+        return result
+
+    def contains(self, lat, lng, campus=None):
+        """Whether each point is inside any campus, or inside the campus with this id"""
+        located = self.locate(lat, lng)
+        if campus is None:
+            return located >= 0
+        return located == self.ids.index(campus)
+
+def reference_locate(lat, lng, campuses):
+    """locate() one point at a time with the app's scalar check"""
+    for k, campus in enumerate(campuses):
+        if within(lat, lng, campus['boundary']):
+            return k
+    return NO_CAMPUS
+
+def sample_points(campuses, count, rng, near_fraction=0.7):
+    """Test points: most within a few campus widths of a campus, the rest anywhere in the region"""
+    polygons = [np.asarray(c['boundary']) for c in campuses]
+    everything = np.vstack(polygons)
+    low, high = everything.min(axis=0) - 0.01, everything.max(axis=0) + 0.01
+    near = int(count * near_fraction)
+    which = rng.integers(0, len(polygons), near)
+    centers = np.array([p.mean(axis=0) for p in polygons])[which]
+    spread = np.array([np.ptp(p, axis=0).max() for p in polygons])[which]
+    points = np.vstack([centers + rng.normal(size=(near, 2)) * spread[:, None],
+                        rng.uniform(low, high, size=(count - near, 2))])
+    return points[:, 0], points[:, 1]
+
+def edge_points(campuses, per_edge, rng):
+    """Points on, and a hair either side of, every campus edge and vertex"""
+    lats, lngs = [], []
+    for campus in campuses:
+        polygon = np.asarray(campus['boundary'])
+        for i in range(len(polygon)):
+            a, b = polygon[i], polygon[(i + 1) % len(polygon)]
+            t = rng.uniform(0, 1, per_edge)
+            points = a + t[:, None] * (b - a)
+            for offset in (0.0, 1e-12, -1e-12, 1e-9, -1e-9):
+                lats.append(points[:, 0] + offset)
+                lngs.append(points[:, 1] - offset)
+            lats.append(polygon[:, 0])
+            lngs.append(polygon[:, 1])
+    return np.concatenate(lats), np.concatenate(lngs)
+
+def verify(index, campuses, count=200000, seed=0):
+    """Mismatches between the index and the scalar check over random and edge points"""
+    rng = np.random.default_rng(seed)
+    checks = [('random', sample_points(campuses, count, rng)),
+              ('edges', edge_points(campuses, 2000, rng))]
+    failures = 0
+    for name, (lat, lng) in checks:
+        got = index.locate(lat, lng)
+        expected = np.array([reference_locate(a, b, campuses) for a, b in zip(lat.tolist(), lng.tolist())])
+        bad = np.flatnonzero(got != expected)
+        failures += len(bad)
+        print(f"{name:<7} {lat.size:>8} points, {int((expected >= 0).sum()):>7} inside, {len(bad)} mismatches")
+        for i in bad[:5]:
+            print(f"  ({lat[i]!r}, {lng[i]!r}): index {got[i]}, reference {expected[i]}")
+    return failures
+
+def bench(index, campuses, count, repeat=5):
+    lat, lng = sample_points(campuses, count, np.random.default_rng(1))
+    stats = {}
+    index.locate(lat, lng, stats)
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        index.locate(lat, lng)
+        best = min(best, time.perf_counter() - start)
+    print(f"{count} points in {best * 1000:.1f} ms: {count / best / 1e6:.1f} M points/s, "
+          f"{stats['exact'] / stats['points']:.1%} needed the exact test")
+    start = time.perf_counter()
+    for polygon in index.polygons:
+        crossings(lat, lng, polygon)
+    brute = time.perf_counter() - start
+    print(f"every polygon, no index: {count / brute / 1e6:.1f} M points/s")
+    start = time.perf_counter()
+    sample = 20000
+    for a, b in zip(lat[:sample].tolist(), lng[:sample].tolist()):
+        reference_locate(a, b, campuses)
+    scalar = (time.perf_counter() - start) / sample
+    print(f"scalar check: {1 / scalar / 1e6:.2f} M points/s")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Campus geofence checks")
+    parser.add_argument("point", nargs="*", type=float, help="LAT LNG")
+    parser.add_argument("--campuses", default=CAMPUS_FILE)
+    parser.add_argument("--verify", action="store_true", help="check the index against the scalar test")
+    parser.add_argument("--bench", type=int, metavar="N", help="time N points")
+    parser.add_argument("--sync", action="store_true", help=f"regenerate the campus file from {APP_CONSTANTS}")
+    args = parser.parse_args()
+
+    if args.sync:
+        print(f"Wrote {len(sync_campuses(path=args.campuses))} campuses to {args.campuses}")
+    campuses = load_campuses(args.campuses)
+    index = GeofenceIndex(campuses)
+    if len(args.point) == 2:
+        k = int(index.locate([args.point[0]], [args.point[1]])[0])
+        print(campuses[k]['name'] if k >= 0 else "Not on a campus")
+    elif args.point:
+        parser.error("give a point as LAT LNG")
+    if args.verify and verify(index, campuses):
+        sys.exit(1)
+    if args.bench:
+        bench(index, campuses, args.bench)
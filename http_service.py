@@ -0,0 +1,90 @@
+"""
+UniTrack HTTP Service Base
+Minimal asyncio HTTP/1.1 server shared by the mockup and proposal services
+
+Handles keep-alive request parsing and response framing; subclasses implement
+dispatch(). Request bodies are read by Content-Length and discarded (no route
+takes one) so they cannot be parsed as the next request on the connection;
+chunked or malformed framing is rejected with 400 and a close. Bodies are written in chunks with a drain after each, so large
+responses stream to the client instead of being buffered in the transport.
+"""
+
+import asyncio
+
+REASONS = {200: "OK", 304: "Not Modified", 400: "Bad Request", 404: "Not Found",
+           405: "Method Not Allowed", 500: "Internal Server Error"}
+
+CHUNK_SIZE = 64 * 1024
+
+def etag_matches(if_none_match, etag):
+    """Whether an If-None-Match header matches etag (weak comparison, * matches any)"""
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag.removeprefix("W/"):
+            return True
+    return False
+
+async def discard_body(reader, length):
+    """Read and drop length bytes of request body"""
+    while length:
+        chunk = await reader.readexactly(min(length, CHUNK_SIZE))
+        length -= len(chunk)
+
+class HttpService:
+    """asyncio stream handler that parses requests and passes them to dispatch()"""
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                try:
+                    method, target, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    await self.respond(writer, 400, b"malformed request line", close=True)
+                    break
+                if "transfer-encoding" in headers:
+                    await self.respond(writer, 400, b"chunked request bodies are not supported", close=True)
+                    break
+                length = headers.get("content-length", "0")
+                if not length.isdigit():
+                    await self.respond(writer, 400, b"invalid Content-Length", close=True)
+                    break
+                await discard_body(reader, int(length))
+                keep_alive = (version == "HTTP/1.1" and headers.get("connection", "").lower() != "close")
+                await self.dispatch(writer, method, target, headers, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def dispatch(self, writer, method, target, headers, keep_alive):
+        raise NotImplementedError
+
+    async def respond(self, writer, status, body, content_type="text/plain; charset=utf-8",
+                      extra_headers=None, keep_alive=False, head_only=False, close=False):
+        lines = [f"HTTP/1.1 {status} {REASONS[status]}"]
+        if content_type and status != 304:
+            lines.append(f"Content-Type: {content_type}")
+        if status != 304:
+            lines.append(f"Content-Length: {len(body)}")
+        for name, value in (extra_headers or {}).items():
+            lines.append(f"{name}: {value}")
+        lines.append("Connection: " + ("keep-alive" if keep_alive and not close else "close"))
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+        if body and not head_only and status != 304:
+            view = memoryview(body)
+            for offset in range(0, len(view), CHUNK_SIZE):
+                writer.write(view[offset:offset + CHUNK_SIZE])
+                await writer.drain()
+        await writer.drain()
@@ -0,0 +1,217 @@
+"""
+UniTrack Kiosk Status Board
+Renders the 1920x1080 campus kiosk faculty board (proposal section 17) using the
+directory rows and status badges from create_mockups, and repaints only the rows
+whose status changed (dirty rectangles) instead of the whole frame.
+
+Usage:
+    python kiosk_board.py --out kiosk_board.png
+    python kiosk_board.py --bench 5000
+"""
+
+import argparse
+import io
+import random
+import time
+from collections import OrderedDict
+
+from PIL import Image, ImageDraw
+
+import create_mockups as mockups
+from create_mockups import ScaledDraw, draw_faculty_row, status_color
+
+BOARD_WIDTH, BOARD_HEIGHT = 1920, 1080
+SCALE = 2  # board is laid out in 960x540 mockup units and drawn at 2x
+
+HEADER_HEIGHT = 60
+COLUMNS = 3
+ROWS_PER_COLUMN = 5
+MARGIN = 20
+ROW_TOP = 75
+ROW_HEIGHT = 80
+ROW_PITCH = 90
+COLUMN_WIDTH = (BOARD_WIDTH // SCALE - 2 * MARGIN - (COLUMNS - 1) * MARGIN) // COLUMNS
+BADGE_CHARS = 14
+
+# Box (in mockup units) holding the "N available" counter in the header
+COUNTER_BOX = (BOARD_WIDTH // SCALE - 220, 15, BOARD_WIDTH // SCALE - MARGIN, 45)
+
+# (uid, display name, department, status); the board fills at most COLUMNS * ROWS_PER_COLUMN slots
+SAMPLE_FACULTY = [
+    ("faculty-santos", "Dr. Santos", "IT Department", "Available"),
+    ("faculty-garcia", "Prof. Garcia", "CS Department", "In Class"),
+    ("faculty-reyes", "Dr. Reyes", "IT Department", "Available"),
+    ("faculty-cruz", "Prof. Cruz", "Math Dept", "Meeting"),
+    ("faculty-mendoza", "Dr. Mendoza", "Education", "Available"),
+    ("faculty-villanueva", "Prof. Villanueva", "Engineering", "Teaching"),
+    ("faculty-ramos", "Dr. Ramos", "Nursing", "On Break"),
+    ("faculty-aquino", "Prof. Aquino", "CS Department", "Available"),
+    ("faculty-bautista", "Dr. Bautista", "Agriculture", "Out of Office"),
+    ("faculty-fernandez", "Prof. Fernandez", "Math Dept", "In Meeting"),
+    ("faculty-castillo", "Dr. Castillo", "Criminology", "Available"),
+    ("faculty-navarro", "Prof. Navarro", "IT Department", "Busy"),
+    ("faculty-dela-cruz", "Dr. Dela Cruz", "Education", "Do Not Disturb"),
+    ("faculty-torres", "Prof. Torres", "Engineering", "Available"),
+    ("faculty-lim", "Dr. Lim", "Admin Office", "Available"),
+]
+
+STATUSES = ["Available", "Busy", "In Meeting", "Teaching", "On Break", "Out of Office", "Do Not Disturb"]
+
+def slot_box(slot):
+    """Mockup-unit box (left, top, right, bottom) of a faculty row slot"""
+    column, row = divmod(slot, ROWS_PER_COLUMN)
+    left = MARGIN + column * (COLUMN_WIDTH + MARGIN)
+    top = ROW_TOP + row * ROW_PITCH
+    return (left, top, left + COLUMN_WIDTH, top + ROW_HEIGHT)
+
+def to_pixels(box):
+    """Convert a mockup-unit box to a pixel box on the board"""
+    return tuple(v * SCALE for v in box)
+
+def encode_png(img):
+    """Encode an image region for transport to the kiosk display"""
+    buffer = io.BytesIO()
+    img.save(buffer, format="PNG", compress_level=1)
+    return buffer.getvalue()
+
+class KioskBoard:
+    """Kiosk frame with per-row incremental repaint and dirty-region encoding"""
+
+    def __init__(self, faculty=SAMPLE_FACULTY, campus="SKSU ACCESS Campus", tile_cache_size=512):
+        if len(faculty) > COLUMNS * ROWS_PER_COLUMN:
+            raise ValueError(f"{len(faculty)} faculty do not fit the board's {COLUMNS * ROWS_PER_COLUMN} slots")
+        self.faculty = [list(entry) for entry in faculty]
+        # Slots are keyed by uid: two faculty may share a display name
+        self.slots = {entry[0]: i for i, entry in enumerate(self.faculty)}
+        if len(self.slots) != len(self.faculty):
+            raise ValueError("faculty uids must be unique")
+        self.campus = campus
+        self.tiles = OrderedDict()
+        self.tile_cache_size = tile_cache_size
+        self.dirty = OrderedDict()
+        self.img = Image.new('RGB', (BOARD_WIDTH, BOARD_HEIGHT), mockups.LIGHT_GRAY)
+        self.draw = ScaledDraw(ImageDraw.Draw(self.img), SCALE)
+        self.render_full()
+
+    def available_count(self):
+        return sum(1 for entry in self.faculty if entry[3] == "Available")
+
+    def row_tile(self, name, dept, status):
+        """Rendered (image, png) for one row, cached by its content"""
+        key = (name, dept, status)
+        tile = self.tiles.get(key)
+        if tile is not None:
+            self.tiles.move_to_end(key)
+            return tile
+        size = (COLUMN_WIDTH * SCALE, ROW_HEIGHT * SCALE)
+        img = Image.new('RGB', size, mockups.LIGHT_GRAY)
+        draw = ScaledDraw(ImageDraw.Draw(img), SCALE)
+        draw_faculty_row(draw, 0, 0, COLUMN_WIDTH, name, dept, status, status_color(status),
+                         max_chars=BADGE_CHARS)
+        tile = (img, encode_png(img))
+        self.tiles[key] = tile
+        if len(self.tiles) > self.tile_cache_size:
+            self.tiles.popitem(last=False)
+        return tile
+
+    def draw_header(self):
+        width = BOARD_WIDTH // SCALE
+        self.draw.rectangle([0, 0, width, HEADER_HEIGHT], fill=mockups.DARK_BLUE)
+        self.draw.text((MARGIN, 15), "UniTrack - Faculty Board", fill=mockups.WHITE)
+        self.draw.text((MARGIN, 35), self.campus, fill=mockups.LIGHT_BLUE)
+        self.draw_counter()
+
+    def draw_counter(self):
+        self.draw.rectangle(COUNTER_BOX, fill=mockups.DARK_BLUE)
+        self.draw.rounded_rectangle(COUNTER_BOX, radius=10, fill=mockups.GREEN)
+        self.draw.text((COUNTER_BOX[0] + 15, COUNTER_BOX[1] + 8),
+                       f"{self.available_count()} of {len(self.faculty)} available", fill=mockups.WHITE)
+
+    def draw_footer(self):
+        y = BOARD_HEIGHT // SCALE - 22
+        x = MARGIN
+        for status in ("Available", "Busy", "In Meeting", "Out of Office"):
+            self.draw.ellipse([x, y + 2, x + 10, y + 12], fill=status_color(status))
+            self.draw.text((x + 15, y), status, fill=mockups.GRAY)
+            x += 110
+
+    def render_full(self):
+        """Paint the whole frame; the only full repaint the board ever needs"""
+        self.draw.rectangle([0, 0, BOARD_WIDTH // SCALE, BOARD_HEIGHT // SCALE], fill=mockups.LIGHT_GRAY)
+        self.draw_header()
+        for slot, (_, name, dept, status) in enumerate(self.faculty):
+            self.img.paste(self.row_tile(name, dept, status)[0], to_pixels(slot_box(slot))[:2])
+        self.draw_footer()
+        self.dirty.clear()
+
+    def update_status(self, uid, status):
+        """Apply a status change; returns the dirty pixel boxes it produced"""
+        slot = self.slots.get(uid)
+        if slot is None:
+            raise KeyError(f"{uid!r} is not on this board")
+        entry = self.faculty[slot]
+        if entry[3] == status:
+            return []
+        was_available = entry[3] == "Available"
+        entry[3] = status
+        box = to_pixels(slot_box(slot))
+        self.img.paste(self.row_tile(*entry[1:])[0], box[:2])
+        self.dirty[box] = slot
+        boxes = [box]
+        if was_available != (status == "Available"):
+            self.draw_counter()
+            counter = to_pixels(COUNTER_BOX)
+            self.dirty[counter] = None
+            boxes.append(counter)
+        return boxes
+
+    def flush(self):
+        """Encode and clear the dirty regions: [(pixel box, png bytes)]"""
+        updates = []
+        for box, slot in self.dirty.items():
+            if slot is not None:
+                png = self.row_tile(*self.faculty[slot][1:])[1]
+            else:
+                png = encode_png(self.img.crop(box))
+            updates.append((box, png))
+        self.dirty.clear()
+        return updates
+
+    def frame_png(self):
+        """Encode the full frame (initial sync or display reconnect)"""
+        return encode_png(self.img)
+
+def benchmark(updates=5000, flush_every=1, seed=7):
+    """Measure sustained status updates per second, including dirty-region encoding"""
+    rng = random.Random(seed)
+    board = KioskBoard()
+    uids = [entry[0] for entry in board.faculty]
+    start = time.perf_counter()
+    full = board.frame_png()
+    full_seconds = time.perf_counter() - start
+
+    encoded = 0
+    start = time.perf_counter()
+    for i in range(updates):
+        board.update_status(rng.choice(uids), rng.choice(STATUSES))
+        if (i + 1) % flush_every == 0:
+            encoded += sum(len(png) for _, png in board.flush())
+    encoded += sum(len(png) for _, png in board.flush())
+    elapsed = time.perf_counter() - start
+
+    print(f"Full frame encode: {full_seconds * 1000:.1f} ms ({len(full) // 1024} KB)")
+    print(f"{updates} status updates in {elapsed:.3f}s -> {updates / elapsed:,.0f} updates/s")
+    print(f"Average dirty payload: {encoded / updates / 1024:.1f} KB per update")
+    return updates / elapsed
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render the UniTrack kiosk status board")
+    parser.add_argument("--out", default="kiosk_board.png", help="where to write the full frame")
+    parser.add_argument("--bench", type=int, metavar="UPDATES", help="run the update-rate benchmark")
+    args = parser.parse_args()
+
+    if args.bench:
+        benchmark(args.bench)
+    else:
+        KioskBoard().img.save(args.out)
+        print(f"Created: {args.out}")
@@ -0,0 +1,58 @@
+"""
+UniTrack Web Launch Images
+Renders the iOS startup images in web/icons from the app icon
+
+Usage:
+    python launch_images.py                  all sizes listed in web/index.html
+    python launch_images.py --size 640x1136
+
+Each image is the manifest background color with Icon-512.png scaled to 22%
+of the width, centered horizontally at 35% of the height, matching the
+images web/index.html links as apple-touch-startup-image.
+"""
+
+import argparse
+import os
+import re
+
+ICONS_DIR = os.path.join('web', 'icons')
+ICON_SOURCE = os.path.join(ICONS_DIR, 'Icon-512.png')
+INDEX_HTML = os.path.join('web', 'index.html')
+BACKGROUND = (26, 26, 46)  # manifest.json background_color #1a1a2e
+ICON_WIDTH = 0.22
+ICON_CENTER_Y = 0.35
+
+def launch_sizes(index_html=INDEX_HTML):
+    """(width, height) of every launch image index.html links, in page order"""
+    with open(index_html, encoding='utf-8') as f:
+        page = f.read()
+    return [(int(w), int(h)) for w, h in re.findall(r'icons/launch-(\d+)x(\d+)\.png', page)]
+
+def launch_path(size):
+    return os.path.join(ICONS_DIR, f"launch-{size[0]}x{size[1]}.png")
+
+def render_launch_image(size, source=ICON_SOURCE):
+    """The launch image for a (width, height) screen"""
+    from PIL import Image
+    width, height = size
+    side = int(width * ICON_WIDTH)
+    with Image.open(source) as icon:
+        icon = icon.convert('RGBA').resize((side, side), Image.LANCZOS)
+    img = Image.new('RGBA', size, BACKGROUND + (255,))
+    img.alpha_composite(icon, ((width - side) // 2, int(height * ICON_CENTER_Y) - side // 2))
+    return img
+
+def write_launch_image(size, path=None, source=ICON_SOURCE):
+    """Render and save one launch image; returns its path"""
+    path = path or launch_path(size)
+    render_launch_image(size, source).save(path, optimize=True)
+    return path
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render the UniTrack web launch images")
+    parser.add_argument("--size", action="append", help="WIDTHxHEIGHT (default: every size in web/index.html)")
+    args = parser.parse_args()
+
+    sizes = [tuple(int(n) for n in size.split('x')) for size in args.size] if args.size else launch_sizes()
+    for size in sizes:
+        print(f"Created: {write_launch_image(size)}")
@@ -0,0 +1,380 @@
+"""
+UniTrack Location Load Generator
+Simulates staff beacons writing to the locations collection on a Firestore emulator
+
+Usage:
+    firebase emulators:start --only firestore
+    python location_load.py --beacons 500 --interval 5 --duration 60
+    python location_load.py --beacons 2000 --interval 2 --jitter 0.3 --connections 64 --listeners 20
+    python location_load.py --host 127.0.0.1:8080 --reset --json
+
+Each beacon writes its locations/<uid> document the way LocationService
+does (latitude, longitude, status, timestamp, ...) every --interval seconds,
+with random jitter, a random walk around the campus center and an occasional
+status change. Writes go to the emulator's REST API over a pool of
+keep-alive HTTP/1.1 connections.
+
+Listeners stand in for the student apps' snapshot listeners. The emulator
+only streams changes over gRPC, so each listener lists the collection every
+--poll seconds and records, for every changed document, the delay from the
+write's timestamp to the poll that saw it. That fan-out delay includes up to
+one poll interval; poll faster to tighten it.
+
+The report gives achieved throughput against the target rate, write latency
+percentiles, error counts, and listener poll latency and fan-out delay.
+Write latency starts once a pooled connection is free; the time waiting
+for one is reported apart as write queue, so a small --connections shows
+up there rather than as emulator latency.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from urllib.parse import quote, urlencode
+
+PROJECT_ID = 'unitrack-sksu-app'
+EMULATOR_HOST = os.environ.get('FIRESTORE_EMULATOR_HOST', '127.0.0.1:8080')
+COLLECTION = 'locations'
+
+# Isulan campus center (lib/core/constants/app_constants.dart) and walk step in degrees
+CAMPUS_CENTER = (6.63326077657394, 124.6091426890741)
+CAMPUS_RADIUS = 0.0015
+WALK_STEP = 0.00005
+STATUSES = ('Available', 'In Class', 'In Meeting', 'Busy', 'On Break')
+STATUS_CHANGE = 0.05  # chance a write also changes the beacon's status
+
+class HttpError(Exception):
+    def __init__(self, status, body):
+        super().__init__(f"HTTP {status}: {body[:200]!r}")
+        self.status = status
+
+class ConnectionPool:
+    """Up to size keep-alive HTTP/1.1 connections to one host, opened on demand"""
+
+    def __init__(self, host, size=32, timeout=10.0):
+        self.hostname, _, port = host.rpartition(':')
+        self.port = int(port)
+        self.host = host
+        self.size = size
+        self.timeout = timeout
+        self.idle = []
+        self.opened = 0
+        self.available = asyncio.Semaphore(size)
+
+    async def request(self, method, path, body=None, timing=None):
+        """(status, body bytes) of one request; the emulator's owner token bypasses the rules.
+
+        timing, when given, receives 'queue', the seconds spent waiting for a
+        free connection slot, and 'service', the seconds from then to the end
+        of the response.
+        """
+        data = json.dumps(body).encode() if body is not None else b''
+        head = (f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\nAuthorization: Bearer owner\r\n"
+                f"Content-Type: application/json\r\nContent-Length: {len(data)}\r\n\r\n")
+        queued = time.perf_counter()
+        async with self.available:
+            acquired = time.perf_counter()
+            conn = self.idle.pop() if self.idle else None
+            for attempt in range(2):
+                if conn is None:
+                    conn = await asyncio.wait_for(asyncio.open_connection(self.hostname, self.port), self.timeout)
+                    self.opened += 1
+                try:
+                    reader, writer = conn
+                    writer.write(head.encode('latin-1') + data)
+                    await writer.drain()
+                    status, reusable, payload = await asyncio.wait_for(read_response(reader), self.timeout)
+                    break
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    # A pooled connection the server already closed: retry once on a new one
+                    conn[1].close()
+                    conn = None
+                    if attempt:
+                        raise
+                except BaseException:
+                    conn[1].close()
+                    raise
+            if reusable:
+                self.idle.append(conn)
+            else:
+                conn[1].close()
+        if timing is not None:
+            timing['queue'] = acquired - queued
+            timing['service'] = time.perf_counter() - acquired
+        return status, payload
+
+    def close(self):
+        for _, writer in self.idle:
+            writer.close()
+        self.idle = []
+
+async def read_response(reader):
+    """(status, keep-alive, body) of one HTTP/1.1 response, Content-Length or chunked"""
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionResetError("connection closed")
+    status = int(status_line.split()[1])
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+    if headers.get('transfer-encoding', '').lower() == 'chunked':
+        parts = []
+        while True:
+            size = int((await reader.readline()).split(b';')[0], 16)
+            if size == 0:
+                await reader.readline()
+                break
+            parts.append(await reader.readexactly(size))
+            await reader.readline()
+        body = b''.join(parts)
+    else:
+        body = await reader.readexactly(int(headers.get('content-length', 0)))
+    return status, headers.get('connection', '').lower() != 'close', body
+
+def documents_path(project=PROJECT_ID):
+    return f"/v1/projects/{project}/databases/(default)/documents"
+
+def parse_timestamp(value):
+    return datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp()
+
+def firestore_fields(values):
+    """A Firestore REST document body from plain values"""
+    fields = {}
+    for name, value in values.items():
+        if value is None:
+            fields[name] = {'nullValue': None}
+        elif isinstance(value, bool):
+            fields[name] = {'booleanValue': value}
+        elif isinstance(value, float):
+            fields[name] = {'doubleValue': value}
+        elif isinstance(value, datetime):
+            fields[name] = {'timestampValue': value.strftime('%Y-%m-%dT%H:%M:%S.%fZ')}
+        else:
+            fields[name] = {'stringValue': str(value)}
+    return {'fields': fields}
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+def summarize(values):
+    """Millisecond percentiles of a list of second durations"""
+    if not values:
+        return {'count': 0}
+    return {'count': len(values), 'p50_ms': round(percentile(values, 0.5) * 1000, 1),
+            'p95_ms': round(percentile(values, 0.95) * 1000, 1),
+            'p99_ms': round(percentile(values, 0.99) * 1000, 1),
+            'max_ms': round(max(values) * 1000, 1)}
+
+class LoadTest:
+    """Beacons and listeners sharing one connection pool for a fixed duration"""
+
+    def __init__(self, pool, beacons=100, interval=5.0, jitter=0.2, duration=30.0, listeners=0,
+                 poll=1.0, project=PROJECT_ID, seed=None):
+        self.pool = pool
+        self.beacons = beacons
+        self.interval = interval
+        self.jitter = jitter
+        self.duration = duration
+        self.listeners = listeners
+        self.poll = poll
+        self.base = documents_path(project)
+        self.random = random.Random(seed)
+        self.write_latency = []
+        self.write_queue = []
+        self.poll_latency = []
+        self.fanout = []
+        self.errors = Counter()
+        self.writes = 0
+        self.started = None
+        self.started_wall = None
+        self.elapsed = None
+        self.steady_writes = 0
+        self.stop = None
+
+    def beacon_id(self, index):
+        return f"loadtest-beacon-{index:05d}"
+
+    async def beacon(self, index):
+        rng = random.Random(self.random.random())
+        lat = CAMPUS_CENTER[0] + rng.uniform(-CAMPUS_RADIUS, CAMPUS_RADIUS)
+        lng = CAMPUS_CENTER[1] + rng.uniform(-CAMPUS_RADIUS, CAMPUS_RADIUS)
+        status = rng.choice(STATUSES)
+        path = f"{self.base}/{COLLECTION}/{quote(self.beacon_id(index))}"
+        # Spread the first writes over one interval so the load starts level
+        await self.pause(rng.uniform(0, self.interval))
+        next_at = time.perf_counter()
+        while not self.stop.is_set():
+            moving = rng.random() < 0.3
+            if moving:
+                lat += rng.uniform(-WALK_STEP, WALK_STEP)
+                lng += rng.uniform(-WALK_STEP, WALK_STEP)
+            if rng.random() < STATUS_CHANGE:
+                status = rng.choice(STATUSES)
+            sent = time.time()
+            body = firestore_fields({
+                'latitude': lat, 'longitude': lng, 'status': status, 'quickMessage': None,
+                'timestamp': datetime.fromtimestamp(sent, timezone.utc), 'isWithinCampus': True,
+                'accuracy': round(rng.uniform(4.0, 20.0), 1), 'isMoving': moving, 'isManualPin': False})
+            start = time.perf_counter()
+            timing = {}
+            try:
+                status_code, payload = await self.pool.request('PATCH', path, body, timing)
+                if status_code != 200:
+                    raise HttpError(status_code, payload)
+                # Emulator latency and the wait for a pooled connection, reported apart
+                self.write_latency.append(timing['service'])
+                self.write_queue.append(timing['queue'])
+                self.writes += 1
+                if start - self.started >= self.interval:
+                    self.steady_writes += 1
+            except HttpError as e:
+                self.errors[f"HTTP {e.status}"] += 1
+            except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError) as e:
+                self.errors[type(e).__name__] += 1
+            # Fixed schedule with jitter: a slow write does not lower the offered rate
+            next_at += self.interval * (1 + rng.uniform(-self.jitter, self.jitter))
+            await self.pause(next_at - time.perf_counter())
+
+    async def listener(self, index):
+        seen = {}
+        await self.pause(self.poll * index / max(1, self.listeners))
+        while not self.stop.is_set():
+            start = time.perf_counter()
+            try:
+                documents = await self.list_documents()
+            except HttpError as e:
+                self.errors[f"listen HTTP {e.status}"] += 1
+                documents = []
+            except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError) as e:
+                self.errors[f"listen {type(e).__name__}"] += 1
+                documents = []
+            observed = time.time()
+            self.poll_latency.append(time.perf_counter() - start)
+            for doc in documents:
+                name, updated = doc['name'], doc.get('updateTime')
+                if seen.get(name) == updated:
+                    continue
+                first = name not in seen
+                seen[name] = updated
+                stamp = doc.get('fields', {}).get('timestamp', {}).get('timestampValue')
+                # Documents already there at a listener's first poll were not written while it listened
+                if stamp and not first and parse_timestamp(stamp) >= self.started_wall:
+                    self.fanout.append(max(0.0, observed - parse_timestamp(stamp)))
+            await self.pause(self.poll - (time.perf_counter() - start))
+
+    async def list_documents(self):
+        documents, token = [], None
+        while True:
+            query = {'pageSize': 1000}
+            if token:
+                query['pageToken'] = token
+            status, payload = await self.pool.request('GET', f"{self.base}/{COLLECTION}?{urlencode(query)}")
+            if status != 200:
+                raise HttpError(status, payload)
+            page = json.loads(payload or b'{}')
+            documents += page.get('documents', [])
+            token = page.get('nextPageToken')
+            if not token:
+                return documents
+
+    async def pause(self, seconds):
+        """Sleep, returning early when the run ends"""
+        try:
+            await asyncio.wait_for(self.stop.wait(), max(0.0, seconds))
+        except asyncio.TimeoutError:
+            pass
+
+    async def run(self):
+        self.stop = asyncio.Event()
+        self.started = time.perf_counter()
+        self.started_wall = time.time()
+        tasks = [asyncio.ensure_future(self.beacon(i)) for i in range(self.beacons)]
+        tasks += [asyncio.ensure_future(self.listener(i)) for i in range(self.listeners)]
+        await asyncio.sleep(self.duration)
+        self.elapsed = time.perf_counter() - self.started
+        self.stop.set()
+        await asyncio.gather(*tasks)
+        return self.report()
+
+    def writes_per_second(self):
+        """Write rate once every beacon has started, after the first interval's ramp-up"""
+        steady = self.elapsed - self.interval
+        if steady <= 0:
+            return self.writes / self.elapsed
+        return self.steady_writes / steady
+
+    def report(self):
+        target = self.beacons / self.interval
+        return {'beacons': self.beacons, 'listeners': self.listeners, 'duration_s': round(self.elapsed, 1),
+                'target_writes_per_s': round(target, 1),
+                'writes_per_s': round(self.writes_per_second(), 1),
+                'writes': self.writes, 'errors': dict(self.errors),
+                'connections': {'size': self.pool.size, 'opened': self.pool.opened},
+                'write_latency': summarize(self.write_latency),
+                'write_queue': summarize(self.write_queue),
+                'poll_latency': summarize(self.poll_latency),
+                'fanout_delay': summarize(self.fanout)}
+
+async def reset(pool, project=PROJECT_ID):
+    """Delete every document in the emulator's database"""
+    status, payload = await pool.request('DELETE', f"/emulator/v1/projects/{project}/databases/(default)/documents")
+    if status != 200:
+        raise HttpError(status, payload)
+
+def print_report(report):
+    print(f"{report['beacons']} beacons, {report['listeners']} listeners, {report['duration_s']} s; "
+          f"{report['connections']['opened']}/{report['connections']['size']} connections opened")
+    print(f"Writes: {report['writes']} ({report['writes_per_s']}/s of {report['target_writes_per_s']}/s target)"
+          + (f", errors {report['errors']}" if report['errors'] else ""))
+    for name in ('write_latency', 'write_queue', 'poll_latency', 'fanout_delay'):
+        s = report[name]
+        if s['count']:
+            print(f"  {name.replace('_', ' '):<14} n={s['count']:<7} p50 {s['p50_ms']:>8.1f} ms  "
+                  f"p95 {s['p95_ms']:>8.1f} ms  p99 {s['p99_ms']:>8.1f} ms  max {s['max_ms']:>8.1f} ms")
+
+async def main(args):
+    pool = ConnectionPool(args.host, args.connections, args.timeout)
+    try:
+        if args.reset:
+            await reset(pool, args.project)
+        test = LoadTest(pool, args.beacons, args.interval, args.jitter, args.duration, args.listeners,
+                        args.poll, args.project, args.seed)
+        return await test.run()
+    finally:
+        pool.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load-test the locations collection on a Firestore emulator")
+    parser.add_argument("--host", default=EMULATOR_HOST, help="emulator host:port (default: $FIRESTORE_EMULATOR_HOST)")
+    parser.add_argument("--project", default=PROJECT_ID)
+    parser.add_argument("--beacons", type=int, default=100, help="simulated staff devices")
+    parser.add_argument("--interval", type=float, default=5.0,
+                        help="seconds between a beacon's writes (app: 2 moving, 5 stationary)")
+    parser.add_argument("--jitter", type=float, default=0.2, help="interval jitter as a fraction")
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds to run")
+    parser.add_argument("--connections", type=int, default=32, help="HTTP connection pool size")
+    parser.add_argument("--listeners", type=int, default=0, help="polling stand-ins for student listeners")
+    parser.add_argument("--poll", type=float, default=1.0, help="seconds between listener polls")
+    parser.add_argument("--timeout", type=float, default=10.0, help="per-request timeout in seconds")
+    parser.add_argument("--seed", type=int, help="random seed for repeatable walks")
+    parser.add_argument("--reset", action="store_true", help="clear the emulator database first")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args()
+    if not 0 <= args.jitter < 1:
+        parser.error("--jitter must be in [0, 1)")
+
+    report = asyncio.run(main(args))
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
@@ -0,0 +1,189 @@
+"""
+UniTrack Mockup Render Server
+Serves create_mockups screens on demand over HTTP for designers and the web review page
+
+Usage:
+    python mockup_server.py --port 8765
+    GET /screens                                   list registered screens and options
+    GET /render?screen=live_map&scale=2&theme=dark&tab=1&quality=print
+    GET /stats                                     cache and render counters
+
+Renders run in a process pool; encoded PNGs are kept in an in-memory LRU keyed by
+the normalized query and served with a content-hash ETag (If-None-Match -> 304).
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import parse_qs, urlsplit
+
+from create_mockups import QUALITY_PRESETS, SCREENS, THEMES, render_png
+from http_service import HttpService, etag_matches
+
+MAX_SCALE = 4
+TAB_COUNT = 4
+
+class RenderCache:
+    """LRU of rendered PNGs bounded by entry count and total bytes"""
+
+    def __init__(self, max_entries=256, max_bytes=64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key, body):
+        etag = '"%s"' % hashlib.sha256(body).hexdigest()[:32]
+        if key in self.entries:
+            self.size -= len(self.entries.pop(key)[0])
+        self.entries[key] = (body, etag)
+        self.size += len(body)
+        while self.entries and (len(self.entries) > self.max_entries or self.size > self.max_bytes):
+            _, (old_body, _) = self.entries.popitem(last=False)
+            self.size -= len(old_body)
+        return body, etag
+
+    def stats(self):
+        return {"entries": len(self.entries), "bytes": self.size,
+                "hits": self.hits, "misses": self.misses}
+
+def parse_render_query(query):
+    """Validate /render query parameters and return the normalized cache key"""
+    params = {k: v[-1] for k, v in parse_qs(query).items()}
+    screen = params.get("screen")
+    if screen not in SCREENS:
+        raise LookupError(f"unknown screen: {screen!r}")
+    try:
+        scale = int(params.get("scale", 1))
+        tab = params.get("tab")
+        tab = None if tab in (None, "") else int(tab)
+    except ValueError:
+        raise ValueError("scale and tab must be integers")
+    if not 1 <= scale <= MAX_SCALE:
+        raise ValueError(f"scale must be between 1 and {MAX_SCALE}")
+    if tab is not None and not 0 <= tab < TAB_COUNT:
+        raise ValueError(f"tab must be between 0 and {TAB_COUNT - 1}")
+    theme = params.get("theme", "light")
+    if theme not in THEMES:
+        raise ValueError(f"unknown theme: {theme!r}")
+    quality = params.get("quality", "draft")
+    if quality not in QUALITY_PRESETS:
+        raise ValueError(f"unknown quality: {quality!r}")
+    return (screen, scale, theme, tab, quality)
+
+class MockupServer(HttpService):
+    """asyncio HTTP front end over a render process pool and RenderCache"""
+
+    def __init__(self, workers=None, cache=None):
+        self.executor = ProcessPoolExecutor(max_workers=workers)
+        self.cache = cache or RenderCache()
+        self.pending = {}
+        self.renders = 0
+        self.render_seconds = 0.0
+
+    async def render(self, key):
+        """Return (body, etag) for key, rendering at most once per key concurrently"""
+        entry = self.cache.get(key)
+        if entry is not None:
+            return entry
+        future = self.pending.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._render(key))
+            self.pending[key] = future
+            future.add_done_callback(lambda _: self.pending.pop(key, None))
+        return await asyncio.shield(future)
+
+    async def _render(self, key):
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+        body = await loop.run_in_executor(self.executor, render_png, *key)
+        self.renders += 1
+        self.render_seconds += time.perf_counter() - start
+        return self.cache.put(key, body)
+
+    async def dispatch(self, writer, method, target, headers, keep_alive):
+        if method not in ("GET", "HEAD"):
+            await self.respond(writer, 405, b"only GET and HEAD are supported", keep_alive=keep_alive)
+            return
+        head_only = method == "HEAD"
+        url = urlsplit(target)
+        if url.path in ("/", "/screens"):
+            body = json.dumps({"screens": list(SCREENS), "themes": list(THEMES),
+                               "qualities": list(QUALITY_PRESETS), "scale": [1, MAX_SCALE],
+                               "tabs": TAB_COUNT}).encode()
+            await self.respond(writer, 200, body, "application/json", keep_alive=keep_alive,
+                               head_only=head_only)
+        elif url.path == "/stats":
+            stats = dict(self.cache.stats(), renders=self.renders,
+                         render_seconds=round(self.render_seconds, 4), in_flight=len(self.pending))
+            await self.respond(writer, 200, json.dumps(stats).encode(), "application/json",
+                               keep_alive=keep_alive, head_only=head_only)
+        elif url.path == "/render":
+            try:
+                key = parse_render_query(url.query)
+            except LookupError as e:
+                await self.respond(writer, 404, str(e).encode(), keep_alive=keep_alive)
+                return
+            except ValueError as e:
+                await self.respond(writer, 400, str(e).encode(), keep_alive=keep_alive)
+                return
+            try:
+                body, etag = await self.render(key)
+            except Exception as e:
+                await self.respond(writer, 500, f"render failed: {e}".encode(), keep_alive=keep_alive)
+                return
+            extra = {"ETag": etag, "Cache-Control": "no-cache"}
+            if etag_matches(headers.get("if-none-match", ""), etag):
+                await self.respond(writer, 304, b"", None, extra, keep_alive=keep_alive)
+            else:
+                await self.respond(writer, 200, body, "image/png", extra, keep_alive=keep_alive,
+                                   head_only=head_only)
+        else:
+            await self.respond(writer, 404, b"not found", keep_alive=keep_alive)
+
+    async def serve(self, host, port, warm=False):
+        if warm:
+            await asyncio.gather(*(self.render((name, 1, "light", None, "draft")) for name in SCREENS))
+        server = await asyncio.start_server(self.handle, host, port)
+        print(f"Mockup server listening on http://{host}:{port}/")
+        async with server:
+            await server.serve_forever()
+
+    def close(self):
+        self.executor.shutdown(cancel_futures=True)
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve UniTrack mockups rendered on demand")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=None, help="render processes (default: CPU count)")
+    parser.add_argument("--cache-entries", type=int, default=256)
+    parser.add_argument("--cache-mb", type=int, default=64)
+    parser.add_argument("--warm", action="store_true", help="pre-render every screen at startup")
+    args = parser.parse_args()
+
+    server = MockupServer(args.workers, RenderCache(args.cache_entries, args.cache_mb * 1024 * 1024))
+    try:
+        asyncio.run(server.serve(args.host, args.port, warm=args.warm))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,475 @@
+"""
+UniTrack Proposal Benchmarks
+Times and memory-profiles the proposal build: style setup, image preparation,
+every section, the styled helpers per call and per IR node type, and doc.save
+
+Usage:
+    python proposal_bench.py                                  one run at 1x
+    python proposal_bench.py --scale 1,2,4,8 --json bench.json
+    python proposal_bench.py --json new.json --baseline bench.json --fail-over 15
+    python proposal_bench.py --check-legacy                   styles and one-pass tables vs per-run formatting
+
+--scale inflates the content synthetically (body sections repeated N times,
+table rows multiplied by N) to show how each metric scales. Results are stored
+as JSON; with --baseline every metric is compared and regressions beyond
+--fail-over percent make the run exit non-zero.
+
+--check-legacy compares the build with the way the generator wrote the
+document before the style registry: python-docx's cell API for tables and
+direct paragraph formatting with fonts on every run for paragraphs,
+headings, bullets and numbered items. It checks that the text matches and
+that the current build gives a smaller document.xml in less time, for the
+tables alone and for the whole document.
+
+tracemalloc sees Python allocations only. The lxml tree lives in libxml2, so
+its growth is reported as the body element count, the serialized
+document.xml size and the process's max RSS.
+"""
+
+import argparse
+import io
+import json
+import platform
+import resource
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+import zipfile
+from collections import defaultdict
+
+from docx.enum.table import WD_TABLE_ALIGNMENT
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+from docx.shared import Inches, Pt, RGBColor
+from lxml import etree
+
+import generate_proposal as gp
+import proposal_ir as ir
+from proposal_build import CONTENT_DIR, load_sections
+
+# Helpers timed per call; add_node is timed per IR node type
+TIMED_HELPERS = ('create_styled_table', 'add_mockup_image', 'add_styled_paragraph',
+                 'add_bullet_point', 'add_numbered_item', 'add_blank_paragraphs', 'prepare_image')
+FIXED_SECTIONS = ('title_page', 'table_of_contents')
+
+# Timings below this are scheduler noise and are left out of baseline comparisons
+NOISE_FLOOR_S = 0.002
+
+def inflate(sections, factor):
+    """Synthetic content: body sections repeated factor times, table rows multiplied by factor"""
+    if factor == 1:
+        return sections
+    inflated = list(s for s in sections if s[0] in FIXED_SECTIONS)
+    body = [s for s in sections if s[0] not in FIXED_SECTIONS]
+    for copy in range(factor):
+        for sid, section in body:
+            blocks = [dict(block, rows=block['rows'] * factor)
+                      if block['type'] == 'table' and 'rows' in block else block
+                      for block in section['blocks']]
+            inflated.append((f"{sid}.{copy}", dict(section, blocks=blocks)))
+    return inflated
+
+class Instrument:
+    """Wraps the generator helpers and add_node to accumulate call counts and time"""
+
+    def __init__(self):
+        self.helpers = defaultdict(lambda: [0, 0.0])
+        self.nodes = defaultdict(lambda: [0, 0.0])
+        self.originals = {}
+
+    def __enter__(self):
+        for name in TIMED_HELPERS:
+            self.originals[name] = getattr(gp, name)
+            setattr(gp, name, self.timed(name, self.originals[name]))
+        self.originals['add_node'] = gp.add_node
+        add_node = gp.add_node
+
+        def timed_node(doc, node, figures=None):
+            start = time.perf_counter()
+            try:
+                return add_node(doc, node, figures)
+            finally:
+                entry = self.nodes[type(node).__name__]
+                entry[0] += 1
+                entry[1] += time.perf_counter() - start
+
+        gp.add_node = timed_node
+        return self
+
+    def __exit__(self, *exc):
+        for name, fn in self.originals.items():
+            setattr(gp, name, fn)
+
+    def timed(self, name, fn):
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                entry = self.helpers[name]
+                entry[0] += 1
+                entry[1] += time.perf_counter() - start
+        return wrapper
+
+def figure_sources(sections):
+    sources = []
+    for _, section in sections:
+        for node in ir.lower_section(section):
+            if isinstance(node, ir.Figure):
+                with open(node.image, 'rb') as f:
+                    sources.append((f.read(), node.width))
+    return sources
+
+def time_style_setup():
+    gp._template_bytes = None
+    start = time.perf_counter()
+    gp.new_document()
+    return time.perf_counter() - start
+
+def time_image_prep(sections):
+    """Cold image preparation against an empty cache directory"""
+    cache_dir, gp.IMAGE_CACHE_DIR = gp.IMAGE_CACHE_DIR, tempfile.mkdtemp()
+    gp._prepared_images.clear()
+    try:
+        start = time.perf_counter()
+        for source, width in figure_sources(sections):
+            gp.prepare_image(source, width)
+        return time.perf_counter() - start
+    finally:
+        shutil.rmtree(gp.IMAGE_CACHE_DIR, ignore_errors=True)
+        gp.IMAGE_CACHE_DIR = cache_dir
+
+def timed_build(sections):
+    """One instrumented build with warm template and images"""
+    section_times = {}
+    with Instrument() as inst:
+        start = time.perf_counter()
+        doc = gp.new_document()
+        for sid, section in sections:
+            t = time.perf_counter()
+            gp.build_section(doc, section)
+            section_times[sid] = time.perf_counter() - t
+        build_seconds = time.perf_counter() - start
+    buffer = io.BytesIO()
+    t = time.perf_counter()
+    doc.save(buffer)
+    save_seconds = time.perf_counter() - t
+    data = buffer.getvalue()
+    return {
+        'build_s': build_seconds,
+        'save_s': save_seconds,
+        'total_s': build_seconds + save_seconds,
+        'sections_s': section_times,
+        # Every timed helper is listed, so one the build never reaches shows 0 calls
+        'helpers': {name: {'calls': inst.helpers[name][0], 's': inst.helpers[name][1]}
+                    for name in sorted(TIMED_HELPERS)},
+        'nodes': {name: {'count': c, 's': s} for name, (c, s) in sorted(inst.nodes.items())},
+        'output_bytes': len(data),
+        'document_xml_bytes': len(zipfile.ZipFile(io.BytesIO(data)).read('word/document.xml')),
+        'body_elements': sum(1 for _ in doc.element.body.iter()),
+    }
+
+def memory_build(sections):
+    """Build once under tracemalloc; returns (overall peak, per-section peaks)"""
+    tracemalloc.start()
+    try:
+        doc = gp.new_document()
+        overall = tracemalloc.get_traced_memory()[1]
+        peaks = {}
+        for sid, section in sections:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+            gp.build_section(doc, section)
+            peak = tracemalloc.get_traced_memory()[1]
+            peaks[sid] = peak - base
+            overall = max(overall, peak)
+        tracemalloc.reset_peak()
+        doc.save(io.BytesIO())
+        return max(overall, tracemalloc.get_traced_memory()[1]), peaks
+    finally:
+        tracemalloc.stop()
+
+def run(sections, repeat):
+    """All metrics for one content set; timings are the best of repeat runs, per section too"""
+    result = {'style_setup_s': time_style_setup(), 'image_prep_cold_s': time_image_prep(sections)}
+    for source, width in figure_sources(sections):
+        gp.prepare_image(source, width)
+    builds = [timed_build(sections) for _ in range(repeat)]
+    best = min(builds, key=lambda r: r['total_s'])
+    best['sections_s'] = {sid: min(b['sections_s'][sid] for b in builds) for sid in best['sections_s']}
+    result.update(best)
+    result['tracemalloc_peak_bytes'], result['section_peak_bytes'] = memory_build(sections)
+    result['max_rss_kb'] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return result
+
+def flatten(value, prefix=''):
+    if isinstance(value, dict):
+        items = {}
+        for key, item in value.items():
+            items.update(flatten(item, f"{prefix}{key}."))
+        return items
+    return {prefix[:-1]: value} if isinstance(value, (int, float)) else {}
+
+def is_timing(key):
+    return any(part == 's' or part.endswith('_s') for part in key.split('.'))
+
+def compare(results, baseline, threshold):
+    """Print metrics that moved beyond threshold percent; returns the regressions"""
+    current, base = flatten(results['runs']), flatten(baseline['runs'])
+    regressions = []
+    print(f"\n{'metric':<58}{'baseline':>14}{'current':>14}{'change':>9}")
+    for key in sorted(current.keys() & base.keys()):
+        old, new = base[key], current[key]
+        if not old or key.endswith('.calls') or key.endswith('.count'):
+            continue
+        if is_timing(key) and max(old, new) < NOISE_FLOOR_S:
+            continue
+        change = (new - old) / old * 100
+        if abs(change) >= threshold:
+            print(f"{key:<58}{old:>14.4g}{new:>14.4g}{change:>+8.1f}%")
+            if change > 0:
+                regressions.append(key)
+    print(f"{len(regressions)} metrics regressed by more than {threshold}%")
+    return regressions
+
+def legacy_table(doc, headers, rows, header_color='003366'):
+    """A styled table built through python-docx's cell API with per-run formatting and cell shading"""
+    def shade(cell, color):
+        shading = OxmlElement('w:shd')
+        shading.set(qn('w:val'), 'clear')
+        shading.set(qn('w:color'), 'auto')
+        shading.set(qn('w:fill'), color)
+        cell._tc.get_or_add_tcPr().append(shading)
+
+    rows = list(rows)
+    table = doc.add_table(rows=len(rows) + 1, cols=len(headers))
+    table.style = 'Table Grid'
+    table.alignment = WD_TABLE_ALIGNMENT.CENTER
+    for i, header in enumerate(headers):
+        cell = table.rows[0].cells[i]
+        cell.text = str(header)
+        shade(cell, header_color)
+        for para in cell.paragraphs:
+            para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+            for run in para.runs:
+                run.font.name = 'Times New Roman'
+                run.font.size = Pt(11)
+                run.font.bold = True
+                run.font.color.rgb = RGBColor(255, 255, 255)
+    for i, row in enumerate(rows, 1):
+        for j, value in enumerate(row):
+            cell = table.rows[i].cells[j]
+            cell.text = str(value)
+            if i % 2 == 0:
+                shade(cell, gp.TABLE_BAND_COLOR)
+            for para in cell.paragraphs:
+                for run in para.runs:
+                    run.font.name = 'Times New Roman'
+                    run.font.size = Pt(11)
+                    run.font.color.rgb = RGBColor(0, 0, 0)
+    return table
+
+def paragraph_spec(style):
+    """(base style, spacing/indents, font) of a registry style with its UT base styles merged in"""
+    base, para, font = ir.PARAGRAPH_STYLES[style]
+    if base in ir.PARAGRAPH_STYLES:
+        _, base_para, base_font = paragraph_spec(base)
+        return paragraph_spec(base)[0], {**base_para, **para}, {**base_font, **font}
+    return base, para, font
+
+def legacy_runs(para, content, font):
+    """Runs carrying their whole font, Times New Roman 12 pt black unless the style says otherwise"""
+    for item in [content] if isinstance(content, str) else content:
+        text, char_style = (item, None) if isinstance(item, str) else item
+        spec = {**font, **ir.CHARACTER_STYLES.get(char_style, {})}
+        run = para.add_run(text)
+        run.font.name = 'Times New Roman'
+        run.font.size = Pt(spec.get('size', 12))
+        if 'bold' in spec:
+            run.bold = spec['bold']
+        if 'italic' in spec:
+            run.italic = spec['italic']
+        run.font.color.rgb = RGBColor(*spec.get('color', (0, 0, 0)))
+
+def legacy_paragraph(doc, content, style='UT Body'):
+    """add_styled_paragraph with direct paragraph formatting and per-run fonts"""
+    base, spec, font = paragraph_spec(style)
+    para = doc.add_paragraph(style=style if base is None else None if base == 'Normal' else base)
+    gp.set_paragraph_spacing(para, spec.get('before', 0), spec.get('after', 6), spec.get('line_spacing', 1.15))
+    pf = para.paragraph_format
+    if 'first_line_indent' in spec:
+        pf.first_line_indent = Inches(spec['first_line_indent'])
+    if 'left_indent' in spec:
+        pf.left_indent = Inches(spec['left_indent'])
+    if 'align' in spec:
+        pf.alignment = gp.ALIGNMENTS[spec['align']]
+    legacy_runs(para, content, font)
+    return para
+
+def legacy_bullet_point(doc, text, bold_prefix=None, style='UT Bullet'):
+    """add_bullet_point on the List Bullet style with per-run fonts"""
+    content = [text] if isinstance(text, str) else list(text)
+    if bold_prefix:
+        content.insert(0, (bold_prefix, 'UT Label'))
+    return legacy_paragraph(doc, content, style)
+
+def legacy_numbered_item(doc, number, text, style='UT Numbered'):
+    """add_numbered_item with a bold number run and per-run fonts"""
+    content = [text] if isinstance(text, str) else list(text)
+    return legacy_paragraph(doc, [(f"{number}. ", 'UT Label')] + content, style)
+
+# Generator helpers and their pre-registry equivalents
+LEGACY_HELPERS = {'add_styled_paragraph': legacy_paragraph, 'add_bullet_point': legacy_bullet_point,
+                  'add_numbered_item': legacy_numbered_item, 'create_styled_table': legacy_table}
+
+def document_xml_bytes(sections):
+    """Size of word/document.xml for a serial build of sections"""
+    doc = gp.new_document()
+    for _, section in sections:
+        gp.build_section(doc, section)
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return len(zipfile.ZipFile(buffer).read('word/document.xml'))
+
+def check_tables(sections, repeat):
+    """Compare add_table with legacy_table on every table; returns the failed checks"""
+    tables = [node for _, section in sections for node in ir.lower_section(section)
+              if isinstance(node, ir.Table)]
+    texts, table_bytes, seconds, doc_bytes = {}, {}, {}, {}
+    for name, builder in (('one-pass', gp.add_table), ('python-docx', legacy_table)):
+        for _ in range(repeat):
+            doc = gp.new_document()
+            start = time.perf_counter()
+            built = [builder(doc, t.headers, t.rows, t.header_color) for t in tables]
+            seconds[name] = min(seconds.get(name, float('inf')), time.perf_counter() - start)
+        texts[name] = [[[cell.text for cell in row.cells] for row in table.rows] for table in built]
+        table_bytes[name] = sum(len(etree.tostring(table._tbl)) for table in built)
+        original, gp.create_styled_table = gp.create_styled_table, builder
+        try:
+            doc_bytes[name] = document_xml_bytes(sections)
+        finally:
+            gp.create_styled_table = original
+
+    print(f"\n{len(tables)} tables, {sum(len(t.rows) for t in tables)} rows")
+    print(f"{'':<14}{'table XML':>12}{'document.xml':>14}{'build':>12}")
+    for name in texts:
+        print(f"{name:<14}{table_bytes[name]:>12}{doc_bytes[name]:>14}{seconds[name] * 1000:>9.1f} ms")
+    failures = []
+    if texts['one-pass'] != texts['python-docx']:
+        failures.append("cell text differs")
+    for label, values in (("table XML", table_bytes), ("document.xml", doc_bytes), ("table build time", seconds)):
+        if values['one-pass'] >= values['python-docx']:
+            failures.append(f"{label} is not smaller")
+        else:
+            print(f"{label}: {(1 - values['one-pass'] / values['python-docx']) * 100:.0f}% smaller")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return failures
+
+def build_document(sections):
+    """(document.xml bytes, body text, seconds) of a serial build and save"""
+    start = time.perf_counter()
+    doc = gp.new_document()
+    for _, section in sections:
+        gp.build_section(doc, section)
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    seconds = time.perf_counter() - start
+    text = [p.text for p in doc.paragraphs]
+    return zipfile.ZipFile(buffer).read('word/document.xml'), text, seconds
+
+def check_document(sections, repeat):
+    """Compare a whole build with one through LEGACY_HELPERS; returns the failed checks"""
+    gp.new_document()
+    results = {'styled': None, 'per-run': None}
+    for name in results:
+        originals = {helper: getattr(gp, helper) for helper in LEGACY_HELPERS}
+        if name == 'per-run':
+            for helper, legacy in LEGACY_HELPERS.items():
+                setattr(gp, helper, legacy)
+        try:
+            builds = [build_document(sections) for _ in range(repeat)]
+        finally:
+            for helper, fn in originals.items():
+                setattr(gp, helper, fn)
+        xml, text, _ = builds[0]
+        results[name] = (len(xml), text, min(seconds for _, _, seconds in builds))
+
+    print(f"\nwhole document, {len(results['styled'][1])} paragraphs")
+    print(f"{'':<14}{'document.xml':>14}{'build+save':>14}")
+    for name, (size, _, seconds) in results.items():
+        print(f"{name:<14}{size:>14}{seconds * 1000:>11.1f} ms")
+    failures = []
+    if results['styled'][1] != results['per-run'][1]:
+        failures.append("document text differs")
+    for label, index in (("document.xml", 0), ("build time", 2)):
+        new, old = results['styled'][index], results['per-run'][index]
+        if new >= old:
+            failures.append(f"whole-document {label} is not smaller")
+        else:
+            print(f"whole-document {label}: {(1 - new / old) * 100:.0f}% smaller")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return failures
+
+def print_summary(factor, result):
+    print(f"\n== {factor}x: build {result['build_s'] * 1000:.1f} ms, save {result['save_s'] * 1000:.1f} ms, "
+          f"{result['output_bytes'] / 1024:.1f} KB, {result['body_elements']} body elements, "
+          f"tracemalloc peak {result['tracemalloc_peak_bytes'] / 1024 / 1024:.1f} MB")
+    print(f"   style setup {result['style_setup_s'] * 1000:.1f} ms, "
+          f"cold image prep {result['image_prep_cold_s'] * 1000:.1f} ms")
+    for name, entry in result['nodes'].items():
+        print(f"   node   {name:<22}{entry['count']:>7} x {entry['s'] * 1000:9.2f} ms")
+    for name, entry in result['helpers'].items():
+        print(f"   helper {name:<22}{entry['calls']:>7} x {entry['s'] * 1000:9.2f} ms")
+    unused = [name for name, entry in result['helpers'].items() if not entry['calls']]
+    if unused:
+        print("   never called (dead helpers or an untimed code path): " + ", ".join(unused))
+    slowest = sorted(result['sections_s'].items(), key=lambda kv: -kv[1])[:5]
+    print("   slowest sections: " + ", ".join(f"{sid} {s * 1000:.1f} ms" for sid, s in slowest))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the UniTrack proposal generator")
+    parser.add_argument("--content", default=CONTENT_DIR, help="proposal content directory")
+    parser.add_argument("--scale", default="1", help="comma-separated synthetic inflation factors")
+    parser.add_argument("--repeat", type=int, default=3, help="timed builds per factor (best is kept)")
+    parser.add_argument("--json", help="write the results to this file")
+    parser.add_argument("--baseline", help="compare against a previous --json result")
+    parser.add_argument("--threshold", type=float, default=10.0, help="percent change to report")
+    parser.add_argument("--fail-over", type=float, help="exit 1 if a metric regresses by more than this percent")
+    parser.add_argument("--check-legacy", action="store_true",
+                        help="compare the build with per-run formatting and python-docx tables, then exit")
+    args = parser.parse_args()
+
+    import docx
+    sections = load_sections(args.content)
+    if args.check_legacy:
+        failures = []
+        for factor in (int(f) for f in args.scale.split(',')):
+            inflated = inflate(sections, factor)
+            failures += check_tables(inflated, args.repeat) + check_document(inflated, args.repeat)
+        sys.exit(1 if failures else 0)
+    results = {
+        'meta': {'python': platform.python_version(), 'platform': platform.platform(),
+                 'python_docx': getattr(docx, '__version__', 'unknown'),
+                 'created': time.strftime('%Y-%m-%dT%H:%M:%S'), 'repeat': args.repeat},
+        'runs': {},
+    }
+    for factor in (int(f) for f in args.scale.split(',')):
+        result = run(inflate(sections, factor), args.repeat)
+        results['runs'][f"{factor}x"] = result
+        print_summary(factor, result)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.json}")
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.fail_over if args.fail_over is not None else args.threshold)
+        if args.fail_over is not None and regressions:
+            sys.exit(1)
@@ -0,0 +1,225 @@
+"""
+UniTrack Proposal Incremental Build
+Rebuilds the proposal .docx from proposal_content/ only when an input changed
+
+Usage:
+    python proposal_build.py                 rebuild if content, mockups or generator changed
+    python proposal_build.py --force         always rebuild the whole document
+    python proposal_build.py --render-mockups  render figures in memory instead of reading mockups/
+
+The manifest written next to the output records the content hashes, the mockup
+image and CSV table hashes and the generator version. An up-to-date check only
+reads the small content files and stats the assets, so python-docx is never
+imported for a no-op build. When only section files changed, just those
+sections are rebuilt and patched into the existing document.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import time
+
+CONTENT_DIR = 'proposal_content'
+INDEX_FILE = 'proposal.json'
+DEFAULT_OUTPUT = 'UniTrack_Project_Proposal_SKSU_Final.docx'
+
+# Bump when the compiled output changes without a change to the generator sources
+GENERATOR_VERSION = 1
+GENERATOR_SOURCES = ('generate_proposal.py', 'proposal_ir.py', 'proposal_build.py', 'proposal_patch.py',
+                     'create_mockups.py')
+
+def file_digest(path):
+    """sha256 of a file's contents"""
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def section_path(content_dir, section_id):
+    return os.path.join(content_dir, 'sections', section_id + '.json')
+
+def read_content(content_dir=CONTENT_DIR):
+    """Load the section index and section files: (sections, {path: sha256})
+
+    sections is a list of (section id, section dict) in document order.
+    """
+    digests = {}
+
+    def load(path):
+        with open(path, 'rb') as f:
+            data = f.read()
+        digests[path] = hashlib.sha256(data).hexdigest()
+        return json.loads(data)
+
+    index = load(os.path.join(content_dir, INDEX_FILE))
+    sections = [(sid, load(section_path(content_dir, sid))) for sid in index['sections']]
+    return sections, digests
+
+def load_sections(content_dir=CONTENT_DIR):
+    """Section (id, dict) pairs in document order"""
+    return read_content(content_dir)[0]
+
+def asset_paths(sections, render_mockups=None):
+    """Files referenced by blocks (figure images, CSV table sources), in document order.
+
+    Figures of rendered screens come from the generator, not from disk.
+    """
+    paths = []
+    for _, section in sections:
+        for block in section['blocks']:
+            if block['type'] == 'figure' and not (render_mockups and 'screen' in block):
+                paths.append(block['image'])
+            elif block['type'] == 'table' and 'csv' in block:
+                paths.append(block['csv'])
+    return paths
+
+def asset_digests(paths, previous=None):
+    """Hash assets, reusing the previous digest when size and mtime are unchanged"""
+    previous = previous or {}
+    digests = {}
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            digests[path] = None
+            continue
+        entry = previous.get(path)
+        if entry and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+            digests[path] = entry
+        else:
+            digests[path] = {'sha256': file_digest(path), 'size': stat.st_size,
+                             'mtime_ns': stat.st_mtime_ns}
+    return digests
+
+def generator_digest():
+    """Hash of the generator version and sources"""
+    h = hashlib.sha256(str(GENERATOR_VERSION).encode())
+    here = os.path.dirname(os.path.abspath(__file__))
+    for name in GENERATOR_SOURCES:
+        with open(os.path.join(here, name), 'rb') as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+def manifest_path(output_path):
+    return output_path + '.build.json'
+
+def read_manifest(output_path):
+    try:
+        with open(manifest_path(output_path), encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+
+def write_manifest(output_path, manifest):
+    with open(manifest_path(output_path), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+def output_stamp(output_path):
+    stat = os.stat(output_path)
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+def collect_inputs(content_dir, previous=None, render_mockups=None, reproducible=False):
+    """Current input state: (sections, manifest fields describing the inputs)"""
+    sections, content = read_content(content_dir)
+    assets = asset_digests(asset_paths(sections, render_mockups), (previous or {}).get('assets'))
+    inputs = {
+        'generator_version': GENERATOR_VERSION,
+        'generator': generator_digest(),
+        'render_mockups': render_mockups,
+        'reproducible': reproducible,
+        'content': content,
+        'assets': assets,
+    }
+    return sections, inputs
+
+def asset_hashes(assets):
+    return {path: entry and entry['sha256'] for path, entry in (assets or {}).items()}
+
+def is_up_to_date(manifest, inputs, output_path):
+    """True when the recorded inputs match and the output was not touched since"""
+    if manifest is None or not os.path.exists(output_path):
+        return False
+    for key, value in inputs.items():
+        if key == 'assets':
+            if asset_hashes(manifest.get(key)) != asset_hashes(value):
+                return False
+        elif manifest.get(key) != value:
+            return False
+    return manifest.get('output') == output_stamp(output_path)
+
+def changed_sections(manifest, inputs, sections, content_dir, output_path):
+    """Ids of the sections to patch when nothing but section files changed, else None"""
+    if manifest is None or not os.path.exists(output_path) or manifest.get('output') != output_stamp(output_path):
+        return None
+    for key, value in inputs.items():
+        if key == 'assets':
+            if asset_hashes(manifest.get(key)) != asset_hashes(value):
+                return None
+        elif key != 'content' and manifest.get(key) != value:
+            return None
+    old, new = manifest.get('content', {}), inputs['content']
+    index = os.path.join(content_dir, INDEX_FILE)
+    if old.get(index) != new[index]:
+        return None
+    return [sid for sid, _ in sections if old.get(section_path(content_dir, sid)) != new[section_path(content_dir, sid)]]
+
+def build(output_path=DEFAULT_OUTPUT, content_dir=CONTENT_DIR, workers=1, force=False,
+          render_mockups=None, reproducible=False):
+    """Rebuild output_path when an input changed; returns True if it was written.
+
+    When only section files changed, those sections are patched into the
+    existing document instead (see proposal_patch).
+    """
+    previous = read_manifest(output_path)
+    sections, inputs = collect_inputs(content_dir, previous, render_mockups, reproducible)
+    if not force and is_up_to_date(previous, inputs, output_path):
+        if inputs['assets'] != previous['assets']:
+            write_manifest(output_path, dict(previous, assets=inputs['assets']))
+        return False
+
+    changed = None if force else changed_sections(previous, inputs, sections, content_dir, output_path)
+    if changed:
+        from proposal_patch import PatchError, patch_sections
+        figures = None
+        if render_mockups:
+            from create_mockups import render_png
+            from proposal_ir import figure_screens
+            figures = {screen: render_png(screen, quality=render_mockups)
+                       for sid, section in sections if sid in changed for screen in figure_screens(section)}
+        try:
+            patch_sections(output_path, [(sid, section) for sid, section in sections if sid in changed],
+                           figures, reproducible)
+            print(f"Patched sections: {', '.join(changed)}")
+        except PatchError as e:
+            print(f"Full rebuild: {e}")
+            changed = None
+    if not changed:
+        from generate_proposal import create_proposal
+        create_proposal(output_path, workers=workers, content_dir=content_dir, render_mockups=render_mockups,
+                        reproducible=reproducible)
+
+    write_manifest(output_path, dict(inputs, output=output_stamp(output_path),
+                                     output_sha256=file_digest(output_path)))
+    return True
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Incrementally build the UniTrack project proposal")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    parser.add_argument("--content", default=CONTENT_DIR, help="proposal content directory")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="build sections in N worker processes (0 = one per CPU)")
+    parser.add_argument("--force", action="store_true", help="rebuild even if nothing changed")
+    # create_mockups.QUALITY_PRESETS, spelled out so a no-op build does not import Pillow
+    parser.add_argument("--render-mockups", nargs="?", const="draft", choices=("draft", "standard", "print"),
+                        help="render the figure mockups in memory at this quality instead of reading mockups/")
+    parser.add_argument("--reproducible", action="store_true",
+                        help="byte-identical output for identical inputs (see generate_proposal.save_document)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    written = build(args.output, args.content, workers=args.workers or None, force=args.force,
+                    render_mockups=args.render_mockups, reproducible=args.reproducible)
+    elapsed = (time.perf_counter() - start) * 1000
+    if not written:
+        print(f"Up to date: {args.output} ({elapsed:.1f} ms)")
+    else:
+        print(f"Rebuilt in {elapsed:.0f} ms")
@@ -0,0 +1,243 @@
+"""
+UniTrack Proposal HTML Renderer
+Streams the proposal IR to a static page under website/ (the Firebase Hosting
+public directory), sharing content and named styles with the .docx build
+
+Usage:
+    python proposal_html.py                      writes website/proposal/index.html
+    python proposal_html.py --out build/proposal
+
+The writer emits markup node by node as the sections are lowered; no document
+tree is built, so the page is ready in a few milliseconds.
+"""
+
+import argparse
+import hashlib
+import html
+import os
+import re
+import time
+
+import proposal_ir as ir
+from proposal_build import CONTENT_DIR, load_sections
+
+HTML_DIR = os.path.join('website', 'proposal')
+FIGURE_DIR = 'figures'
+TABLE_BAND_COLOR = 'E8F4FC'
+
+LIST_TAGS = {'UT Bullet': 'ul', 'UT Numbered': 'ol', 'UT Step': 'ol'}
+
+PAGE_HEAD = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>UniTrack Project Proposal - Sultan Kudarat State University</title>
+    <style>
+        body { font-family: 'Times New Roman', Times, serif; font-size: 12pt; color: #000; margin: 0; background: #f0f0f0; }
+        main { max-width: 6.5in; margin: 0 auto; padding: 0.75in 1in; background: #fff; }
+        section { padding-bottom: 0.5in; margin-bottom: 0.5in; border-bottom: 1px solid #ddd; }
+        section:last-child { border-bottom: none; }
+        p, li, h1, h2, h3 { margin: 0; }
+        ul, ol { margin: 0; padding-left: 0.5in; }
+        a { color: inherit; text-decoration: none; }
+        .ut-table { border-collapse: collapse; margin: 0 auto; width: 100%%; }
+        .ut-table th, .ut-table td { border: 1px solid #000; padding: 2pt 5pt; vertical-align: top; }
+        .ut-table tbody tr:nth-child(even) td { background: #%(band)s; }
+        figure { margin: 0; text-align: center; }
+        figure img { max-width: 100%%; height: auto; }
+%(rules)s
+    </style>
+</head>
+<body>
+<main>
+"""
+
+PAGE_TAIL = """</main>
+</body>
+</html>
+"""
+
+def css_class(style):
+    return style.lower().replace(' ', '-')
+
+def resolved_style(name):
+    """Spacing and font of a paragraph style with its UT base styles folded in"""
+    base, para, font = ir.PARAGRAPH_STYLES[name]
+    if base in ir.PARAGRAPH_STYLES:
+        base_para, base_font = resolved_style(base)
+        return dict(base_para, **para), dict(base_font, **font)
+    return dict(para), dict(font)
+
+def font_css(font):
+    rules = []
+    if 'size' in font:
+        rules.append(f"font-size: {font['size']}pt")
+    if 'bold' in font:
+        rules.append(f"font-weight: {'bold' if font['bold'] else 'normal'}")
+    if 'italic' in font:
+        rules.append(f"font-style: {'italic' if font['italic'] else 'normal'}")
+    if 'color' in font:
+        rules.append("color: #%02x%02x%02x" % font['color'])
+    return rules
+
+def paragraph_css(para):
+    rules = [f"margin-top: {para.get('before', 0)}pt", f"margin-bottom: {para.get('after', 0)}pt"]
+    if 'line_spacing' in para:
+        rules.append(f"line-height: {para['line_spacing']}")
+    if 'first_line_indent' in para:
+        rules.append(f"text-indent: {para['first_line_indent']}in")
+    if 'left_indent' in para:
+        rules.append(f"margin-left: {para['left_indent']}in")
+    if 'align' in para:
+        rules.append(f"text-align: {para['align']}")
+    return rules
+
+def style_sheet():
+    """CSS rules for every named paragraph and character style"""
+    lines = []
+    for name in ir.PARAGRAPH_STYLES:
+        para, font = resolved_style(name)
+        lines.append(f"        .{css_class(name)} {{ {'; '.join(paragraph_css(para) + font_css(font))}; }}")
+    for name, font in ir.CHARACTER_STYLES.items():
+        lines.append(f"        .{css_class(name)} {{ {'; '.join(font_css(font))}; }}")
+    return "\n".join(lines)
+
+def anchor(text):
+    """Fragment id for a heading or TOC entry, keyed on its section number when it has one"""
+    number = re.match(r'(\d+(?:\.\d+)*)\.?\s', text)
+    if number:
+        return 'section-' + number.group(1).replace('.', '-')
+    return re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-')
+
+def escape_text(text):
+    return html.escape(text, quote=False).replace('\n', '<br>')
+
+def write_if_changed(path, data):
+    """Write data unless the file already holds it, so hosting deploys see stable files"""
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return
+    except FileNotFoundError:
+        pass
+    with open(path, 'wb') as f:
+        f.write(data)
+
+def runs_html(runs):
+    return ''.join(escape_text(text) if style is None
+                   else f'<span class="{css_class(style)}">{escape_text(text)}</span>'
+                   for text, style in runs)
+
+class HtmlWriter:
+    """Writes IR nodes to a text stream as they arrive"""
+
+    def __init__(self, out, out_dir, figures=None):
+        self.out = out
+        self.out_dir = out_dir
+        self.figures = figures or {}
+        self.figure_files = set()
+        self.open_list = None
+        self.in_section = False
+
+    def start(self):
+        self.out.write(PAGE_HEAD % {'band': TABLE_BAND_COLOR, 'rules': style_sheet()})
+
+    def finish(self):
+        self.close_list()
+        if self.in_section:
+            self.out.write('</section>\n')
+        self.out.write(PAGE_TAIL)
+
+    def close_list(self):
+        if self.open_list:
+            self.out.write(f'</{LIST_TAGS[self.open_list]}>\n')
+            self.open_list = None
+
+    def write(self, node):
+        write = self.out.write
+        if isinstance(node, ir.ListItem):
+            # A numbered item 1 starts a new list even right after another one
+            if self.open_list != node.style or node.number == 1:
+                self.close_list()
+                write(f'<{LIST_TAGS[node.style]} class="{css_class(node.style)}">\n')
+                self.open_list = node.style
+            write(f'<li class="{css_class(node.style)}">{runs_html(node.runs)}</li>\n')
+            return
+        self.close_list()
+
+        if isinstance(node, ir.SectionStart):
+            if self.in_section:
+                write('</section>\n')
+            write(f'<section id="{node.id}">\n' if node.id else '<section>\n')
+            self.in_section = True
+        elif isinstance(node, ir.Heading):
+            write(f'<h{node.level} id="{anchor(node.text)}" class="heading-{node.level}">'
+                  f'{escape_text(node.text)}</h{node.level}>\n')
+        elif isinstance(node, ir.Paragraph):
+            write(f'<p class="{css_class(node.style)}">{runs_html(node.runs)}</p>\n')
+        elif isinstance(node, ir.TocEntry):
+            write(f'<p class="ut-toc-entry"><a href="#{anchor(node.text)}">{escape_text(node.text)}</a></p>\n')
+        elif isinstance(node, ir.Table):
+            self.write_table(node)
+        elif isinstance(node, ir.Figure):
+            self.write_figure(node)
+        elif isinstance(node, ir.Spacer):
+            write(f'<div style="height: {node.count * 12}pt"></div>\n')
+
+    def write_table(self, node):
+        write = self.out.write
+        write(f'<table class="ut-table"><thead style="background: #{node.header_color}"><tr>')
+        for header in node.headers:
+            write(f'<th class="ut-table-header">{escape_text(str(header))}</th>')
+        write('</tr></thead>\n<tbody>\n')
+        for row in node.rows:
+            write('<tr>' + ''.join(f'<td class="ut-table-text">{escape_text(str(value))}</td>'
+                                   for value in row) + '</tr>\n')
+        write('</tbody></table>\n')
+
+    def write_figure(self, node):
+        image = self.figures.get(node.screen)
+        if image is None:
+            if not os.path.exists(node.image):
+                raise FileNotFoundError(f"figure image {node.image!r} is missing; run create_mockups.py")
+            with open(node.image, 'rb') as f:
+                image = f.read()
+        # Named by content: figures sharing a file name in different directories stay apart,
+        # and an edited image gets a new URL past any hosting cache
+        stem, ext = os.path.splitext(os.path.basename(node.image))
+        name = f"{stem}-{hashlib.sha256(image).hexdigest()[:12]}{ext}"
+        self.figure_files.add(name)
+        write_if_changed(os.path.join(self.out_dir, FIGURE_DIR, name), image)
+        caption = escape_text(node.caption)
+        self.out.write(f'<figure><img src="{FIGURE_DIR}/{name}" alt="{html.escape(node.caption)}" '
+                       f'style="width: {node.width}in">\n'
+                       f'<figcaption class="ut-caption">{caption}</figcaption></figure>\n')
+
+def build_html(out_dir=HTML_DIR, content_dir=CONTENT_DIR, figures=None):
+    """Render the proposal to out_dir/index.html; figures maps screens to PNG bytes"""
+    os.makedirs(os.path.join(out_dir, FIGURE_DIR), exist_ok=True)
+    path = os.path.join(out_dir, 'index.html')
+    with open(path, 'w', encoding='utf-8') as out:
+        writer = HtmlWriter(out, out_dir, figures)
+        writer.start()
+        for section_id, section in load_sections(content_dir):
+            for node in ir.lower_section(section, section_id):
+                writer.write(node)
+        writer.finish()
+    # Drop figures of earlier builds that the page no longer references
+    figure_dir = os.path.join(out_dir, FIGURE_DIR)
+    for name in os.listdir(figure_dir):
+        if name not in writer.figure_files:
+            os.remove(os.path.join(figure_dir, name))
+    return path
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render the UniTrack project proposal as HTML")
+    parser.add_argument("--out", default=HTML_DIR, help="output directory (default: website/proposal)")
+    parser.add_argument("--content", default=CONTENT_DIR, help="proposal content directory")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    path = build_html(args.out, args.content)
+    print(f"Created: {path} ({(time.perf_counter() - start) * 1000:.1f} ms)")
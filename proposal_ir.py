@@ -0,0 +1,137 @@
+"""
+UniTrack Proposal Document IR
+Backend-neutral nodes lowered from the proposal_content/ sections, plus the
+named style registry shared by the docx (generate_proposal) and HTML
+(proposal_html) renderers
+"""
+
+from collections import namedtuple
+import csv
+
+# Named styles shared by both renderers: generate_proposal writes them into the
+# docx styles part once, proposal_html turns them into CSS classes.
+# Paragraph styles: name -> (base style, spacing/indents, font)
+PARAGRAPH_STYLES = {
+    'Heading 1': (None, dict(before=12, after=6), dict(size=16, bold=True, color=(0, 51, 102))),
+    'Heading 2': (None, dict(before=12, after=6), dict(size=14, bold=True, color=(0, 76, 153))),
+    'Heading 3': (None, dict(before=12, after=6), dict(size=12, bold=True, color=(51, 51, 51))),
+    'UT Body': ('Normal', dict(before=0, after=12, line_spacing=1.5, first_line_indent=0.5), {}),
+    'UT Body First': ('UT Body', dict(before=6, after=12, line_spacing=1.5), {}),
+    'UT Text': ('Normal', dict(before=0, after=12, line_spacing=1.5), {}),
+    'UT Text First': ('UT Text', dict(before=6, after=12, line_spacing=1.5), {}),
+    'UT Figure Intro': ('Normal', dict(before=0, after=8, line_spacing=1.5), {}),
+    'UT List Intro': ('Normal', dict(before=6, after=8, line_spacing=1.5), {}),
+    'UT Bullet': ('List Bullet', dict(before=2, after=4, line_spacing=1.15), {}),
+    'UT Numbered': ('Normal', dict(before=2, after=4, line_spacing=1.15, left_indent=0.25), {}),
+    'UT Step': ('Normal', dict(before=4, after=8, line_spacing=1.5, left_indent=0.25), {}),
+    'UT Phase': ('Normal', dict(before=12, after=6), dict(bold=True, color=(0, 76, 153))),
+    'UT Caption': ('Normal', dict(before=4, after=12, align='center'), dict(size=10, italic=True, color=(102, 102, 102))),
+    'UT Note': ('Normal', dict(before=8, after=12), dict(size=11, italic=True, color=(102, 102, 102))),
+    'UT Reference': ('Normal', dict(before=2, after=4, line_spacing=1.15, left_indent=0.5, first_line_indent=-0.5),
+                     dict(size=11)),
+    'UT Table Header': ('Normal', dict(align='center'), dict(size=11, bold=True, color=(255, 255, 255))),
+    'UT Table Text': ('Normal', {}, dict(size=11)),
+    'UT TOC Title': ('Normal', dict(before=0, after=24, align='center'), dict(size=18, bold=True, color=(0, 51, 102))),
+    'UT TOC Entry': ('Normal', dict(before=4, after=4, line_spacing=1.5), {}),
+    'UT Callout': ('Normal', dict(before=12, after=12, align='center'), dict(size=14, bold=True, color=(0, 128, 0))),
+    'UT Total': ('Normal', dict(align='center'), dict(size=14, bold=True, color=(0, 51, 102))),
+    'UT Total Cost': ('Normal', dict(align='center'), dict(size=18, bold=True, color=(0, 128, 0))),
+    'UT Cover Institution': ('Normal', dict(align='center'), dict(size=20, bold=True, color=(0, 51, 102))),
+    'UT Cover Heading': ('Normal', dict(align='center'), dict(size=16, bold=True, color=(0, 51, 102))),
+    'UT Cover Title': ('Normal', dict(align='center'), dict(size=36, bold=True, color=(0, 128, 0))),
+    'UT Cover Subtitle': ('Normal', dict(align='center'), dict(size=18, bold=True, color=(51, 51, 51))),
+    'UT Cover Muted': ('Normal', dict(align='center'), dict(color=(102, 102, 102))),
+    'UT Cover Tagline': ('Normal', dict(align='center'), dict(italic=True, color=(102, 102, 102))),
+    'UT Cover Date': ('Normal', dict(align='center'), dict(bold=True, color=(0, 51, 102))),
+}
+
+# Character styles: name -> font
+CHARACTER_STYLES = {
+    'UT Strong': dict(bold=True),
+    'UT Emphasis': dict(italic=True),
+    'UT Brand': dict(bold=True, color=(0, 128, 0)),
+    'UT Label': dict(bold=True, color=(0, 51, 102)),
+    'UT Leader': dict(color=(180, 180, 180)),
+}
+
+# Runs are tuples of (text, character style name or None)
+SectionStart = namedtuple('SectionStart', 'id title')
+Heading = namedtuple('Heading', 'level text')
+Paragraph = namedtuple('Paragraph', 'style runs')
+ListItem = namedtuple('ListItem', 'style number runs')  # number is None for bullets
+TocEntry = namedtuple('TocEntry', 'text page')
+Table = namedtuple('Table', 'headers rows header_color')
+Figure = namedtuple('Figure', 'screen image caption width')
+Spacer = namedtuple('Spacer', 'count')
+PageBreak = namedtuple('PageBreak', '')
+
+FIGURE_WIDTH = 2.5  # inches
+
+def read_csv_table(path):
+    """Open a CSV file as (headers, rows), streaming the rows while the table is built"""
+    f = open(path, newline='', encoding='utf-8')
+    reader = csv.reader(f)
+    headers = next(reader)
+    
+    def rows():
+        with f:
+            yield from reader
+    
+    return headers, rows()
+
+def lower_runs(block):
+    """Runs of a paragraph block"""
+    if 'text' in block:
+        return ((block['text'], None),)
+    return tuple((run, None) if isinstance(run, str) else tuple(run) for run in block['runs'])
+
+def lower_block(block):
+    """Yield the IR nodes for one content block"""
+    kind = block['type']
+    if kind == 'heading':
+        yield Heading(block.get('level', 1), block['text'])
+    elif kind == 'paragraph':
+        yield Paragraph(block.get('style', 'UT Body'), lower_runs(block))
+    elif kind == 'bullets':
+        for item in block['items']:
+            if isinstance(item, str):
+                yield ListItem('UT Bullet', None, ((item, None),))
+            else:
+                yield ListItem('UT Bullet', None, ((item[0], 'UT Label'), (item[1], None)))
+    elif kind == 'numbered':
+        for i, item in enumerate(block['items'], 1):
+            yield ListItem('UT Numbered', i, ((item, None),))
+    elif kind == 'steps':
+        for i, (title, desc) in enumerate(block['items'], 1):
+            yield ListItem('UT Step', i, ((title, 'UT Strong'), (desc, None)))
+    elif kind == 'table':
+        if 'csv' in block:
+            headers, rows = read_csv_table(block['csv'])
+        else:
+            headers, rows = block['headers'], block['rows']
+        yield Table(headers, rows, block.get('header_color', '003366'))
+    elif kind == 'figure':
+        yield Figure(block.get('screen'), block['image'], block['caption'], block.get('width', FIGURE_WIDTH))
+    elif kind == 'toc':
+        for item, page in block['entries']:
+            yield TocEntry(item, page)
+    elif kind == 'references':
+        for i, ref in enumerate(block['items'], 1):
+            yield Paragraph('UT Reference', ((f"[{i}] ", 'UT Label'), (ref, None)))
+    elif kind == 'blank':
+        yield Spacer(block.get('count', 1))
+    elif kind == 'page_break':
+        yield PageBreak()
+    else:
+        raise ValueError(f"unknown content block type: {kind!r}")
+
+def lower_section(section, section_id=None):
+    """Yield the IR nodes of a section loaded from proposal_content/sections"""
+    yield SectionStart(section_id, section.get('title'))
+    for block in section['blocks']:
+        yield from lower_block(block)
+
+def figure_screens(section):
+    """Mockup screens shown by a section's figure blocks"""
+    return [block['screen'] for block in section['blocks']
+            if block['type'] == 'figure' and 'screen' in block]
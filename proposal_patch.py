@@ -0,0 +1,197 @@
+"""
+UniTrack Proposal Section Patching
+Replaces changed sections of an already generated proposal .docx in place
+
+Usage:
+    python proposal_patch.py cost_analysis                    patch one section into the default output
+    python proposal_patch.py cost_analysis risk_assessment --output other.docx
+
+generate_proposal wraps every section in a hidden _UT_<section id> bookmark.
+Patching builds only the named sections, splices their body XML between those
+bookmarks in word/document.xml, adds the images they use to the package and
+drops images nothing references any more. Every other part is copied across
+unchanged, so the cost follows the size of the edit rather than the document.
+proposal_build patches automatically when only section files changed.
+"""
+
+import argparse
+import hashlib
+import io
+import posixpath
+import time
+
+from docx.oxml.ns import nsmap, qn
+from lxml import etree
+
+import generate_proposal as gp
+from proposal_build import CONTENT_DIR, DEFAULT_OUTPUT, load_sections
+
+DOCUMENT_PART = 'word/document.xml'
+RELS_PART = 'word/_rels/document.xml.rels'
+STYLES_PART = 'word/styles.xml'
+CONTENT_TYPES_PART = '[Content_Types].xml'
+REL_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+CT_NS = 'http://schemas.openxmlformats.org/package/2006/content-types'
+IMAGE_REL = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/image'
+IMAGE_TYPES = {'png': 'image/png', 'jpeg': 'image/jpeg'}
+NAMESPACES = {'a': nsmap['a'], 'r': nsmap['r']}
+
+class PatchError(Exception):
+    """The package cannot be patched in place; rebuild it instead"""
+
+def image_extension(blob):
+    if blob.startswith(b'\x89PNG'):
+        return 'png'
+    if blob.startswith(b'\xff\xd8'):
+        return 'jpeg'
+    raise PatchError("unsupported image format in a patched section")
+
+def section_markers(body, section_id):
+    """The bookmarkStart and bookmarkEnd elements around a section"""
+    start = body.find(f"{qn('w:bookmarkStart')}[@{qn('w:name')}='{gp.section_bookmark(section_id)}']")
+    if start is None:
+        raise PatchError(f"section {section_id!r} has no bookmark; the document predates patching")
+    bookmark_id = start.get(qn('w:id'))
+    for element in start.itersiblings():
+        if element.tag == qn('w:bookmarkEnd') and element.get(qn('w:id')) == bookmark_id:
+            return start, element
+    raise PatchError(f"section {section_id!r} is not closed")
+
+def splice(body, section_id, fragment):
+    """Replace a section's body children (bookmarks included) with the fragment's.
+
+    Returns the image relationship ids the removed content used.
+    """
+    start, end = section_markers(body, section_id)
+    old = [start]
+    for element in start.itersiblings():
+        old.append(element)
+        if element is end:
+            break
+    for child in list(fragment):
+        start.addprevious(child)
+    removed = set()
+    for element in old:
+        removed.update(blip.get(qn('r:embed')) for blip in element.iter(qn('a:blip')))
+        body.remove(element)
+    return removed
+
+class Relationships:
+    """word/document.xml's image relationships and the media parts behind them"""
+
+    def __init__(self, parts):
+        self.parts = parts
+        self.root = etree.fromstring(parts[RELS_PART])
+        self.by_digest = {}
+        for rel in self.images():
+            media = self.media_name(rel)
+            if media in parts:
+                self.by_digest.setdefault(hashlib.sha256(parts[media]).hexdigest(), rel.get('Id'))
+
+    def images(self):
+        return [rel for rel in self.root if rel.get('Type') == IMAGE_REL and rel.get('TargetMode') != 'External']
+
+    @staticmethod
+    def media_name(rel):
+        return posixpath.normpath(posixpath.join('word', rel.get('Target')))
+
+    def next_id(self):
+        used = {rel.get('Id') for rel in self.root}
+        n = len(used) + 1
+        while f"rId{n}" in used:
+            n += 1
+        return f"rId{n}"
+
+    def add_image(self, blob):
+        """rId of an image relationship for blob, adding the media part if it is new"""
+        digest = hashlib.sha256(blob).hexdigest()
+        if digest in self.by_digest:
+            return self.by_digest[digest]
+        ext = image_extension(blob)
+        n = 1
+        while f"word/media/image{n}.{ext}" in self.parts:
+            n += 1
+        self.parts[f"word/media/image{n}.{ext}"] = blob
+        ensure_content_type(self.parts, ext)
+        rId = self.next_id()
+        etree.SubElement(self.root, f'{{{REL_NS}}}Relationship',
+                         Id=rId, Type=IMAGE_REL, Target=f"media/image{n}.{ext}")
+        self.by_digest[digest] = rId
+        return rId
+
+    def prune(self, document, candidates):
+        """Drop the candidate image relationships the document no longer uses, and their media"""
+        for rel in self.images():
+            rId = rel.get('Id')
+            if rId in candidates and not document.xpath('//a:blip[@r:embed=$rId]', namespaces=NAMESPACES, rId=rId):
+                self.root.remove(rel)
+                self.parts.pop(self.media_name(rel), None)
+
+    def serialize(self):
+        self.parts[RELS_PART] = etree.tostring(self.root, xml_declaration=True,
+                                               encoding='UTF-8', standalone=True)
+
+def ensure_content_type(parts, ext):
+    root = etree.fromstring(parts[CONTENT_TYPES_PART])
+    if any(d.get('Extension', '').lower() == ext for d in root.iter(f'{{{CT_NS}}}Default')):
+        return
+    etree.SubElement(root, f'{{{CT_NS}}}Default', Extension=ext, ContentType=IMAGE_TYPES[ext])
+    root[:] = sorted(root, key=lambda e: e.tag != f'{{{CT_NS}}}Default')
+    parts[CONTENT_TYPES_PART] = etree.tostring(root, xml_declaration=True, encoding='UTF-8', standalone=True)
+
+def check_table_styles(fragment, styles):
+    """A section may only use table styles the package already defines"""
+    defined = {style.get(qn('w:styleId')) for style in styles.iter(qn('w:style'))}
+    for tbl_style in fragment.iter(qn('w:tblStyle')):
+        if tbl_style.get(qn('w:val')) not in defined:
+            raise PatchError(f"table style {tbl_style.get(qn('w:val'))!r} is not in the package")
+
+def patch_sections(output_path, sections, figures=None, reproducible=False, compresslevel=None):
+    """Rebuild the given (section id, section) pairs inside output_path"""
+    with open(output_path, 'rb') as f:
+        parts = gp.read_package(f)
+    document = etree.fromstring(parts[DOCUMENT_PART])
+    body = document.find(qn('w:body'))
+    styles = etree.fromstring(parts[STYLES_PART])
+    rels = Relationships(parts)
+
+    removed = set()
+    for section_id, section in sections:
+        fragment_xml, images = gp.build_section_fragment(section, figures, section_id)
+        fragment = etree.fromstring(fragment_xml)
+        check_table_styles(fragment, styles)
+        remapped = {rId: rels.add_image(blob) for rId, blob in images.items()}
+        for blip in fragment.iter(qn('a:blip')):
+            blip.set(qn('r:embed'), remapped[blip.get(qn('r:embed'))])
+        removed |= splice(body, section_id, fragment)
+
+    for i, doc_pr in enumerate(body.iter(qn('wp:docPr')), 1):
+        doc_pr.set('id', str(i))
+    rels.prune(document, removed)
+    rels.serialize()
+    parts[DOCUMENT_PART] = etree.tostring(document, xml_declaration=True, encoding='UTF-8', standalone=True)
+
+    # Write to memory first so a failed write cannot truncate the document
+    buffer = io.BytesIO()
+    gp.write_package(parts, buffer, gp.reproducible_date() if reproducible else None, compresslevel)
+    with open(output_path, 'wb') as f:
+        f.write(buffer.getvalue())
+    return [section_id for section_id, _ in sections]
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rebuild single sections of a generated UniTrack proposal")
+    parser.add_argument("sections", nargs="+", help="section ids from proposal_content/proposal.json")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    parser.add_argument("--content", default=CONTENT_DIR, help="proposal content directory")
+    parser.add_argument("--reproducible", action="store_true",
+                        help="fixed zip dates, matching a --reproducible build")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    known = dict(load_sections(args.content))
+    unknown = [sid for sid in args.sections if sid not in known]
+    if unknown:
+        parser.error(f"unknown sections: {', '.join(unknown)}")
+    patch_sections(args.output, [(sid, known[sid]) for sid in args.sections], reproducible=args.reproducible)
+    print(f"Patched {', '.join(args.sections)} in {args.output} "
+          f"({(time.perf_counter() - start) * 1000:.0f} ms)")
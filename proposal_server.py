@@ -0,0 +1,258 @@
+"""
+UniTrack Proposal Service
+Builds the proposal .docx on demand for reviewers over HTTP
+
+Usage:
+    python proposal_server.py --port 8766
+    GET /proposal                            the proposal from the current proposal_content/
+    GET /proposal?variant=isulan&reproducible=1
+    GET /variants                            variant names from proposal_content/variants.json
+    GET /metrics                             request counts and per-stage latency percentiles
+
+Builds run in a process pool whose workers start with the styled template,
+style ids and prepared figure images from the parent, and keep a few
+template documents already parsed. A request takes a warm template, adds the
+sections and serializes it, and the worker parses a replacement in the
+background, so the latency is the content build and the save. Content is
+re-read on every request and identical content is served from an LRU with
+an ETag. The key covers the sections, the figure and CSV files they
+reference and the workers' template, so an edited mockup gets a new ETag.
+Each response carries a Server-Timing header with its stages.
+"""
+
+import argparse
+import asyncio
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import parse_qs, urlsplit
+
+import generate_proposal as gp
+from http_service import HttpService, etag_matches
+from mockup_server import RenderCache
+from proposal_build import CONTENT_DIR, asset_digests, asset_hashes, asset_paths, generator_digest, load_sections
+from proposal_variants import VARIANTS_FILE, prepare_shared, variant_sections
+
+DOCX_TYPE = 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
+STAGES = ('total', 'queue', 'template', 'build', 'save')
+METRICS_WINDOW = 1000
+
+# Worker process state: template documents parsed ahead of the requests that fill them
+_warm_templates = []
+_warm_size = 0
+_refill_lock = threading.Lock()
+
+def init_worker(shared, warm):
+    """Process pool initializer: adopt the parent's template and images, then pre-parse templates"""
+    global _warm_size
+    gp.load_shared_state(shared)
+    _warm_size = warm
+    refill_templates()
+
+def refill_templates():
+    with _refill_lock:
+        while len(_warm_templates) < _warm_size:
+            _warm_templates.append(gp.new_document())
+
+def ping():
+    return os.getpid()
+
+def build_request(sections, reproducible):
+    """Build one proposal in a worker: (docx bytes, stage timings)"""
+    started = time.time()
+    start = time.perf_counter()
+    warm = bool(_warm_templates)
+    doc = _warm_templates.pop() if warm else gp.new_document()
+    template_done = time.perf_counter()
+    for section_id, section in sections:
+        gp.build_section(doc, section, section_id=section_id)
+    build_done = time.perf_counter()
+    buffer = io.BytesIO()
+    gp.save_document(doc, buffer, reproducible)
+    save_done = time.perf_counter()
+    threading.Thread(target=refill_templates, daemon=True).start()
+    return buffer.getvalue(), {'started': started, 'warm': warm,
+                               'template': template_done - start,
+                               'build': build_done - template_done,
+                               'save': save_done - build_done}
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+class ProposalServer(HttpService):
+    """asyncio HTTP front end over a warm proposal build pool"""
+
+    def __init__(self, workers=None, warm=2, content_dir=CONTENT_DIR, variants_file=VARIANTS_FILE,
+                 cache=None):
+        self.content_dir = content_dir
+        self.variants_file = variants_file
+        self.workers = workers or os.cpu_count() or 1
+        shared = prepare_shared([(None, load_sections(content_dir), None, False)])
+        # The workers keep this template and these generator sources for the server's lifetime
+        template, style_ids, _ = shared
+        self.build_digest = hashlib.sha256(
+            template + json.dumps(style_ids, sort_keys=True).encode() + generator_digest().encode()).hexdigest()
+        self.assets = {}
+        self.executor = ProcessPoolExecutor(max_workers=self.workers, initializer=init_worker,
+                                            initargs=(shared, warm))
+        self.cache = cache or RenderCache(max_entries=32, max_bytes=64 * 1024 * 1024)
+        self.pending = {}
+        self.requests = 0
+        self.builds = 0
+        self.warm_hits = 0
+        self.timings = deque(maxlen=METRICS_WINDOW)
+
+    def variants(self):
+        try:
+            with open(self.variants_file, encoding='utf-8') as f:
+                return {variant['name']: variant for variant in json.load(f)['variants']}
+        except FileNotFoundError:
+            return {}
+
+    def sections(self, variant_name):
+        """The (id, section) list to build, read from disk for this request"""
+        sections = load_sections(self.content_dir)
+        if variant_name is None:
+            return sections
+        variant = self.variants().get(variant_name)
+        if variant is None:
+            raise LookupError(f"unknown variant: {variant_name!r}")
+        return variant_sections(sections, variant, os.path.dirname(self.variants_file))
+
+    async def build(self, sections, reproducible):
+        """(body, etag, timings) for the sections, building at most once per content concurrently"""
+        key = self.content_key(sections, reproducible)
+        entry = self.cache.get(key)
+        if entry is not None:
+            return entry + ({},)
+        future = self.pending.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._build(key, sections, reproducible))
+            self.pending[key] = future
+            future.add_done_callback(lambda _: self.pending.pop(key, None))
+        return await asyncio.shield(future)
+
+    def content_key(self, sections, reproducible):
+        """Cache key and ETag: the sections, the referenced figure and CSV files, and the template"""
+        paths = asset_paths(sections)
+        # Digests are reused while a file's size and mtime are unchanged
+        self.assets.update(asset_digests(paths, self.assets))
+        assets = asset_hashes({path: self.assets[path] for path in paths})
+        return hashlib.sha256(json.dumps([sections, reproducible, assets, self.build_digest],
+                                         sort_keys=True).encode()).hexdigest()
+
+    async def _build(self, key, sections, reproducible):
+        loop = asyncio.get_running_loop()
+        submitted = time.time()
+        body, timings = await loop.run_in_executor(self.executor, build_request, sections, reproducible)
+        timings['queue'] = max(0.0, timings.pop('started') - submitted)
+        self.builds += 1
+        self.warm_hits += timings.pop('warm')
+        return self.cache.put(key, body) + (timings,)
+
+    def metrics(self):
+        stages = {}
+        for stage in STAGES:
+            values = [t[stage] for t in self.timings if stage in t]
+            if values:
+                stages[stage] = {'mean_ms': round(sum(values) / len(values) * 1000, 2),
+                                 'p50_ms': round(percentile(values, 0.5) * 1000, 2),
+                                 'p95_ms': round(percentile(values, 0.95) * 1000, 2),
+                                 'max_ms': round(max(values) * 1000, 2)}
+        return {'requests': self.requests, 'builds': self.builds, 'warm_templates': self.warm_hits,
+                'in_flight': len(self.pending), 'workers': self.workers,
+                'cache': self.cache.stats(), 'stages': stages}
+
+    async def dispatch(self, writer, method, target, headers, keep_alive):
+        if method not in ("GET", "HEAD"):
+            await self.respond(writer, 405, b"only GET and HEAD are supported", keep_alive=keep_alive)
+            return
+        head_only = method == "HEAD"
+        url = urlsplit(target)
+        if url.path == "/variants":
+            body = json.dumps({"variants": list(self.variants())}).encode()
+            await self.respond(writer, 200, body, "application/json", keep_alive=keep_alive,
+                               head_only=head_only)
+        elif url.path == "/metrics":
+            await self.respond(writer, 200, json.dumps(self.metrics()).encode(), "application/json",
+                               keep_alive=keep_alive, head_only=head_only)
+        elif url.path in ("/", "/proposal"):
+            await self.serve_proposal(writer, url.query, headers, keep_alive, head_only)
+        else:
+            await self.respond(writer, 404, b"not found", keep_alive=keep_alive)
+
+    async def serve_proposal(self, writer, query, headers, keep_alive, head_only):
+        start = time.perf_counter()
+        self.requests += 1
+        params = {k: v[-1] for k, v in parse_qs(query).items()}
+        variant = params.get("variant") or None
+        reproducible = params.get("reproducible", "") not in ("", "0", "false")
+        try:
+            sections = self.sections(variant)
+        except LookupError as e:
+            await self.respond(writer, 404, str(e).encode(), keep_alive=keep_alive)
+            return
+        except ValueError as e:
+            await self.respond(writer, 400, str(e).encode(), keep_alive=keep_alive)
+            return
+        try:
+            body, etag, timings = await self.build(sections, reproducible)
+        except Exception as e:
+            await self.respond(writer, 500, f"build failed: {e}".encode(), keep_alive=keep_alive)
+            return
+
+        timings = dict(timings, total=time.perf_counter() - start)
+        self.timings.append(timings)
+        filename = f"UniTrack_Project_Proposal_{variant or 'SKSU'}.docx"
+        extra = {"ETag": etag, "Cache-Control": "no-cache",
+                 "Content-Disposition": f'attachment; filename="{filename}"',
+                 "Server-Timing": ", ".join(f"{stage};dur={timings[stage] * 1000:.1f}"
+                                            for stage in STAGES if stage in timings)}
+        if etag_matches(headers.get("if-none-match", ""), etag):
+            await self.respond(writer, 304, b"", None, extra, keep_alive=keep_alive)
+        else:
+            await self.respond(writer, 200, body, DOCX_TYPE, extra, keep_alive=keep_alive,
+                               head_only=head_only)
+
+    async def serve(self, host, port):
+        # Start every worker now (tasks submitted together each get a process), so
+        # the first requests do not pay for process start-up and template parsing
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(loop.run_in_executor(self.executor, ping) for _ in range(self.workers)))
+        server = await asyncio.start_server(self.handle, host, port)
+        print(f"Proposal service listening on http://{host}:{port}/ ({self.workers} workers)")
+        async with server:
+            await server.serve_forever()
+
+    def close(self):
+        self.executor.shutdown(cancel_futures=True)
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the UniTrack proposal built on demand")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--workers", type=int, default=None, help="build processes (default: CPU count)")
+    parser.add_argument("--warm-templates", type=int, default=2,
+                        help="parsed template documents each worker keeps ready")
+    parser.add_argument("--content", default=CONTENT_DIR, help="proposal content directory")
+    parser.add_argument("--variants", default=VARIANTS_FILE, help="variant manifest")
+    parser.add_argument("--cache-entries", type=int, default=32)
+    args = parser.parse_args()
+
+    server = ProposalServer(args.workers, args.warm_templates, args.content, args.variants,
+                            RenderCache(args.cache_entries, 64 * 1024 * 1024))
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+
+if __name__ == "__main__":
+    main()
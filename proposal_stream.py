@@ -0,0 +1,224 @@
+"""
+UniTrack Streaming Proposal Writer
+Writes a .docx whose document.xml is streamed into the zip node by node
+
+Usage:
+    python proposal_stream.py                                   the proposal, streamed
+    python proposal_stream.py --appendix faculty.csv --appendix-title "Appendix A. Faculty Directory"
+    python proposal_stream.py --synthetic-rows 200000 --memory
+
+python-docx keeps the whole body as an lxml tree until save. StreamingDocument
+renders each node through the generate_proposal helpers into a scratch
+document made from the same styled template, writes the new body children to
+the open document.xml zip entry and removes them, so only one node (or one
+batch of table rows) is held at a time. Styles, numbering, image relationships
+and media stay in the scratch document and are written when the document is
+closed, so the output matches a generate_proposal build part for part.
+
+document.xml is streamed to a temporary file rather than straight into the
+zip. [Content_Types].xml and the relationships are only final once every
+image is in, and the package is written in generate_proposal's entry order
+(package_order), so streamed, normal and reproducible saves list their
+parts the same way.
+"""
+
+import argparse
+import csv
+import io
+import re
+import resource
+import shutil
+import tempfile
+import time
+import tracemalloc
+import zipfile
+from itertools import islice
+
+from docx.oxml.ns import qn
+from lxml import etree
+
+import generate_proposal as gp
+import proposal_ir as ir
+from proposal_build import CONTENT_DIR, load_sections
+
+DOCUMENT_PART = 'word/document.xml'
+FLUSH_BYTES = 64 * 1024
+TABLE_BATCH = 500
+
+NS_DECL = re.compile(r' xmlns:(\w+)="([^"]*)"')
+
+def discard(element):
+    """Remove an element from its tree.
+
+    Clearing first matters: lxml reconciles the namespaces of every
+    descendant of a removed element, which for a batch of table rows costs
+    ten times as much as building it.
+    """
+    element.clear()
+    element.getparent().remove(element)
+
+class StreamingDocument:
+    """A .docx opened for writing whose body is streamed; use as a context manager"""
+
+    def __init__(self, target, reproducible=False):
+        self.doc = gp.new_document()
+        self.reproducible = reproducible
+        self.date = gp.reproducible_date() if reproducible else None
+        self.root_ns = dict(self.doc.element.nsmap)
+        self.target = target
+        self.stream = tempfile.TemporaryFile()
+        self.pending = []
+        self.pending_bytes = 0
+        self.drawings = 0
+        self.bytes_written = 0
+
+        # Everything before the final sectPr opens the document; the sectPr closes it
+        xml = etree.tostring(self.doc.element, encoding='UTF-8', standalone=True).decode('utf-8')
+        split = xml.index('<w:sectPr')
+        self.tail = xml[split:]
+        self.emit(xml[:split])
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.stream.close()
+
+    def emit(self, text):
+        self.pending.append(text)
+        self.pending_bytes += len(text)
+        if self.pending_bytes >= FLUSH_BYTES:
+            self.flush()
+
+    def flush(self):
+        data = ''.join(self.pending).encode('utf-8')
+        self.stream.write(data)
+        self.bytes_written += len(data)
+        self.pending = []
+        self.pending_bytes = 0
+
+    def serialize(self, element):
+        """Element markup without the namespace declarations document.xml's root already makes"""
+        xml = etree.tostring(element, encoding='unicode')
+        end = xml.index('>')
+        tag = NS_DECL.sub(lambda m: '' if self.root_ns.get(m.group(1)) == m.group(2) else m.group(0),
+                          xml[:end])
+        return tag + xml[end:]
+
+    def drain(self):
+        """Stream the scratch body's new children and remove them"""
+        body = self.doc.element.body
+        for child in list(body):
+            if child.tag == qn('w:sectPr'):
+                continue
+            # python-docx numbers drawings from what is in the tree, which is now almost nothing
+            for doc_pr in child.iter(qn('wp:docPr')):
+                self.drawings += 1
+                doc_pr.set('id', str(self.drawings))
+                doc_pr.set('name', f"Picture {self.drawings}")
+            self.emit(self.serialize(child))
+            discard(child)
+
+    def write(self, node, figures=None):
+        """Write one proposal IR node"""
+        gp.add_node(self.doc, node, figures)
+        self.drain()
+
+    def write_section(self, section, section_id=None, figures=None):
+        """Write a section from proposal_content/sections, bookmarked when section_id is given"""
+        for node in ir.lower_section(section, section_id):
+            self.write(node, figures)
+        if section_id:
+            gp.add_section_marker(self.doc, section_id, end=True)
+            self.drain()
+
+    def write_table(self, headers, rows, header_color='003366', batch_size=TABLE_BATCH):
+        """Write a create_styled_table table whose rows come from any iterable, batch_size at a time"""
+        rows = iter(rows)
+        body = self.doc.element.body
+        first = True
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch and not first:
+                break
+            gp.create_styled_table(self.doc, headers, batch, header_color)
+            tbl = body.findall(qn('w:tbl'))[-1]
+            if first:
+                # The opening batch carries the table properties, grid and header row
+                xml = self.serialize(tbl)
+                self.emit(xml[:-len('</w:tbl>')])
+                first = False
+            else:
+                # Later batches contribute their data rows: everything after the header row
+                xml = etree.tostring(tbl, encoding='unicode')
+                self.emit(xml[xml.index('</w:tr>') + len('</w:tr>'):-len('</w:tbl>')])
+            discard(tbl)
+        self.emit('</w:tbl>')
+
+    def close(self):
+        """Finish document.xml and write the remaining parts from the scratch document"""
+        self.emit(self.tail)
+        self.flush()
+        buffer = io.BytesIO()
+        gp.save_document(self.doc, buffer, self.reproducible)
+        parts = gp.read_package(buffer)
+        with self.stream, zipfile.ZipFile(self.target, 'w') as package:
+            for name in gp.package_order(parts):
+                if name == DOCUMENT_PART:
+                    self.stream.seek(0)
+                    with package.open(gp.zip_entry(name, self.date), 'w', force_zip64=True) as entry:
+                        shutil.copyfileobj(self.stream, entry, FLUSH_BYTES)
+                else:
+                    package.writestr(gp.zip_entry(name, self.date), parts[name])
+
+def csv_rows(path):
+    """(headers, row iterator) of a CSV file, read lazily"""
+    f = open(path, newline='', encoding='utf-8')
+    reader = csv.reader(f)
+    headers = next(reader)
+
+    def rows():
+        with f:
+            yield from reader
+    return headers, rows()
+
+def synthetic_rows(count):
+    """Appendix-like rows for memory tests"""
+    statuses = ('Available', 'In Class', 'In Meeting', 'On Leave', 'Offline')
+    for i in range(count):
+        yield (f"Faculty {i + 1:06d}", f"Department {i % 37 + 1}", statuses[i % len(statuses)],
+               f"Building {i % 12 + 1}, Room {i % 240 + 100}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Stream the UniTrack proposal, with optional large appendices")
+    parser.add_argument("--output", default='UniTrack_Project_Proposal_Streamed.docx')
+    parser.add_argument("--content", default=CONTENT_DIR, help="proposal content directory")
+    parser.add_argument("--appendix", help="CSV file streamed as an appendix table")
+    parser.add_argument("--appendix-title", default="Appendix A. Data")
+    parser.add_argument("--synthetic-rows", type=int, help="append a synthetic table of this many rows")
+    parser.add_argument("--reproducible", action="store_true", help="fixed dates, as generate_proposal")
+    parser.add_argument("--memory", action="store_true", help="report tracemalloc peak and max RSS")
+    args = parser.parse_args()
+
+    if args.memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    with StreamingDocument(args.output, args.reproducible) as out:
+        for section_id, section in load_sections(args.content):
+            out.write_section(section, section_id)
+        if args.appendix or args.synthetic_rows:
+            out.write(ir.PageBreak())
+            out.write(ir.Heading(1, args.appendix_title))
+        if args.appendix:
+            out.write_table(*csv_rows(args.appendix))
+        if args.synthetic_rows:
+            out.write_table(('Name', 'Department', 'Status', 'Location'), synthetic_rows(args.synthetic_rows))
+    print(f"Created: {args.output} ({out.bytes_written / 1024 / 1024:.1f} MB document.xml, "
+          f"{time.perf_counter() - start:.2f}s)")
+    if args.memory:
+        peak = tracemalloc.get_traced_memory()[1]
+        print(f"tracemalloc peak {peak / 1024 / 1024:.1f} MB, "
+              f"max RSS {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.1f} MB")
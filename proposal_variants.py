@@ -0,0 +1,135 @@
+"""
+UniTrack Proposal Variants
+Builds tailored per-campus or per-department proposals from a variant manifest in one batch
+
+Usage:
+    python proposal_variants.py                              uses proposal_content/variants.json
+    python proposal_variants.py my_variants.json --workers 4
+
+Manifest format:
+    {"output_dir": "proposal_variants",
+     "variants": [{"name": "isulan",
+                   "output": "optional/path.docx",
+                   "replace": {"text in the base content": "variant text"},
+                   "sections": {"cost_analysis": "isulan/cost_analysis.json"},
+                   "omit": ["kiosk_expansion"]}]}
+
+Section override files are relative to the manifest. The styled template and
+the prepared figure images are built once in the parent and handed to every
+worker process at start-up, so each variant only pays for its own sections.
+"""
+
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import generate_proposal as gp
+import proposal_ir as ir
+from proposal_build import CONTENT_DIR, load_sections
+
+VARIANTS_FILE = os.path.join(CONTENT_DIR, 'variants.json')
+OUTPUT_DIR = 'proposal_variants'
+
+def substitute(value, replacements):
+    """Apply text replacements to every string in a section"""
+    if isinstance(value, str):
+        for old, new in replacements.items():
+            value = value.replace(old, new)
+        return value
+    if isinstance(value, list):
+        return [substitute(item, replacements) for item in value]
+    if isinstance(value, dict):
+        return {key: substitute(item, replacements) for key, item in value.items()}
+    return value
+
+def variant_sections(base_sections, variant, manifest_dir):
+    """The (id, section) list for one variant"""
+    known = {sid for sid, _ in base_sections}
+    overrides = variant.get('sections', {})
+    omit = set(variant.get('omit', []))
+    unknown = (set(overrides) | omit) - known
+    if unknown:
+        raise ValueError(f"variant {variant['name']!r} names unknown sections: {sorted(unknown)}")
+
+    replacements = variant.get('replace', {})
+    sections = []
+    for sid, section in base_sections:
+        if sid in omit:
+            continue
+        if sid in overrides:
+            with open(os.path.join(manifest_dir, overrides[sid]), encoding='utf-8') as f:
+                section = json.load(f)
+        sections.append((sid, substitute(section, replacements) if replacements else section))
+    return sections
+
+def prepare_shared(jobs):
+    """Build the template and prepare every figure image the batch uses, once"""
+    seen = set()
+    for _, sections, _, _ in jobs:
+        for _, section in sections:
+            for block in section['blocks']:
+                if block['type'] == 'figure' and block['image'] not in seen:
+                    seen.add(block['image'])
+                    with open(block['image'], 'rb') as f:
+                        gp.prepare_image(f.read(), block.get('width', ir.FIGURE_WIDTH))
+    return gp.shared_state()
+
+def build_variant(name, sections, output_path, reproducible=False):
+    """Build one variant document; returns (name, path, seconds, bytes)"""
+    start = time.perf_counter()
+    doc = gp.new_document()
+    for section_id, section in sections:
+        gp.build_section(doc, section, section_id=section_id)
+    gp.save_document(doc, output_path, reproducible)
+    return name, output_path, time.perf_counter() - start, os.path.getsize(output_path)
+
+def build_variants(manifest_path=VARIANTS_FILE, workers=None, content_dir=CONTENT_DIR, reproducible=False):
+    """Build every variant in the manifest and print a per-variant summary"""
+    start = time.perf_counter()
+    with open(manifest_path, encoding='utf-8') as f:
+        manifest = json.load(f)
+    manifest_dir = os.path.dirname(manifest_path)
+    output_dir = manifest.get('output_dir', OUTPUT_DIR)
+
+    base_sections = load_sections(content_dir)
+    jobs = []
+    for variant in manifest['variants']:
+        output = variant.get('output') or os.path.join(
+            output_dir, f"UniTrack_Project_Proposal_{variant['name']}.docx")
+        os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+        jobs.append((variant['name'], variant_sections(base_sections, variant, manifest_dir), output,
+                     reproducible))
+
+    shared = prepare_shared(jobs)
+    shared_seconds = time.perf_counter() - start
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(jobs) == 1:
+        results = [build_variant(*job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=gp.load_shared_state,
+                                 initargs=(shared,)) as pool:
+            futures = [pool.submit(build_variant, *job) for job in jobs]
+            results = [future.result() for future in futures]
+    total = time.perf_counter() - start
+
+    width = max(len(name) for name, _, _, _ in results)
+    for name, path, seconds, size in results:
+        print(f"{name:<{width}}  {seconds * 1000:7.0f} ms  {size / 1024:7.1f} KB  {path}")
+    print(f"{len(results)} variants in {total:.2f}s "
+          f"(shared template and images: {shared_seconds * 1000:.0f} ms)")
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build UniTrack proposal variants from a manifest")
+    parser.add_argument("manifest", nargs="?", default=VARIANTS_FILE)
+    parser.add_argument("--content", default=CONTENT_DIR, help="base proposal content directory")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="worker processes (0 = one per CPU, 1 = build in this process)")
+    parser.add_argument("--reproducible", action="store_true",
+                        help="byte-identical output for identical inputs")
+    args = parser.parse_args()
+    build_variants(args.manifest, workers=args.workers or None, content_dir=args.content,
+                   reproducible=args.reproducible)
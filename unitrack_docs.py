@@ -0,0 +1,171 @@
+"""
+UniTrack Docs
+One entry point for the mockup and proposal generators
+
+Usage:
+    python unitrack_docs.py mockups [--quality print] [--bench]
+    python unitrack_docs.py proposal [--force] [--reproducible]
+    python unitrack_docs.py all                  out-of-date mockups, proposal, HTML page, launch images
+    python unitrack_docs.py bench [--scale 1,4]  proposal benchmarks (proposal_bench options)
+    python unitrack_docs.py bench --startup      import time of each command
+
+Only the standard library and proposal_build are imported up front. Pillow,
+python-docx and lxml are imported by the subcommand that needs them, so --help
+and up-to-date builds start in a few tens of milliseconds.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from proposal_build import CONTENT_DIR, DEFAULT_OUTPUT
+
+# create_mockups.QUALITY_PRESETS and THEMES, spelled out so --help does not import Pillow
+QUALITIES = ('draft', 'standard', 'print')
+THEMES = ('light', 'dark')
+
+# Commands timed by bench --startup, and the modules they should not import
+STARTUP_COMMANDS = (('--help',), ('proposal', '--help'), ('proposal',), ('all',))
+HEAVY_MODULES = ('PIL', 'docx', 'lxml', 'numpy')
+
+# Inputs and caches copied to the scratch directory bench --startup runs in, so
+# the builds it times never write to the working tree
+STARTUP_FILES = (CONTENT_DIR, 'mockups', 'web', 'website', '.proposal_cache',
+                 DEFAULT_OUTPUT, DEFAULT_OUTPUT + '.build.json')
+
+def run_mockups(args):
+    import create_mockups
+    if args.bench:
+        create_mockups.benchmark_quality(scale=args.scale)
+    else:
+        create_mockups.create_all_mockups(quality=args.quality, scale=args.scale, theme=args.theme)
+
+def run_proposal(args):
+    from proposal_build import build
+    start = time.perf_counter()
+    written = build(args.output, args.content, workers=args.workers or None, force=args.force,
+                    render_mockups=args.render_mockups, reproducible=args.reproducible)
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"Rebuilt in {elapsed:.0f} ms" if written else f"Up to date: {args.output} ({elapsed:.1f} ms)")
+
+def run_all(args):
+    import build_graph
+    start = time.perf_counter()
+    nodes = build_graph.proposal_graph(args.content, args.output, args.reproducible, args.quality)
+    built, fresh = build_graph.build(nodes, workers=args.workers or None, force=args.force)
+    print(f"{len(built)} built, {len(fresh)} up to date in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+def import_profile(command, cwd=None):
+    """Run one command under -X importtime: (wall seconds, {module: (self us, cumulative us, depth)})"""
+    import subprocess
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, '-X', 'importtime', os.path.abspath(__file__), *command],
+                            capture_output=True, text=True, cwd=cwd)
+    wall = time.perf_counter() - start
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        modules[name.strip()] = (int(self_us), int(cumulative_us), (len(name) - len(name.lstrip())) // 2)
+    return wall, modules
+
+def startup_scratch():
+    """A temporary copy of the build inputs and caches; the caller removes it"""
+    import shutil
+    import tempfile
+    scratch = tempfile.mkdtemp(prefix='unitrack_startup_')
+    for path in STARTUP_FILES:
+        if os.path.isdir(path):
+            shutil.copytree(path, os.path.join(scratch, path))
+        elif os.path.exists(path):
+            shutil.copy2(path, os.path.join(scratch, path))
+    return scratch
+
+def run_startup_bench(args):
+    """Report wall time, total import time and the slowest top-level imports per command.
+
+    Commands run in a scratch copy of the inputs, once untimed first, so the
+    build commands time their up-to-date path.
+    """
+    import shutil
+    scratch = startup_scratch()
+    try:
+        for command in STARTUP_COMMANDS:
+            import_profile(command, scratch)
+            report_startup(command, [import_profile(command, scratch) for _ in range(args.repeat)], args.top)
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+def report_startup(command, runs, top):
+    """Print one command's best wall time, its import time and its slowest top-level imports"""
+    walls = [wall for wall, _ in runs]
+    modules = min((modules for _, modules in runs), key=lambda m: sum(entry[0] for entry in m.values()))
+    total_ms = sum(entry[0] for entry in modules.values()) / 1000
+    heavy = sorted({name.split('.')[0] for name in modules} & set(HEAVY_MODULES))
+    print(f"\nunitrack_docs.py {' '.join(command)}: {min(walls) * 1000:.0f} ms wall, "
+          f"{total_ms:.1f} ms importing {len(modules)} modules"
+          + (f", heavy: {', '.join(heavy)}" if heavy else ""))
+    slowest = sorted(((cumulative, name) for name, (_, cumulative, depth) in modules.items() if depth <= 1),
+                     reverse=True)[:top]
+    for cumulative, name in slowest:
+        print(f"   {cumulative / 1000:8.2f} ms  {name}")
+
+def run_bench(args, rest):
+    if args.startup:
+        run_startup_bench(args)
+        return
+    import runpy
+    sys.argv = ['proposal_bench.py', *rest]
+    runpy.run_module('proposal_bench', run_name='__main__')
+
+def add_proposal_arguments(parser):
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    parser.add_argument("--content", default=CONTENT_DIR, help="proposal content directory")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="build sections in N worker processes (0 = one per CPU)")
+    parser.add_argument("--force", action="store_true", help="rebuild even if nothing changed")
+    parser.add_argument("--reproducible", action="store_true",
+                        help="byte-identical output for identical inputs")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="unitrack_docs.py",
+                                     description="Build the UniTrack mockups, proposal and proposal page")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    mockups = commands.add_parser("mockups", help="render the UI mockups to mockups/")
+    mockups.add_argument("--quality", choices=QUALITIES, default="draft",
+                         help="anti-aliasing quality (supersampling of curves and diagonals)")
+    mockups.add_argument("--scale", type=int, default=1, help="output scale factor")
+    mockups.add_argument("--theme", choices=THEMES, default="light")
+    mockups.add_argument("--bench", action="store_true", help="report render time per screen and quality")
+
+    proposal = commands.add_parser("proposal", help="incrementally build the proposal .docx")
+    add_proposal_arguments(proposal)
+    proposal.add_argument("--render-mockups", nargs="?", const="draft", choices=QUALITIES,
+                          help="render the figure mockups in memory at this quality instead of reading mockups/")
+
+    everything = commands.add_parser("all", help="every out-of-date artifact, through build_graph.py")
+    add_proposal_arguments(everything)
+    everything.set_defaults(workers=0)
+    everything.add_argument("--quality", choices=QUALITIES, default="draft", help="mockup quality")
+
+    bench = commands.add_parser("bench", help="proposal benchmarks; other options go to proposal_bench.py")
+    bench.add_argument("--startup", action="store_true", help="time each command under -X importtime")
+    bench.add_argument("--repeat", type=int, default=3, help="runs per command for --startup (best is kept)")
+    bench.add_argument("--top", type=int, default=5, help="slowest top-level imports shown per command")
+
+    args, rest = parser.parse_known_args()
+    if args.command == "bench":
+        if not args.startup:
+            rest = ["--repeat", str(args.repeat), *rest]
+        run_bench(args, rest)
+    elif rest:
+        parser.error(f"unrecognized arguments: {' '.join(rest)}")
+    elif args.command == "mockups":
+        run_mockups(args)
+    elif args.command == "proposal":
+        run_proposal(args)
+    else:
+        run_all(args)